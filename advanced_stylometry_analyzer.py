@@ -4,9 +4,9 @@
 # differential stylometric analysis.
 
 import sys
-import re
 import math
-from collections import Counter
+
+from lta_fingerprint import FingerprintState
 
 # --- Configuration ---
 INTRO_KEYWORDS = [
@@ -17,42 +17,19 @@ BODY_START_KEYWORDS = [
     'book i', 'chapter i', 'part i', 'part one', 'canto i'
 ]
 
-# --- Core Analysis Functions (from the original detector) ---
-
-def get_alpha_weights():
-    return {chr(ord('a') + i): i + 1 for i in range(26)}
-
-ALPHA_WEIGHTS = get_alpha_weights()
-
-def get_word_weight(word, weight_map):
-    return sum(weight_map.get(char, 0) for char in word.lower())
-
 def generate_fingerprint(text_chunk, name):
     """Computes the statistical fingerprint for a given chunk of text."""
-    words = re.findall(r'\b[a-zA-Z]+\b', text_chunk.lower())
-    if not words:
-        return None
-
-    number_stream = [get_word_weight(word, ALPHA_WEIGHTS) for word in words]
-    n = len(number_stream)
-    if n < 2: return None # Need at least 2 words to calculate variance
-
-    mean = sum(number_stream) / n
-    variance = sum((x - mean) ** 2 for x in number_stream) / n
-    std_dev = math.sqrt(variance)
-    
-    sorted_stream = sorted(number_stream)
-    mid = n // 2
-    median = (sorted_stream[mid - 1] + sorted_stream[mid]) / 2 if n % 2 == 0 else sorted_stream[mid]
-    
-    skew = (mean - median) / std_dev if std_dev > 0 else 0
+    state = FingerprintState()
+    state.add_text(text_chunk.lower())
+    if state.words < 2: return None # Need at least 2 words to calculate variance
 
+    fp = state.fingerprint()
     return {
         "Name": name,
-        "Mean Word Weight": mean,
-        "Std Deviation": std_dev,
-        "Median Word Weight": median,
-        "Style Skewness": skew
+        "Mean Word Weight": fp["Mean Word Weight"],
+        "Std Deviation": fp["Style Volatility (SD)"],
+        "Median Word Weight": fp["Median Word Weight"],
+        "Style Skewness": fp["Style Skewness"]
     }
 
 def print_fingerprint(fp):
@@ -1,37 +1,12 @@
+from lta_oracle import english_oracle
 
-def num_to_english(n):
-    ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten",
-            "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
-    tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
-    
-    if n == 0: return "zero"
-    
-    base_str = ""
-    if n >= 1000:
-        k = n // 1000
-        rem = n % 1000
-        base_str += num_to_english(k) + "thousand"
-        if rem > 0: base_str += num_to_english(rem)
-        return base_str
-        
-    if n >= 100:
-        h = n // 100
-        rem = n % 100
-        base_str += ones[h] + "hundred"
-        if rem > 0: base_str += num_to_english(rem)
-        return base_str
-        
-    if n < 20: return ones[n]
-    if n < 100: return tens[n // 10] + ones[n % 10]
-    
-    return ""
+oracle = english_oracle()
 
 def get_len(n):
-    name = num_to_english(n)
-    return len(name.replace(" ", "").replace("-", ""))
+    return oracle.length(n)
 
 def get_next(n):
-    return n + get_len(n)
+    return oracle.next(n)
 
 # 1. Generate Main Trunk up to 2030
 trunk = [0]
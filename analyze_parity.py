@@ -1,45 +1,10 @@
-def num_to_english(n):
-    ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten",
-            "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
-    tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
-    
-    if n < 20: return ones[n]
-    if n < 100: return tens[n // 10] + ones[n % 10]
-    if n < 1000:
-        base = ones[n // 100] + "hundred"
-        rem = n % 100
-        if rem == 0: return base
-        if rem < 20: return base + ones[rem]
-        return base + tens[rem // 10] + ones[rem % 10]
-    
-    # Handle larger numbers simply for the sake of the loop
-    # We will just append "thousand" etc. approximations if needed, 
-    # but let's stick to < 100000 logic for the trace
-    if n < 1000000:
-        k = n // 1000
-        rem = n % 1000
-        base = num_to_english(k) + "thousand"
-        if rem == 0: return base
-        return base + num_to_english(rem)
-        
-    return ""
+from lta_oracle import english_oracle
 
-def get_next(n):
-    if n == 0: return 4
-    name = num_to_english(n)
-    length = len(name.replace(" ", "").replace("-", ""))
-    return n + length
+oracle = english_oracle()
 
 def analyze_stream_parity(start_num, steps=100):
-    sequence = []
-    parity_seq = []
-    curr = start_num
-    
-    for _ in range(steps):
-        sequence.append(curr)
-        parity_seq.append(curr % 2) # 0 for Even, 1 for Odd
-        curr = get_next(curr)
-        
+    sequence = oracle.path(start_num, steps)
+    parity_seq = [n % 2 for n in sequence] # 0 for Even, 1 for Odd
     return sequence, parity_seq
 
 # Analyze Main Trunk
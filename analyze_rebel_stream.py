@@ -1,35 +1,13 @@
-def num_to_english(n):
-    ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten", 
-            "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
-    tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
-    
-    if n == 0: return "zero"
-    
-    parts = []
-    
-    if n >= 1000000:
-        parts.append(num_to_english(n // 1000000) + "million")
-        n %= 1000000
-        
-    if n >= 1000:
-        parts.append(num_to_english(n // 1000) + "thousand")
-        n %= 1000
-        
-    if n >= 100:
-        parts.append(ones[n // 100] + "hundred")
-        n %= 100
-        
-    if n >= 20:
-        parts.append(tens[n // 10])
-        n %= 10
-        
-    if n > 0:
-        parts.append(ones[n])
-        
-    return "".join(parts)
+from lta_engine import find_merge
+from lta_oracle import english_oracle
+
+oracle = english_oracle()
+
+def get_length(n):
+    return oracle.length(n)
 
 def get_next(n):
-    return n + len(num_to_english(n))
+    return oracle.next(n)
 
 def get_trajectory(start, steps):
     traj = [start]
@@ -39,43 +17,31 @@ def get_trajectory(start, steps):
         traj.append(curr)
     return traj
 
-# Main trunk starting from 0
-main_trunk = set()
-curr = 0
-for _ in range(1000):
-    main_trunk.add(curr)
-    curr = get_next(curr)
+# Every path strictly increases, so merges are found by walking two seeds
+# in lock-step (lta_engine.find_merge) instead of storing either trunk.
+# Main trunk starting from 0: 1000 nodes
+TRUNK_STEPS = 999
 
 print("Analyzing trajectory of 83:")
-curr = 83
-path = []
-for i in range(2000):
-    if curr in main_trunk:
-        print(f"83 merged into main trunk at {curr} after {i} steps.")
-        break
-    path.append(curr)
-    curr = get_next(curr)
+merge = find_merge(get_length, 0, 83, TRUNK_STEPS, 1999)
+if merge["merged"]:
+    print(f"83 merged into main trunk at {merge['merge_point']} after {merge['steps_b']} steps.")
 else:
     print("83 did not merge within 2000 steps.")
 
+# Seeds 1-100 that stay off the main trunk (the original script used
+# rebel_seeds without defining it and stopped here with a NameError)
+rebel_seeds = [seed for seed in range(1, 101)
+               if not find_merge(get_length, 0, seed, TRUNK_STEPS, 1999)["merged"]]
+
 if rebel_seeds:
     print(f"\nRebel Seeds found: {rebel_seeds}")
     # Let's see if the rebels merge with each other
     seed0 = rebel_seeds[0]
-    rebel_trunk = set()
-    curr = seed0
-    for _ in range(2000):
-        rebel_trunk.add(curr)
-        curr = get_next(curr)
     
     for seed in rebel_seeds[1:]:
-        curr = seed
-        merged = False
-        for _ in range(100):
-            if curr in rebel_trunk:
-                merged = True
-                break
-            curr = get_next(curr)
+        # Rebel trunk: 2000 nodes, seed: 100 nodes
+        merged = find_merge(get_length, seed0, seed, 1999, 99)["merged"]
         if merged:
             print(f"Seed {seed} merges into Rebel Trunk (starting {seed0})")
         else:
@@ -83,24 +49,10 @@ if rebel_seeds:
 
     # Check for eventual merge between Main and Rebel
     print("\nChecking for long-term merge between Main Trunk and Rebel Trunk...")
-    main_list = sorted(list(main_trunk))
-    rebel_list = sorted(list(rebel_trunk))
-    
-    # Extend both
-    m_curr = max(main_list)
-    r_curr = max(rebel_list)
-    
-    main_set = main_trunk.copy()
-    rebel_set = rebel_trunk.copy()
-    
-    for _ in range(5000):
-        m_curr = get_next(m_curr)
-        main_set.add(m_curr)
-        r_curr = get_next(r_curr)
-        rebel_set.add(r_curr)
-        
-    intersection = main_set.intersection(rebel_set)
-    if intersection:
-        print(f"MERGE DETECTED at {min(intersection)}")
+    # Both extended by 5000 steps; the first common node is the merge point
+    merge = find_merge(get_length, 0, seed0, TRUNK_STEPS + 5000, 1999 + 5000)
+    if merge["merged"]:
+        print(f"MERGE DETECTED at {merge['merge_point']} "
+              f"(main trunk step {merge['steps_a']}, rebel step {merge['steps_b']})")
     else:
         print("No merge detected after 6000+ total steps.")
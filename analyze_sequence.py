@@ -1,21 +1,6 @@
+from lta_oracle import english_oracle
 
-def num_to_english(n):
-    # Basic implementation for 0-1000 to map the sequence
-    ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten", 
-            "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
-    tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
-    
-    if n < 20:
-        return ones[n]
-    if n < 100:
-        return tens[n // 10] + ones[n % 10]
-    if n < 1000:
-        return ones[n // 100] + "hundred" + (tens[(n % 100) // 10] + ones[n % 10] if n % 100 != 0 else "")
-    return ""
-
-def count_letters(word):
-    # remove hyphens or spaces if any (though our function above generates simple concatenated strings)
-    return len(word.replace(" ", "").replace("-", ""))
+oracle = english_oracle()
 
 def get_sequence_path(start_num, limit=200):
     path = [start_num]
@@ -24,15 +9,7 @@ def get_sequence_path(start_num, limit=200):
     # We stop if we hit a number clearly beyond our interest or if it gets too large
     # For this check, we want to see if they hit 21.
     while current < limit:
-        word = num_to_english(current)
-        if not word and current != 0: break # Safety for out of bounds of our simple function
-        
-        # specific fix for 0 since our array had empty string for index 0 for math logic
-        if current == 0: 
-            length = 4 # "zero"
-        else:
-            length = count_letters(word)
-            
+        length = oracle.length(current)
         next_val = current + length
         path.append(next_val)
         current = next_val
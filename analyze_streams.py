@@ -1,29 +1,6 @@
+from lta_oracle import english_oracle
 
-def num_to_english(n):
-    ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten", 
-            "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
-    tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
-    
-    if n < 20:
-        return ones[n]
-    if n < 100:
-        return tens[n // 10] + ones[n % 10]
-    if n < 1000:
-        base = ones[n // 100] + "hundred"
-        remainder = n % 100
-        if remainder == 0:
-            return base
-        elif remainder < 20:
-            return base + ones[remainder]
-        else:
-            return base + tens[remainder // 10] + ones[remainder % 10]
-    return ""
-
-def get_next(n):
-    if n == 0: return 4 # "zero"
-    word = num_to_english(n)
-    length = len(word)
-    return n + length
+oracle = english_oracle()
 
 # 1. Generate the "Main Trunk" starting from 0
 main_trunk = []
@@ -31,7 +8,7 @@ current = 0
 while current < 300:
     if current not in main_trunk:
         main_trunk.append(current)
-    current = get_next(current)
+    current = oracle.next(current)
 
 # 2. Analyze 0-100
 streams = dict() # Key: Merge Point, Value: List of starting numbers
@@ -48,7 +25,7 @@ for start_num in range(101):
                 streams[entry_point] = []
             streams[entry_point].append(start_num)
             break
-        curr = get_next(curr)
+        curr = oracle.next(curr)
 
 # 3. Format Output for the User
 print("CLASSIFICATION OF INTEGERS 0-100 BY MAIN TRUNK ENTRY POINT")
@@ -7,33 +7,22 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 try:
     from linguistic_topology_app import parse_lang_file
+    from lta_cache import TrajectoryCache, load_or_compute_paths
+    from lta_engine import SimulationConfig
 except ImportError:
     print("Error: Could not import linguistic_topology_app.py")
     sys.exit(1)
 
-def get_main_trunk(lang_data, limit_val=5000, max_steps=500):
+def get_main_trunk(lang_data, limit_val=5000, max_steps=500, cache=None, config=None):
     """
     Finds the 'Main Trunk' of the language by simulating paths from 1-100
     and picking the path that collects the most merges.
     Returns the path as a list of integers.
     """
-    paths = {}
-    
-    # Simulate all tributaries from 1-100
-    for start_num in range(1, 101):
-        path = []
-        curr = start_num
-        step = 0
-        while curr < limit_val and step < max_steps:
-            path.append(curr)
-            try:
-                length = lang_data["get_len_func"](curr, lang_data["rules"])
-                if length == 0: break
-                curr += length
-                step += 1
-            except Exception:
-                break
-        paths[start_num] = path
+    config = config or SimulationConfig(seed_start=1, seed_stop=101, value_limit=limit_val, max_steps=max_steps)
+
+    # Simulate all tributaries (reused from the cache if unchanged)
+    paths = load_or_compute_paths(cache, lang_data, "waveform", config)
 
     # Find the dominant tail (Trunk)
     # We look at the last number in each path.
@@ -83,13 +72,14 @@ def main():
 
     # Store results: name -> trunk_path
     trunks = {}
+    cache = TrajectoryCache()
     
     for lang_file in lang_files:
         try:
             lang_data = parse_lang_file(lang_file)
             name = lang_data['name']
             
-            trunk = get_main_trunk(lang_data)
+            trunk = get_main_trunk(lang_data, cache=cache)
             if trunk:
                 trunks[name] = trunk
             
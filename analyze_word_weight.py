@@ -1,13 +1,14 @@
 import sys
-import re
+
+import numpy as np
+
+from lta_weights import WeightTable, ALPHA_WEIGHTS, ALPHA_WORDS, code_points
+
+# a=1, b=2 ... in either case
+LETTER_TABLE = WeightTable(ALPHA_WEIGHTS, fold_case=True)
 
 def get_word_weight(word):
-    weight = 0
-    for char in word.lower():
-        if 'a' <= char <= 'z':
-            # ord('a') is 97, so ord(c) - 96 gives a=1, b=2...
-            weight += ord(char) - 96
-    return weight
+    return LETTER_TABLE.word_weight(word.lower())
 
 def analyze_file(filepath):
     try:
@@ -18,21 +19,23 @@ def analyze_file(filepath):
         return
 
     # Split into words (remove punctuation)
-    words = re.findall(r'\b[a-zA-Z]+\b', text)
+    codes = code_points(text)
+    starts, ends = ALPHA_WORDS.spans(codes)
     
-    if not words:
+    if not len(starts):
         print("No words found.")
         return
 
-    weights = [get_word_weight(w) for w in words]
+    weights = LETTER_TABLE.weigh(codes, starts, ends)
     
     # Calculate Stats
-    avg_weight = sum(weights) / len(weights)
-    max_weight = max(weights)
-    heaviest_word = words[weights.index(max_weight)]
+    avg_weight = float(weights.mean())
+    heaviest = int(np.argmax(weights))
+    max_weight = int(weights[heaviest])
+    heaviest_word = text[starts[heaviest]:ends[heaviest]]
     
     print(f"\n--- WEIGHT ANALYSIS: {filepath} ---")
-    print(f"Total Words Scanned: {len(words)}")
+    print(f"Total Words Scanned: {len(weights)}")
     print(f"Average Word Weight: {avg_weight:.2f}")
     print(f"Heaviest Word:       '{heaviest_word}' (Score: {max_weight})")
     
@@ -42,7 +45,7 @@ def analyze_file(filepath):
     # Simple ASCII Graph for first 50 words
     limit = 50
     graph_height = 15
-    sample = weights[:limit]
+    sample = weights[:limit].tolist()
     max_sample = max(sample) if sample else 1
     
     # Normalize to graph height
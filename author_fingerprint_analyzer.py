@@ -5,9 +5,9 @@ import os
 # proposed by Erik Mize to test for authorship signals across translations.
 
 import sys
-import re
-import math
-from collections import Counter
+
+from lta_weights import WeightTable
+from lta_fingerprint import ALPHA_TABLE, fingerprint_file
 
 # --- 1. Weighting System ---
 
@@ -19,51 +19,32 @@ ALPHA_WEIGHTS = get_alpha_weights()
 
 def get_word_weight(word, weight_map):
     """Calculates the total alphabetical weight of a word."""
-    return sum(weight_map.get(char, 0) for char in word.lower())
+    table = ALPHA_TABLE if weight_map is ALPHA_WEIGHTS else WeightTable(weight_map)
+    return table.word_weight(word.lower())
 
 # --- 2. Fingerprint Generation ---
 
-def generate_fingerprint(filepath):
-    """Reads a text file and computes its statistical fingerprint with extreme precision."""
+def generate_fingerprint(filepath, workers=1):
+    """
+    Reads a text file and computes its statistical fingerprint with extreme precision.
+    Word weights, sentence friction and vocabulary all come from one pass
+    (lta_fingerprint); with workers > 1 the file is split across processes
+    and the partial states are merged exactly.
+    """
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            text = f.read()
+        state = fingerprint_file(filepath, workers)
     except FileNotFoundError:
         return None
+    if not state.words: return None
 
-    # 1. Word Analysis
-    words = re.findall(r'\b[a-zA-Z]+\b', text)
-    if not words: return None
-    
-    number_stream = [get_word_weight(word, ALPHA_WEIGHTS) for word in words]
-    n = len(number_stream)
-    
-    mean = sum(number_stream) / n
-    variance = sum((x - mean) ** 2 for x in number_stream) / n
-    std_dev = math.sqrt(variance)
-    
-    # 2. Syntactic Friction (Sentence Length Variance)
-    sentences = re.split(r'[.!?]+', text)
-    sent_lengths = [len(s.split()) for s in sentences if len(s.split()) > 3]
-    if sent_lengths:
-        avg_sent = sum(sent_lengths) / len(sent_lengths)
-        sent_friction = math.sqrt(sum((x - avg_sent) ** 2 for x in sent_lengths) / len(sent_lengths))
-    else:
-        avg_sent, sent_friction = 0, 0
-
-    # 3. Zipf Distribution (Vocabulary Richness)
-    counts = Counter(words).most_common(100)
-    # Simple Zipf proxy: correlation of frequency to rank
-    # (Simplified for fingerprint)
-    zipf_coeff = sum(1/i for i in range(1, len(counts)+1)) / len(counts) if counts else 0
-
+    fp = state.fingerprint()
     fingerprint = {
         "File": filepath,
-        "Mean Word Weight": mean,
-        "Style Volatility (SD)": std_dev,
-        "Syntactic Friction": sent_friction,
-        "Avg Sentence Length": avg_sent,
-        "Vocabulary Density": zipf_coeff
+        "Mean Word Weight": fp["Mean Word Weight"],
+        "Style Volatility (SD)": fp["Style Volatility (SD)"],
+        "Syntactic Friction": fp["Syntactic Friction"],
+        "Avg Sentence Length": fp["Avg Sentence Length"],
+        "Vocabulary Density": fp["Vocabulary Density"]
     }
     
     return fingerprint
@@ -85,11 +66,18 @@ if __name__ == "__main__":
         print("\nUsage: python author_fingerprint_analyzer.py <file1.txt> [file2.txt] ...")
         print("Description: Analyzes text files to generate a 'Topological Fingerprint' for each.")
         print("This can be used to compare writing styles, even across translations.")
+        print("Options: --workers N  split each file across N processes")
     else:
         import segment_text
+        args = sys.argv[1:]
+        workers = 1
+        if "--workers" in args:
+            i = args.index("--workers")
+            workers = int(args[i + 1])
+            del args[i:i + 2]
         print("Generating authorial fingerprints...")
         
-        for filepath in sys.argv[1:]:
+        for filepath in args:
             print(f"\n[{os.path.basename(filepath)}]")
             
             # Auto-Segment first
@@ -107,13 +95,13 @@ if __name__ == "__main__":
                 for seg_path in segments:
                     # Optional: Clean up name for display
                     seg_name = os.path.basename(seg_path)
-                    fingerprint = generate_fingerprint(seg_path)
+                    fingerprint = generate_fingerprint(seg_path, workers)
                     if fingerprint:
                         print_fingerprint(fingerprint)
             else:
                 # Fallback to original if no distinct segments found
                 print("No distinct bias sections found. Analyzing full text...")
-                fingerprint = generate_fingerprint(filepath)
+                fingerprint = generate_fingerprint(filepath, workers)
                 if fingerprint:
                     print_fingerprint(fingerprint)
                     
@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+import random
+
+# Ensure we can import the tokenizer
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lta_tokenizer import CharTokenizer
+
+# --- CONFIGURATION ---
+LINE_LENGTHS = [1000, 5000, 20000] # Characters per line
+SYMBOL_COUNT = 50 # Non-linguistic symbols
+LINES = 20 # Lines per batch
+
+def legacy_text2tokens(line, symbols, remove_symbols=False):
+    """CharTokenizer.text2tokens before the scanner: try every symbol, then slice off the head."""
+    tokens = []
+    while len(line) != 0:
+        for w in symbols:
+            if line.startswith(w):
+                if not remove_symbols:
+                    tokens.append(line[: len(w)])
+                line = line[len(w) :]
+                break
+        else:
+            t = line[0]
+            if t == " ":
+                line = line[1:]
+                continue
+            tokens.append(t)
+            line = line[1:]
+    return tokens
+
+def make_symbols(count):
+    # No symbol is a prefix of another, so the old first-match loop is deterministic
+    return [f"<tag{i:03d}>" for i in range(count)]
+
+def make_line(rng, length, symbols):
+    parts = []
+    size = 0
+    while size < length:
+        part = rng.choice(symbols) if rng.random() < 0.05 else rng.choice("abcdefghij klmnop qrstuv wxyz.,")
+        parts.append(part)
+        size += len(part)
+    return "".join(parts)
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+def main():
+    rng = random.Random(0)
+    symbols = make_symbols(SYMBOL_COUNT)
+    tokenizer = CharTokenizer(symbols)
+    print(f"{'LINE LENGTH':<12} | {'LEGACY (s)':<12} | {'SCANNER (s)':<12} | {'SPEEDUP':<8}")
+    print("-" * 52)
+
+    for length in LINE_LENGTHS:
+        lines = [make_line(rng, length, symbols) for _ in range(LINES)]
+        new, new_time = timed(lambda: tokenizer.batch_text2tokens(lines))
+        old, old_time = timed(lambda: [legacy_text2tokens(line, symbols) for line in lines])
+        if old != new:
+            print(f"MISMATCH at line length {length}")
+            sys.exit(1)
+        print(f"{length:<12} | {old_time:<12.4f} | {new_time:<12.4f} | {old_time / new_time:.0f}x")
+
+    # Whole-book scale: one long line through the scanner only (the old loop would take hours)
+    book = make_line(rng, 5_000_000, symbols)
+    tokens, book_time = timed(lambda: tokenizer.text2tokens(book))
+    print(f"\nScanner on a {len(book):,}-character line: {book_time:.3f}s ({len(tokens):,} tokens)")
+
+if __name__ == "__main__":
+    main()
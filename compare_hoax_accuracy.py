@@ -1,25 +1,22 @@
-import math
-import re
+from lta_weights import WeightTable, LOWER_WORDS, code_points, weight_stats
 
 # Standard English (A=1, B=2...)
 STD_WEIGHTS = {chr(ord('a') + i): i + 1 for i in range(26)}
+STD_TABLE = WeightTable(STD_WEIGHTS)
 
 def analyze(text, method="std"):
-    words = re.findall(r'[a-z]+', text.lower())
-    weights = []
-    for w in words:
-        if method == "std":
-            weight = sum(STD_WEIGHTS.get(c, 0) for c in w)
-        else: # tech (English)
-            # English Tech is length * 8
-            weight = len(w) * 8
-        if weight > 0: weights.append(weight)
+    codes = code_points(text.lower())
+    starts, ends = LOWER_WORDS.spans(codes)
+    if method == "std":
+        weights = STD_TABLE.weigh(codes, starts, ends)
+    else: # tech (English)
+        # English Tech is length * 8
+        weights = (ends - starts) * 8
+    weights = weights[weights > 0]
         
-    if not weights: return 0, 0
+    if not len(weights): return 0, 0
     
-    mean = sum(weights) / len(weights)
-    variance = sum((x - mean) ** 2 for x in weights) / len(weights)
-    std_dev = math.sqrt(variance)
+    n, mean, std_dev = weight_stats(weights)
     return mean, std_dev
 
 try:
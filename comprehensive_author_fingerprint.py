@@ -3,7 +3,8 @@ import os
 import math
 import csv
 import nltk
-from collections import Counter
+
+from lta_fingerprint import FingerprintState
 
 def parse_lang_file(lang_filepath):
     """Loads letter values from a .lang file."""
@@ -47,19 +48,27 @@ def analyze_text_forensically(text_filepath, lang_filepath):
     with open(text_filepath, 'r', encoding='utf-8') as f:
         text = f.read()
 
-    # 2. Calculate Word Frequencies for Track 2
-    all_words_in_text = [w.lower() for w in nltk.word_tokenize(text) if w.isalpha()]
-    word_counts = Counter(all_words_in_text)
-    # Rank words by frequency (most common = rank 1)
-    word_ranks = {word: i + 1 for i, (word, count) in enumerate(word_counts.most_common())}
-
-    # 3. Define Value Functions
+    # 2. Define Value Functions
     def get_letter_val(char):
         return letter_values.get(char, 0)
 
     def get_word_track1(word):
         return sum(get_letter_val(c) for c in word)
 
+    # 3. One tokenizing pass: word frequencies for Track 2 and the fingerprint
+    state = FingerprintState()
+    word_stream = [] # (word, T1) in text order
+    sentence_lengths = []
+    for sent in nltk.sent_tokenize(text):
+        words = [w for w in nltk.word_tokenize(sent) if w.isalpha()]
+        word_stream.extend((w, get_word_track1(w)) for w in words)
+        sentence_lengths.append(len(words))
+    state.add_words(w.lower() for w, _ in word_stream)
+    state.add_weights([t1 for _, t1 in word_stream])
+    state.add_sentence_lengths(sentence_lengths)
+    # Rank words by frequency (most common = rank 1)
+    word_ranks = {word: i + 1 for i, (word, count) in enumerate(state.vocabulary.most_common())}
+
     def get_word_track2(word, t1_val):
         rank = word_ranks.get(word.lower(), len(word_ranks) + 1)
         # Rarity factor: Multiply by log of rank to amplify rare words
@@ -67,13 +76,9 @@ def analyze_text_forensically(text_filepath, lang_filepath):
 
     # 4. Process Streams (Simplified for this run)
     master_word_stream = []
-    sentences = nltk.sent_tokenize(text)
-    for sent in sentences:
-        words = [w for w in nltk.word_tokenize(sent) if w.isalpha()]
-        for word in words:
-            t1 = get_word_track1(word)
-            t2 = get_word_track2(word, t1)
-            master_word_stream.append({'Word': word, 'T1_Raw': t1, 'T2_Raw': t2})
+    for word, t1 in word_stream:
+        t2 = get_word_track2(word, t1)
+        master_word_stream.append({'Word': word, 'T1_Raw': t1, 'T2_Raw': t2})
     
     # 5. Save Master Word CSV
     base_name = os.path.basename(text_filepath)
@@ -85,6 +90,11 @@ def analyze_text_forensically(text_filepath, lang_filepath):
     
     print(f"Correctly processed {text_filepath}, output to {csv_path}")
 
+    fp = state.fingerprint()
+    print(f"  > Words: {fp['Words']}  Mean T1: {fp['Mean Word Weight']:.4f}  T1 Volatility: {fp['Style Volatility (SD)']:.4f}")
+    print(f"  > Syntactic Friction: {fp['Syntactic Friction']:.4f}  Sentence Avg: {fp['Avg Sentence Length']:.2f}")
+    return state
+
 if __name__ == "__main__":
     if len(sys.argv) < 3:
         print("Usage: python comprehensive_author_fingerprint.py <text_file> <lang_file>")
@@ -5,6 +5,8 @@ import nltk
 from nltk.tokenize import sent_tokenize, word_tokenize
 from collections import Counter
 
+from lta_fingerprint import FingerprintState
+
 # Ensure NLTK data is available
 try:
     nltk.data.find('tokenizers/punkt')
@@ -84,7 +86,7 @@ def analyze_text(file_path):
         chapters = [c for c in chapters if len(c.strip()) > 500]
 
     chapter_data = []
-    total_word_count = 0
+    book = FingerprintState()
     
     for c_idx, chapter_text in enumerate(chapters):
         if not chapter_text.strip():
@@ -100,8 +102,10 @@ def analyze_text(file_path):
             'pos_counts': Counter(),
             'pos_values': Counter(),
             'sentences_per_para': [],
-            'words_per_para': []
+            'words_per_para': [],
+            'fingerprint': FingerprintState()
         }
+        chap_fp = chap_stats['fingerprint']
 
         # Match any kind of double or single quote (straight, curly, or mangled UTF-8)
         conv_pattern = r'["\'\u201c\u201d\u2018\u2019\u00ab\u00bb]|â€[œ\x9d]|â€™'
@@ -126,16 +130,22 @@ def analyze_text(file_path):
                 chap_stats['words'] += len(words)
                 
                 pos_tags = nltk.pos_tag(words)
+                values = []
                 for word, tag in pos_tags:
                     cat = simplify_tag(tag)
                     val = get_word_value(word)
+                    values.append(val)
                     chap_stats['pos_counts'][cat] += 1
                     chap_stats['pos_values'][cat] += val
+                chap_fp.add_weights(values)
+                chap_fp.add_sentence_lengths([len(words)])
+                chap_fp.add_words(w.lower() for w in words)
             
             chap_stats['words_per_para'].append(para_word_count)
 
-        total_word_count += chap_stats['words']
+        book.merge(chap_fp)
         chapter_data.append(chap_stats)
+    total_word_count = book.words
 
     # PAGE APPROXIMATION (500 words per page)
     words_per_page = 500
@@ -181,6 +191,11 @@ def analyze_text(file_path):
         avg = val/count if count else 0
         print(f"  {cat:<8}: Count={count:<6} TotalValue={val:<10} AvgValue={avg:.2f}")
 
+    fp = book.fingerprint()
+    print(f"\nWord Value Fingerprint:")
+    print(f"  Mean Value: {fp['Mean Word Weight']:.2f}  Volatility: {fp['Style Volatility (SD)']:.2f}  Median: {fp['Median Word Weight']:.1f}")
+    print(f"  Distinct Words: {len(book.vocabulary)}  Syntactic Friction: {fp['Syntactic Friction']:.2f}")
+
     print(f"\nPage Averages (approx {words_per_page} words):")
     print(f"  Sentences/Page: {total_s/total_pages:.1f}")
     print(f"  Paragraphs/Page: {total_p/total_pages:.1f}")
@@ -1,4 +1,5 @@
 import sys
+from lta_engine import find_merge
 
 # --- 1. Sumerian Logic (Cuneiform Sign Count) ---
 def get_sumerian_signs(n):
@@ -183,40 +184,18 @@ def run_simulation(name, func, seed_limit=100, step_limit=1000000, unity_thresho
     print(f"Algorithm: n -> n + length_in_native_script(n)")
     print(f"Limits: {step_limit} steps, Stop at {unity_threshold:.0%} Unity")
     
-    paths = {}
-    main_trunk_set = set()
-    
-    # 1. Trace the Main Trunk (Seed 0) first
-    curr = 0
-    main_trunk_set.add(curr)
-    steps = 0
-    while steps < step_limit:
-        l = func(curr)
-        if l == 0 and curr != 0: break 
-        curr += l
-        main_trunk_set.add(curr)
-        steps += 1
-        
-    # 2. Trace other seeds
+    # 1. The Main Trunk (Seed 0) is never stored: every path strictly
+    # increases, so each seed is walked in lock-step with it instead.
     merged_count = 0
     total_seeds = seed_limit + 1 # 0 to 100
     
     # We already know 0 is in main trunk
     merged_count = 1 
     
+    # 2. Trace other seeds (trunk: step_limit steps, seeds: step_limit - 1)
     for seed in range(1, total_seeds):
-        curr = seed
-        steps = 0
-        merged = False
-        while steps < step_limit:
-            if curr in main_trunk_set:
-                merged = True
-                break
-            l = func(curr)
-            curr += l
-            steps += 1
-            
-        if merged:
+        merge = find_merge(func, 0, seed, step_limit, step_limit - 1)
+        if merge["merged"]:
             merged_count += 1
             
     unity = merged_count / total_seeds
@@ -1,6 +1,8 @@
 import sys
-import re
-import math
+
+import numpy as np
+
+from lta_weights import WeightTable, LOWER_WORDS, ARABIC_WORDS, weight_stats
 
 # --- Language Mappings (Alphabet Bitcodes) ---
 
@@ -24,7 +26,7 @@ def get_arabic_weights():
     weights.update(extras)
     return weights
 
-def analyze_document(filepath, weight_map, script_regex, label):
+def analyze_document(filepath, weight_map, script_words, label):
     try:
         with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
             text = f.read().lower()
@@ -32,24 +34,13 @@ def analyze_document(filepath, weight_map, script_regex, label):
         print(f"Error: {filepath} not found.")
         return None
 
-    words = re.findall(script_regex, text)
-    if not words: return None
-
-    word_weights = []
-    for word in words:
-        weight = sum(weight_map.get(c, 0) for c in word)
-        if weight > 0:
-            word_weights.append(weight)
+    word_weights = WeightTable(weight_map).word_weights(text, script_words)
+    word_weights = word_weights[word_weights > 0]
 
-    if not word_weights: return None
+    if not len(word_weights): return None
 
-    n = len(word_weights)
-    mean = sum(word_weights) / n
-    variance = sum((x - mean) ** 2 for x in word_weights) / n
-    std_dev = math.sqrt(variance)
-    sorted_w = sorted(word_weights)
-    mid = n // 2
-    median = (sorted_w[mid-1] + sorted_w[mid]) / 2 if n % 2 == 0 else sorted_w[mid]
+    n, mean, std_dev = weight_stats(word_weights)
+    median = float(np.median(word_weights))
     skew = (mean - median) / std_dev if std_dev > 0 else 0
 
     print(f"\n--- {label} (Bitcode Analysis) ---")
@@ -67,6 +58,6 @@ if __name__ == "__main__":
     file = sys.argv[2]
     
     if lang == "eng":
-        analyze_document(file, get_english_weights(), r'[a-z]+', "ENGLISH TRANSLATION")
+        analyze_document(file, get_english_weights(), LOWER_WORDS, "ENGLISH TRANSLATION")
     elif lang == "ara":
-        analyze_document(file, get_arabic_weights(), r'[\u0600-\u06FF]+', "ARABIC ORIGINAL")
\ No newline at end of file
+        analyze_document(file, get_arabic_weights(), ARABIC_WORDS, "ARABIC ORIGINAL")
\ No newline at end of file
@@ -1,7 +1,9 @@
 import sys
 import os
 import re
+import argparse
 from collections import Counter
+from lta_engine import SimulationConfig
 
 # --- 1. Language Logic Registry (Consolidated) ---
 
@@ -74,33 +76,39 @@ LANGUAGE_REGISTRY = {
 
 # --- 2. Topology Analysis Engine ---
 
-def calculate_topology_signature(len_func, limit=100):
+def calculate_topology_signature(len_func, limit=100, config=None):
     """
-    Generates a 'fingerprint' of the language's convergence patterns for 0-100.
+    Generates a 'fingerprint' of the language's convergence patterns for 0-limit
+    (or config.seeds, with a lta_engine.SimulationConfig).
     Returns a sorted list of (River_Tail, Percentage) tuples.
     """
-    paths = {}
-    for start in range(limit + 1):
-        path = []
+    # Converge limit 500, last 3 steps as signature
+    config = config or SimulationConfig(seed_stop=limit + 1, value_limit=500, max_steps=500, tail_size=3)
+
+    groups = {}
+    for done, start in enumerate(config.seeds, 1):
+        # Only the tail is kept; the rest of the path is never stored
+        tail = []
+        steps = 0
         curr = start
-        while curr < 500: # Converge limit
-            path.append(curr)
+        while curr < config.value_limit and steps < config.max_steps:
+            tail.append(curr)
+            if len(tail) > config.tail_size: del tail[0]
+            steps += 1
             l = len_func(curr)
             if l == 0: break
             curr += l
-        paths[start] = path
+        config.report_progress(done)
 
-    groups = {}
-    for start, path in paths.items():
-        if not path: continue
-        tail = tuple(path[-3:]) # Use last 3 steps as signature
+        if not tail: continue
+        tail = tuple(tail)
         if tail not in groups: groups[tail] = 0
         groups[tail] += 1
 
     # Normalize to percentages
     signature = []
     for tail, count in groups.items():
-        pct = (count / (limit + 1)) * 100
+        pct = (count / len(config.seeds)) * 100
         signature.append((tail, pct))
     
     # Sort by percentage descending
@@ -179,7 +187,7 @@ def compare_signatures(sig1, sig2):
 
 # --- 3. Main Tool Interface ---
 
-def find_source(target_lang_name="Russian"):
+def find_source(target_lang_name="Russian", config=None):
     print(f"--- FORENSIC SOURCE DETECTOR ---")
     print(f"Target Language: {target_lang_name}")
     print("Objective: Determine if this language's structure mimics another (indicating translation).")
@@ -190,7 +198,7 @@ def find_source(target_lang_name="Russian"):
         return
 
     target_func = LANGUAGE_REGISTRY[target_lang_name]
-    target_sig = calculate_topology_signature(target_func)
+    target_sig = calculate_topology_signature(target_func, config=config)
     
     print(f"Target Topology ({target_lang_name}):")
     for tail, pct in target_sig[:3]:
@@ -204,7 +212,7 @@ def find_source(target_lang_name="Russian"):
     for name, func in LANGUAGE_REGISTRY.items():
         if name == target_lang_name: continue
         
-        sig = calculate_topology_signature(func)
+        sig = calculate_topology_signature(func, config=config)
         similarity = compare_signatures(target_sig, sig)
         results.append((name, similarity))
         print(f"  vs. {name:<15}: {similarity:.1f}% Similarity")
@@ -228,4 +236,9 @@ def find_source(target_lang_name="Russian"):
 if __name__ == "__main__":
     # If a file arg is provided, we might define lang from file, 
     # but for now we default to the "Russian" simulation request.
-    find_source()
+    parser = argparse.ArgumentParser(description="Find the language whose topology a target mimics.")
+    parser.add_argument("target", nargs="?", default="Russian", help="Language name in LANGUAGE_REGISTRY")
+    SimulationConfig.add_arguments(parser)
+    args = parser.parse_args()
+    base = SimulationConfig(value_limit=500, max_steps=500, tail_size=3)
+    find_source(args.target, base.from_args(args))
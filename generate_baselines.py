@@ -1,44 +1,35 @@
 import os
 import sys
 import glob
-from io import StringIO
+import argparse
+from functools import partial
 
 # Add current directory to path to find the app
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import the app logic
 try:
-    from linguistic_topology_app import parse_lang_file, analyze_language
+    from linguistic_topology_app import format_analysis
+    from lta_batch import run_batch, simulate_file
+    from lta_cache import DEFAULT_CACHE_DIR
+    from lta_engine import SimulationConfig
+    from lta_rulepack import DEFAULT_PACK_PATH, build_rule_pack
 except ImportError:
     print("Error: Could not import linguistic_topology_app.py. Make sure it is in the same directory.")
     sys.exit(1)
 
-def capture_analysis(lang_file, output_dir):
-    try:
-        lang_data = parse_lang_file(lang_file)
-        
-        # Capture stdout
-        old_stdout = sys.stdout
-        result_buffer = StringIO()
-        sys.stdout = result_buffer
-        
-        analyze_language(lang_data)
-        
-        sys.stdout = old_stdout
-        result_text = result_buffer.getvalue()
-        
-        # Write to file
-        base_name = os.path.basename(lang_file)
-        result_file = os.path.join(output_dir, base_name.replace(".lang", "_results.txt"))
-        with open(result_file, "w", encoding="utf-8") as f:
-            f.write(result_text)
-            
-        return True, base_name
-    except Exception as e:
-        sys.stdout = sys.__stdout__ # Restore just in case
-        return False, f"{os.path.basename(lang_file)}: {e}"
+def write_baseline(res, output_dir):
+    """Writes one batch result to <lang>_results.txt. Returns (success, message)."""
+    base_name = os.path.basename(res["item"])
+    if not res["ok"]:
+        return False, f"{base_name}: {res['error']}"
 
-def main():
+    result_file = os.path.join(output_dir, base_name.replace(".lang", "_results.txt"))
+    with open(result_file, "w", encoding="utf-8") as f:
+        f.write(format_analysis(res["result"]) + "\n")
+    return True, base_name
+
+def main(config=None):
     repo_dir = os.path.dirname(os.path.abspath(__file__))
     languages_dir = os.path.join(repo_dir, "languages")
     baseline_dir = os.path.join(repo_dir, "baseline_results")
@@ -52,21 +43,25 @@ def main():
     # Filter out TECH files
     lang_files = [f for f in lang_files if "TECH.lang" not in f]
     
-    print(f"Found {len(lang_files)} native languages. Starting analysis...")
+    print(f"Found {len(lang_files)} native languages. Starting analysis on {os.cpu_count()} cores...")
     
     success_count = 0
     errors = []
-    
-    for lang_file in lang_files:
-        success, msg = capture_analysis(lang_file, baseline_dir)
+
+    def on_result(res):
+        # Keep output minimal as requested
+        sys.stdout.write("." if res["ok"] else "x")
+        sys.stdout.flush()
+
+    # Rules come from the rule pack and rivers from results/trajectory_cache;
+    # both are only rebuilt for .lang files that changed
+    build_rule_pack(lang_files, DEFAULT_PACK_PATH)
+    task = partial(simulate_file, cache_dir=DEFAULT_CACHE_DIR, config=config, pack_path=DEFAULT_PACK_PATH)
+    for res in run_batch(lang_files, task, progress=on_result):
+        success, msg = write_baseline(res, baseline_dir)
         if success:
-            # print(f"Analyzed: {msg}") 
-            # Keep output minimal as requested
-            sys.stdout.write(".")
-            sys.stdout.flush()
             success_count += 1
         else:
-            print(f"\nFailed: {msg}")
             errors.append(msg)
             
     print(f"\n\nCompleted. {success_count} languages analyzed.")
@@ -77,4 +72,6 @@ def main():
             print(err)
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Write baseline_results/<lang>_results.txt for every native language.")
+    SimulationConfig.add_arguments(parser)
+    main(SimulationConfig().from_args(parser.parse_args()))
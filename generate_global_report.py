@@ -1,8 +1,15 @@
 import os
 import glob
-from linguistic_topology_app import parse_lang_file, analyze_language
+import argparse
+from linguistic_topology_app import analyze_language
+from lta_cache import TrajectoryCache, load_or_compute_paths
+from lta_engine import SimulationConfig
+from lta_rulepack import load_catalogue
 
-def generate_report():
+# Seeds 0-100, values below 800, 100 steps, 5-node tails
+DEFAULT_CONFIG = SimulationConfig(value_limit=800, max_steps=100, tail_size=5)
+
+def generate_report(config=DEFAULT_CONFIG):
     lang_files = glob.glob("*.lang")
     if not lang_files:
         print("No .lang files found in the current directory.")
@@ -15,28 +22,22 @@ def generate_report():
 
     # We'll use a slightly modified version of analyze_language to return data
     results = []
+    cache = TrajectoryCache()
+    catalogue = load_catalogue(sorted(lang_files))
 
     for lang_file in sorted(lang_files):
         try:
-            lang_data = parse_lang_file(lang_file)
-            # Run simulation
-            paths = {}
-            for start_num in range(101):
-                path = []
-                curr = start_num
-                while curr < 800 and len(path) < 100:
-                    path.append(curr)
-                    length = lang_data["get_len_func"](curr, lang_data["rules"])
-                    if length == 0: break
-                    curr += length
-                paths[start_num] = path
+            lang_data = catalogue[lang_file]
+            if isinstance(lang_data, Exception): raise lang_data
+            # Run simulation (reused from the cache if the rules are unchanged)
+            paths = load_or_compute_paths(cache, lang_data, "global", config)
 
             unique_rivers = []
             groups = {}
-            for start_num in range(101):
+            for start_num in config.seeds:
                 my_path = paths.get(start_num, [])
-                if len(my_path) < 5: continue
-                my_tail = tuple(my_path[-5:])
+                if len(my_path) < config.min_path: continue
+                my_tail = tuple(my_path[-config.tail_size:])
                 found_river = False
                 for river_id, river_tail in enumerate(unique_rivers):
                     if my_tail == river_tail:
@@ -84,4 +85,6 @@ def generate_report():
     print("=" * 60)
 
 if __name__ == "__main__":
-    generate_report()
+    parser = argparse.ArgumentParser(description="Global river/unity report for the *.lang files in the current directory.")
+    SimulationConfig.add_arguments(parser)
+    generate_report(DEFAULT_CONFIG.from_args(parser.parse_args()))
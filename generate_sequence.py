@@ -1,29 +1,38 @@
+import argparse
 
-def num_to_english(n):
-    ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten", 
-            "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
-    tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
-    if n == 0: return "zero"
-    parts = []
-    if n >= 1000:
-        parts.append(num_to_english(n // 1000) + "thousand")
-        n %= 1000
-    if n >= 100:
-        parts.append(ones[n // 100] + "hundred")
-        n %= 100
-    if n >= 20:
-        parts.append(tens[n // 10])
-        n %= 10
-    if n > 0:
-        parts.append(ones[n])
-    return "".join(parts)
+from lta_oracle import english_oracle, ENGLISH_RULES
+from lta_engine import parse_count
+from lta_cache import TrajectoryCache, load_or_build_jump_table
+
+oracle = english_oracle()
 
 def a_seq(n_terms):
-    res = []
-    x = 0
-    for _ in range(n_terms):
-        res.append(x)
-        x += len(num_to_english(x))
-    return res
+    return oracle.path(0, n_terms)
+
+def english_jumps(value_limit):
+    """Jump table for the English map, reused from the trajectory cache across runs."""
+    lang_data = {"name": "English", "math_type": "western", "rules": ENGLISH_RULES,
+                 "processor": oracle.processor}
+    return load_or_build_jump_table(TrajectoryCache(), lang_data, value_limit)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Terms of the main trunk a(k) of n -> n + L(n) in English.")
+    parser.add_argument("terms", nargs="?", type=int, default=40, help="Number of leading terms to print")
+    parser.add_argument("--term", type=parse_count, help="Print a(K) without listing the terms before it")
+    parser.add_argument("--reach", type=parse_count, help="Print the first term >= X and its index")
+    parser.add_argument("--limit", type=parse_count, default=10**6, help="Value range of the jump table")
+    args = parser.parse_args()
 
-print(", ".join(map(str, a_seq(40))))
+    if args.term is None and args.reach is None:
+        print(", ".join(map(str, a_seq(args.terms))))
+    else:
+        jumps = english_jumps(args.limit)
+        if args.term is not None:
+            value = jumps.walk(0, args.term)
+            print(f"a({args.term}) = {value}" if value is not None else f"a({args.term}) lies beyond {args.limit:,}")
+        if args.reach is not None:
+            hit = jumps.first_reaching(0, args.reach)
+            if hit is None:
+                print(f"No term >= {args.reach} below {args.limit:,}")
+            else:
+                print(f"a({hit[0]}) = {hit[1]} is the first term >= {args.reach}")
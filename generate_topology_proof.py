@@ -1,40 +1,14 @@
 import sys
 
-def num_to_english(n):
-    ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten", 
-            "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
-    tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
-    
-    if n == 0: return "zero"
-    
-    parts = []
-    
-    if n >= 1000000:
-        parts.append(num_to_english(n // 1000000) + "million")
-        n %= 1000000
-        
-    if n >= 1000:
-        parts.append(num_to_english(n // 1000) + "thousand")
-        n %= 1000
-        
-    if n >= 100:
-        parts.append(ones[n // 100] + "hundred")
-        n %= 100
-        
-    if n >= 20:
-        parts.append(tens[n // 10])
-        n %= 10
-        
-    if n > 0:
-        parts.append(ones[n])
-        
-    return "".join(parts)
+from lta_oracle import english_oracle
+
+oracle = english_oracle()
 
 def get_len(n):
-    return len(num_to_english(n))
+    return oracle.length(n)
 
 def get_next(n):
-    return n + get_len(n)
+    return oracle.next(n)
 
 def run_proof():
     print("Generating Topological Proof for OEIS Submission...")
@@ -1,8 +1,68 @@
 import os
 import glob
-from linguistic_topology_app import parse_lang_file, get_western_name
+from linguistic_topology_app import parse_lang_file
 from frequency_tables import get_weight_map
 
+def get_western_name(n, rules):
+    """Generates the word name for a number."""
+    if n > 999: return ""
+    
+    direct_rules = rules.get("direct", {})
+    lang_name = rules.get("meta_name", "").lower()
+
+    if n in direct_rules: return direct_rules[n]
+    
+    parts = []
+    if n >= 100:
+        h = n // 100
+        rem = n % 100
+        
+        prefix = direct_rules.get(h, "")
+        
+        if "german" in lang_name and h == 1 and prefix == "eins":
+            prefix = "ein"
+        if "spanish" in lang_name and h == 1:
+            prefix = ""
+            
+        parts.append(prefix)
+        parts.append(rules.get("hundred", ""))
+        
+        if rem > 0:
+            if rules.get("hundred_sep"): parts.append(rules["hundred_sep"])
+            parts.append(get_western_name(rem, rules))
+        return "".join(parts)
+
+    if n >= 20:
+        t = n // 10
+        rem = n % 10
+        tens_rules = rules.get("tens", [])
+        tens_val = ""
+        if t < len(tens_rules):
+            tens_val = tens_rules[t]
+            
+        if rem > 0:
+            ten_sep = rules.get("ten_sep", "")
+            if ten_sep in ["und", "و"]:
+                unit_str = direct_rules.get(rem, "")
+                if "german" in lang_name and rem == 1 and unit_str == "eins":
+                    unit_str = "ein"
+                parts.extend([unit_str, ten_sep, tens_val])
+            else:
+                parts.append(tens_val)
+                if ten_sep: parts.append(ten_sep)
+                parts.append(direct_rules.get(rem, ""))
+        else:
+            parts.append(tens_val)
+    elif n > 10:
+        # Additive Teens Fallback (10 + unit)
+        ten_val = direct_rules.get(10, "")
+        unit_val = direct_rules.get(n % 10, "")
+        ten_sep = rules.get("ten_sep", " ")
+        if ten_val and unit_val:
+            parts.extend([ten_val, ten_sep, unit_val])
+    
+    return "".join(parts)
+
 def get_word_weight(word, weight_map):
     """Calculates the total weight of a word based on a frequency map."""
     # Strip spaces and punctuation
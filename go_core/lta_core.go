@@ -5,6 +5,8 @@ import (
 	"encoding/json"
 	"flag"
 	"fmt"
+	"io"
+	"math"
 	"os"
 	"sort"
 	"strconv"
@@ -21,26 +23,51 @@ type Language struct {
 	Rules       map[string]string `json:"-"`
 }
 
+// SimConfig holds the simulation limits (defaults match linguistic_topology_app)
+type SimConfig struct {
+	Seeds      int `json:"seeds,omitempty"`       // seeds 0 .. Seeds-1
+	ValueLimit int `json:"value_limit,omitempty"` // nodes >= ValueLimit are never entered
+	MaxSteps   int `json:"max_steps,omitempty"`   // nodes kept per seed
+	TailSize   int `json:"tail_size,omitempty"`   // nodes compared between rivers
+}
+
 // ResultGroup represents a "River" of convergence
 type ResultGroup struct {
-	RiverID     int    `json:"river_id"`
-	Count       int    `json:"count"`
-	Percentage  int    `json:"percentage"`
-	TailPreview string `json:"tail_preview"`
-	Members     []int  `json:"members"`
+	RiverID     int     `json:"river_id"`
+	Count       int     `json:"count"`
+	Percentage  float64 `json:"percentage"`
+	TailPreview string  `json:"tail_preview"`
+	Members     []int   `json:"members"`
 }
 
 // AnalysisResult holds the final output
 type AnalysisResult struct {
 	LanguageName   string        `json:"language_name"`
+	MathType       string        `json:"math_type"`
+	Seeds          int           `json:"seeds"`
+	Entropy        float64       `json:"entropy"`
 	DistinctRivers int           `json:"distinct_rivers"`
 	Rivers         []ResultGroup `json:"rivers"`
 }
 
 func main() {
 	filePath := flag.String("file", "", "Path to the .lang file")
+	serve := flag.Bool("serve", false, "Batch server: read NDJSON requests on stdin, stream NDJSON results")
+	cfg := SimConfig{}
+	flag.IntVar(&cfg.Seeds, "seeds", 101, "Number of seeds (0 .. seeds-1)")
+	flag.IntVar(&cfg.ValueLimit, "limit", 10000, "Value ceiling; paths stop before reaching it")
+	flag.IntVar(&cfg.MaxSteps, "steps", 500, "Maximum nodes per seed path")
+	flag.IntVar(&cfg.TailSize, "tail", 20, "Tail nodes compared when grouping rivers")
 	flag.Parse()
 
+	if *serve {
+		if err := serveRequests(os.Stdin, os.Stdout, cfg); err != nil {
+			fmt.Fprintf(os.Stderr, "Error: %v\n", err)
+			os.Exit(1)
+		}
+		return
+	}
+
 	if *filePath == "" {
 		fmt.Println("Error: Please provide a file path using -file")
 		os.Exit(1)
@@ -52,29 +79,98 @@ func main() {
 		os.Exit(1)
 	}
 
-	results := analyzeLanguage(lang)
+	results := analyzeLanguage(lang, cfg)
 	
 	// Output JSON to stdout
 	jsonData, _ := json.MarshalIndent(results, "", "  ")
 	fmt.Println(string(jsonData))
 }
 
-// --- Parsing Logic ---
+// --- Batch Server ---
 
-func parseLangFile(path string) (*Language, error) {
-	file, err := os.Open(path)
-	if err != nil {
-		return nil, err
+// Request is one line of the -serve protocol: either a path to a .lang file
+// or an inline rule set (the key: value pairs of a .lang file). Limits left
+// at zero fall back to the command-line flags.
+type Request struct {
+	ID    json.RawMessage   `json:"id,omitempty"`
+	File  string            `json:"file,omitempty"`
+	Rules map[string]string `json:"rules,omitempty"`
+	SimConfig
+}
+
+// Response is one line written back for each Request, in request order.
+type Response struct {
+	ID     json.RawMessage `json:"id,omitempty"`
+	Result *AnalysisResult `json:"result,omitempty"`
+	Error  string          `json:"error,omitempty"`
+}
+
+func serveRequests(in io.Reader, out io.Writer, defaults SimConfig) error {
+	scanner := bufio.NewScanner(in)
+	scanner.Buffer(make([]byte, 64*1024), 16*1024*1024) // Inline rule sets can be long
+	writer := bufio.NewWriter(out)
+	encoder := json.NewEncoder(writer)
+
+	for scanner.Scan() {
+		line := strings.TrimSpace(scanner.Text())
+		if line == "" {
+			continue
+		}
+
+		var req Request
+		resp := Response{}
+		if err := json.Unmarshal([]byte(line), &req); err != nil {
+			resp.Error = fmt.Sprintf("bad request: %v", err)
+		} else {
+			resp.ID = req.ID
+			var lang *Language
+			var err error
+			if req.File != "" {
+				lang, err = parseLangFile(req.File)
+			} else if req.Rules != nil {
+				lang = parseLangRules(req.Rules)
+			} else {
+				err = fmt.Errorf("request needs \"file\" or \"rules\"")
+			}
+			if err != nil {
+				resp.Error = err.Error()
+			} else {
+				result := analyzeLanguage(lang, req.SimConfig.withDefaults(defaults))
+				resp.Result = &result
+			}
+		}
+
+		// Encode writes one line; flush so the client sees it immediately
+		if err := encoder.Encode(resp); err != nil {
+			return err
+		}
+		if err := writer.Flush(); err != nil {
+			return err
+		}
 	}
-	defer file.Close()
+	return scanner.Err()
+}
 
-	lang := &Language{
+// --- Parsing Logic ---
+
+func newLanguage() *Language {
+	return &Language{
 		Name:        "Unknown",
 		MathType:    "western",
 		DirectRules: make(map[int]string),
 		Tens:        make(map[int]string),
 		Rules:       make(map[string]string),
 	}
+}
+
+func parseLangFile(path string) (*Language, error) {
+	file, err := os.Open(path)
+	if err != nil {
+		return nil, err
+	}
+	defer file.Close()
+
+	lang := newLanguage()
 
 	scanner := bufio.NewScanner(file)
 	for scanner.Scan() {
@@ -93,104 +189,173 @@ func parseLangFile(path string) (*Language, error) {
 		if idx := strings.Index(val, "#"); idx != -1 {
 			val = strings.TrimSpace(val[:idx])
 		}
+		applyRule(lang, key, val)
+	}
+	return lang, scanner.Err()
+}
 
-		switch key {
-		case "name":
-			lang.Name = val
-		case "math_type":
-			lang.MathType = strings.ToLower(val)
-		case "hundred", "hundred_sep", "ten_sep":
+func parseLangRules(rules map[string]string) *Language {
+	lang := newLanguage()
+	for key, val := range rules {
+		applyRule(lang, strings.TrimSpace(key), strings.TrimSpace(val))
+	}
+	return lang
+}
+
+func (c SimConfig) withDefaults(d SimConfig) SimConfig {
+	if c.Seeds <= 0 {
+		c.Seeds = d.Seeds
+	}
+	if c.ValueLimit <= 0 {
+		c.ValueLimit = d.ValueLimit
+	}
+	if c.MaxSteps <= 0 {
+		c.MaxSteps = d.MaxSteps
+	}
+	if c.TailSize <= 0 {
+		c.TailSize = d.TailSize
+	}
+	return c
+}
+
+func applyRule(lang *Language, key, val string) {
+	switch key {
+	case "name":
+		lang.Name = val
+	case "math_type":
+		lang.MathType = strings.ToLower(val)
+	case "hundred", "hundred_sep", "ten_sep":
+		lang.Rules[key] = val
+	default:
+		if isScaleKey(key) {
 			lang.Rules[key] = val
-		default:
-			if n, err := strconv.Atoi(key); err == nil {
-				lang.DirectRules[n] = val
-				if n >= 20 && n <= 90 && n%10 == 0 {
-					lang.Tens[n/10] = val
-				}
+			return
+		}
+		// Plain digit keys only (no sign), like Python's str.isdigit()
+		if key == "" || key[0] < '0' || key[0] > '9' {
+			return
+		}
+		if n, err := strconv.Atoi(key); err == nil {
+			lang.DirectRules[n] = val
+			if n >= 20 && n <= 90 && n%10 == 0 {
+				lang.Tens[n/10] = val
 			}
 		}
 	}
-	return lang, scanner.Err()
 }
 
 // --- Analysis Logic ---
+// Mirrors linguistic_topology_app.simulate_language: a seed's path stops
+// before ValueLimit, on a length of 0, or after MaxSteps nodes; seeds whose
+// last TailSize nodes share any node belong to the same river.
 
-func analyzeLanguage(lang *Language) AnalysisResult {
-	paths := make(map[int][]int)
-
-	// Determine length function
-	var lenFunc func(int, *Language) int
-	switch lang.MathType {
+func lengthFunc(mathType string) func(int, *Language) int {
+	switch mathType {
 	case "sumerian":
-		lenFunc = getSumerianLen
+		return getSumerianLen
 	case "hebrew":
-		lenFunc = getHebrewLen
+		return getHebrewLen
+	case "hebrew_gematria":
+		return getGematriaLen
 	default:
-		lenFunc = getWesternLen
+		return getWesternLen
 	}
+}
+
+func analyzeLanguage(lang *Language, cfg SimConfig) AnalysisResult {
+	lenFunc := lengthFunc(lang.MathType)
 
 	// Simulation Loop
-	for start := 0; start <= 100; start++ {
+	paths := make([][]int, cfg.Seeds)
+	entropyTotal := 0.0
+	entropySteps := 0
+	for start := 0; start < cfg.Seeds; start++ {
 		path := []int{}
 		curr := start
-		for curr < 800 && len(path) < 100 {
+		for curr < cfg.ValueLimit && len(path) < cfg.MaxSteps {
 			path = append(path, curr)
 			l := lenFunc(curr, lang)
 			if l == 0 {
 				break
 			}
+			entropyTotal += math.Log2(float64(l))
+			entropySteps++
 			curr += l
 		}
 		paths[start] = path
 	}
 
-	// Grouping Logic
-
-uniqueRivers := [][]int{}
-	groups := make(map[int][]int)
+	// Grouping Logic: union-find over tail nodes
+	parent := make(map[int]int)
+	var find func(int) int
+	find = func(x int) int {
+		if _, ok := parent[x]; !ok {
+			parent[x] = x
+		}
+		for parent[x] != x {
+			parent[x] = parent[parent[x]]
+			x = parent[x]
+		}
+		return x
+	}
 
-	for start := 0; start <= 100; start++ {
+	tails := make([][]int, cfg.Seeds)
+	for start := 0; start < cfg.Seeds; start++ {
 		path := paths[start]
 		if len(path) < 5 {
 			continue
 		}
-		
-		// Tail logic: last 5 elements
-	tail := path[len(path)-5:]
-		
-		foundID := -1
-		for i, river := range uniqueRivers {
-			if compareSlices(tail, river) {
-				foundID = i
-				break
+		from := len(path) - cfg.TailSize
+		if from < 0 {
+			from = 0
+		}
+		tails[start] = path[from:]
+		root := find(tails[start][0])
+		for _, node := range tails[start][1:] {
+			if r := find(node); r != root {
+				parent[r] = root
 			}
 		}
+	}
 
-		if foundID == -1 {
-		
-uniqueRivers = append(uniqueRivers, tail)
-			foundID = len(uniqueRivers) - 1
+	// Rivers in order of their first seed
+	order := []int{}
+	groups := make(map[int][]int)
+	firstTail := make(map[int][]int)
+	for start := 0; start < cfg.Seeds; start++ {
+		if tails[start] == nil {
+			continue
 		}
-		groups[foundID] = append(groups[foundID], start)
+		root := find(tails[start][0])
+		if _, ok := groups[root]; !ok {
+			order = append(order, root)
+			firstTail[root] = tails[start]
+		}
+		groups[root] = append(groups[root], start)
 	}
 
 	// Format Results
 	finalGroups := []ResultGroup{}
-	for id, members := range groups {
-		tailStr := fmt.Sprintf("%v", uniqueRivers[id])
+	for id, root := range order {
+		members := groups[root]
+		tail := firstTail[root]
+		if len(tail) > 5 {
+			tail = tail[len(tail)-5:]
+		}
+		tailStr := fmt.Sprintf("%v", tail)
 		tailStr = "..." + tailStr[1:len(tailStr)-1] // formatting [1 2 3] -> ...1 2 3
-		
+
 		finalGroups = append(finalGroups, ResultGroup{
 			RiverID:     id,
 			Count:       len(members),
-			Percentage:  len(members), // Since total is roughly 100 (0-100 is 101, but close enough for UI)
+			Percentage:  float64(len(members)) / float64(cfg.Seeds) * 100,
 			TailPreview: tailStr,
 			Members:     members,
 		})
 	}
 
-	// Sort by count descending
-	sort.Slice(finalGroups, func(i, j int) bool {
+	// Sort by count descending (stable: ties keep first-seed order)
+	sort.SliceStable(finalGroups, func(i, j int) bool {
 		return finalGroups[i].Count > finalGroups[j].Count
 	})
 
@@ -199,25 +364,21 @@ uniqueRivers = append(uniqueRivers, tail)
 		finalGroups[i].RiverID = i + 1
 	}
 
+	entropy := 0.0
+	if entropySteps > 0 {
+		entropy = entropyTotal / float64(entropySteps)
+	}
+
 	return AnalysisResult{
 		LanguageName:   lang.Name,
+		MathType:       lang.MathType,
+		Seeds:          cfg.Seeds,
+		Entropy:        entropy,
 		DistinctRivers: len(finalGroups),
 		Rivers:         finalGroups,
 	}
 }
 
-func compareSlices(a, b []int) bool {
-	if len(a) != len(b) {
-		return false
-	}
-	for i := range a {
-		if a[i] != b[i] {
-			return false
-		}
-	}
-	return true
-}
-
 // --- Math Functions ---
 
 func getWesternLen(n int, lang *Language) int {
@@ -228,29 +389,84 @@ func getWesternLen(n int, lang *Language) int {
 	return utf8.RuneCountInString(clean)
 }
 
+// Scale words a .lang file may define (10^3, 10^6, ...), each with an
+// optional "<word>_sep" before a non-zero remainder. Mirrors language_math.
+var scaleWords = []string{"thousand", "million", "billion", "trillion", "quadrillion"}
+
+func isScaleKey(key string) bool {
+	for _, word := range scaleWords {
+		if key == word || key == word+"_sep" {
+			return true
+		}
+	}
+	return false
+}
+
+// westernScales returns the scale words in use: consecutive defined ones,
+// stopping at the first the language lacks.
+func westernScales(lang *Language) []string {
+	scales := []string{}
+	for _, word := range scaleWords {
+		if lang.Rules[word] == "" {
+			break
+		}
+		scales = append(scales, word)
+	}
+	return scales
+}
+
+// westernPrefix is the multiplier word in front of "hundred" (and of scale words, for 1)
+func westernPrefix(h int, lang *Language) string {
+	prefix := lang.DirectRules[h]
+	langNameLower := strings.ToLower(lang.Name)
+
+	// German/Spanish specifics
+	if strings.Contains(langNameLower, "german") && h == 1 && prefix == "eins" {
+		prefix = "ein"
+	}
+	if strings.Contains(langNameLower, "spanish") && h == 1 {
+		prefix = ""
+	}
+	return prefix
+}
+
 func getWesternName(n int, lang *Language) string {
+	scales := westernScales(lang)
+	k := (len(strconv.Itoa(n)) - 1) / 3 // Index of the top digit group
+	// Names stop below 1000^(len(scales)+1)
+	if k > len(scales) {
+		return ""
+	}
 	if val, ok := lang.DirectRules[n]; ok {
 		return val
 	}
-	if n > 999 {
-		return ""
-	}
-
 	parts := []string{}
 	langNameLower := strings.ToLower(lang.Name)
 
+	if n >= 1000 {
+		// Digit groups: <group> <scale word> [<scale sep>] <remainder>
+		size := 1
+		for i := 0; i < k; i++ {
+			size *= 1000
+		}
+		group, rem := n/size, n%size
+		word := scales[k-1]
+		if group == 1 {
+			parts = append(parts, westernPrefix(1, lang))
+		} else {
+			parts = append(parts, getWesternName(group, lang))
+		}
+		parts = append(parts, lang.Rules[word])
+		if rem > 0 {
+			parts = append(parts, lang.Rules[word+"_sep"], getWesternName(rem, lang))
+		}
+		return strings.Join(parts, "")
+	}
+
 	if n >= 100 {
 		h := n / 100
 		rem := n % 100
-		prefix := lang.DirectRules[h]
-
-		// German/Spanish specifics
-		if strings.Contains(langNameLower, "german") && h == 1 && prefix == "eins" {
-			prefix = "ein"
-		}
-		if strings.Contains(langNameLower, "spanish") && h == 1 {
-			prefix = ""
-		}
+		prefix := westernPrefix(h, lang)
 
 		parts = append(parts, prefix)
 		if hSep, ok := lang.Rules["hundred"]; ok {
@@ -334,9 +550,36 @@ func getSumerianLen(n int, lang *Language) int {
 	return length
 }
 
+// Hebrew scales above 999: milyard (7), milyon (6), elef (3)
+var hebrewScales = []struct{ size, length int }{{1000000000, 7}, {1000000, 6}, {1000, 3}}
+
 func getHebrewLen(n int, lang *Language) int {
 	// Standard Hebrew Gematria-style Logic
-	if n > 999 { return 15 } // Fallback
+	if n > 999 {
+		// Digit groups, recursing on the group and the remainder
+		for _, s := range hebrewScales {
+			if n < s.size {
+				continue
+			}
+			g, rem := n/s.size, n%s.size
+			length := s.length
+			if g > 1 {
+				length += getHebrewLen(g, lang)
+			}
+			if s.size == 1000 {
+				// alpayim (5), shlosha .. asara alafim (+5), then "elef" from 11 up
+				if g == 2 {
+					length = 5
+				} else if g > 2 && g <= 10 {
+					length += 2
+				}
+			}
+			if rem > 0 {
+				length += 1 + getHebrewLen(rem, lang) // ve- + remainder
+			}
+			return length
+		}
+	}
 
 	unitsLen := map[int]int{
 		0: 3, 1: 3, 2: 4, 3: 4, 4: 4, 5: 4, 6: 3, 7: 4, 8: 4, 9: 4,
@@ -382,3 +625,93 @@ func getHebrewLen(n int, lang *Language) int {
 	}
 	return 0
 }
+
+
+// --- Hebrew Gematria ---
+// Length of n is the gematria value of its (masculine) Hebrew name.
+
+var gematriaValues = map[rune]int{
+	'א': 1, 'ב': 2, 'ג': 3, 'ד': 4, 'ה': 5, 'ו': 6, 'ז': 7, 'ח': 8, 'ט': 9,
+	'י': 10, 'כ': 20, 'ל': 30, 'מ': 40, 'נ': 50, 'ס': 60, 'ע': 70, 'פ': 80, 'צ': 90,
+	'ק': 100, 'ר': 200, 'ש': 300, 'ת': 400,
+	'ך': 20, 'ם': 40, 'ן': 50, 'ף': 80, 'ץ': 90, // Sofit forms
+}
+
+var hebrewNames = map[int]string{
+	0: "אפס", 1: "אחד", 2: "שנים", 3: "שלשה", 4: "ארבעה",
+	5: "חמשה", 6: "ששה", 7: "שבעה", 8: "שמנה", 9: "תשעה",
+	10: "עשר", 11: "אחד עשר", 12: "שנים עשר",
+	13: "שלשה עשר", 14: "ארבעה עשר", 15: "חמשה עשר",
+	16: "ששה עשר", 17: "שבעה עשר", 18: "שמנה עשר", 19: "תשעה עשר",
+	20: "עשרים", 30: "שלשים", 40: "ארבעים", 50: "חמשים",
+	60: "ששים", 70: "שבעים", 80: "שמנים", 90: "תשעים",
+	100: "מאה", 200: "מאתים", 300: "שלש מאות", 400: "ארבע מאות",
+	500: "חמש מאות", 600: "שש מאות", 700: "שבע מאות", 800: "שמנה מאות", 900: "תשע מאות",
+}
+
+func getHebrewName(n int) string {
+	if val, ok := hebrewNames[n]; ok {
+		return val
+	}
+
+	parts := []string{}
+
+	// Thousands
+	if n >= 1000 {
+		thousands := n / 1000
+		n = n % 1000
+		if thousands == 1 {
+			parts = append(parts, "אלף")
+		} else if thousands == 2 {
+			parts = append(parts, "אלפיים")
+		} else if thousands < 10 {
+			parts = append(parts, getHebrewName(thousands)+"ת אלפים")
+		} else {
+			parts = append(parts, getHebrewName(thousands)+" אלף")
+		}
+	}
+
+	// Hundreds
+	if n >= 100 {
+		hundreds := (n / 100) * 100
+		n = n % 100
+		if len(parts) > 0 {
+			parts = append(parts, "ו"+hebrewNames[hundreds])
+		} else {
+			parts = append(parts, hebrewNames[hundreds])
+		}
+	}
+
+	// Tens and Units
+	if n > 0 {
+		if val, ok := hebrewNames[n]; ok {
+			if len(parts) > 0 {
+				parts = append(parts, "ו"+val)
+			} else {
+				parts = append(parts, val)
+			}
+		} else {
+			tens := (n / 10) * 10
+			units := n % 10
+			if len(parts) > 0 {
+				parts = append(parts, "ו"+hebrewNames[tens])
+			} else {
+				parts = append(parts, hebrewNames[tens])
+			}
+			parts = append(parts, "ו"+hebrewNames[units])
+		}
+	}
+
+	return strings.Join(parts, " ")
+}
+
+func getGematriaLen(n int, lang *Language) int {
+	if n == 0 {
+		return 0
+	}
+	total := 0
+	for _, r := range getHebrewName(n) {
+		total += gematriaValues[r]
+	}
+	return total
+}
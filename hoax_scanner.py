@@ -1,6 +1,12 @@
-import sys
 import re
+import csv
+import json
 import math
+import argparse
+
+import numpy as np
+
+from lta_weights import WeightTable, LOWER_WORDS, code_points, weight_stats
 
 # --- English Tech Mapping (Bit-Velocity) ---
 # We use this to measure the "Physical Entropy" of the English text.
@@ -14,19 +20,23 @@ BIT_MAP = {
     ' ': 1 # Space is very fast (1 bit)
 }
 
+BIT_WEIGHTS = WeightTable(BIT_MAP, default=8)
+
+# --- Streaming ---
+CHUNK_SIZE = 1 << 20 # Characters read per buffer
+PREVIEW_CHARS = 50
+SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+RECORD_FIELDS = ["segment", "char_offset", "words", "mean_weight", "cv", "verdict", "preview"]
+
 def get_word_weight(word):
     # Calculate the total bit-cost of typing the word
-    return sum(BIT_MAP.get(c, 8) for c in word.lower())
+    return BIT_WEIGHTS.word_weight(word.lower())
 
 def analyze_segment(text_segment):
-    words = re.findall(r'[a-z]+', text_segment.lower())
-    if len(words) < 3: return None # Too short to analyze
+    weights = BIT_WEIGHTS.word_weights(text_segment.lower(), LOWER_WORDS)
+    if len(weights) < 3: return None # Too short to analyze
     
-    weights = [get_word_weight(w) for w in words]
-    
-    mean = sum(weights) / len(weights)
-    variance = sum((x - mean) ** 2 for x in weights) / len(weights)
-    std_dev = math.sqrt(variance)
+    n, mean, std_dev = weight_stats(weights)
     
     # Coefficient of Variation (CV) is our "Fingerprint"
     # Ancient (Hebrew/Aramaic) ~ 0.20 - 0.30
@@ -34,52 +44,238 @@ def analyze_segment(text_segment):
     cv = std_dev / mean if mean > 0 else 0
     return cv
 
-def scan_document(filepath):
+ANCIENT_VERDICT = "ANCIENT (Likely Source)"
+MODERN_VERDICT = "MODERN (English/Hoax?)"
+
+def classify(cv):
+    # Classification Logic
+    # Adjusted thresholds based on our previous findings
+    if cv < 0.45:
+        return ANCIENT_VERDICT
+    if cv > 0.55:
+        return MODERN_VERDICT
+    return "MIXED / TRANSITIONAL"
+
+def word_sums(lowered, bounds, tail=None, open_end=False):
+    """
+    Word statistics for consecutive pieces of a lower-cased buffer, all in one
+    pass: (counts, sums, squares) per (start, end) in bounds, and the weight
+    of the word still open at the buffer's end if open_end is set. tail is the
+    weight of a word left open by the previous buffer; it continues a word at
+    offset 0 or counts as a word of the first piece on its own.
+    """
+    codes = code_points(lowered)
+    starts, ends = LOWER_WORDS.spans(codes)
+    weights = BIT_WEIGHTS.weigh(codes, starts, ends)
+    lone_tail = None
+    if tail is not None:
+        if len(starts) and starts[0] == 0:
+            weights[0] += tail # The word cut by the last buffer continues
+        else:
+            lone_tail = tail
+    open_weight = None
+    if open_end and len(ends) and ends[-1] == len(codes):
+        open_weight = int(weights[-1])
+        starts, weights = starts[:-1], weights[:-1]
+
+    piece_starts = np.array([start for start, _ in bounds], dtype=np.int64)
+    piece_ends = np.array([end for _, end in bounds], dtype=np.int64)
+    # A break is whitespace, so every word lies inside exactly one piece
+    first = np.searchsorted(starts, piece_starts)
+    last = np.searchsorted(starts, piece_ends)
+    sums = np.concatenate(([0], np.cumsum(weights)))
+    squares = np.concatenate(([0], np.cumsum(weights * weights)))
+    counts = [int(c) for c in last - first]
+    totals = [int(t) for t in sums[last] - sums[first]]
+    totals_sq = [int(t) for t in squares[last] - squares[first]]
+    if lone_tail is not None:
+        counts[0] += 1
+        totals[0] += lone_tail
+        totals_sq[0] += lone_tail * lone_tail
+    return (counts, totals, totals_sq), open_weight
+
+class SegmentAccumulator:
+    """
+    Word-weight statistics for one segment, fed piece by piece.
+    Holds only the preview and exact integer (count, sum, sum of squares), so
+    a segment of any length costs O(1) memory. Matches analyze_segment() on
+    the concatenated pieces.
+    """
+    def __init__(self, char_offset=0):
+        self.char_offset = char_offset
+        self.preview = ""
+        self.more_content = False # Non-space text past the preview
+        self.count = 0
+        self.total = 0
+        self.total_sq = 0
+
+    def add(self, count, total, total_sq):
+        self.count += count
+        self.total += total
+        self.total_sq += total_sq
+
+    def feed(self, piece):
+        """Feeds the text of a piece for the preview; its words arrive through add()."""
+        if len(self.preview) < PREVIEW_CHARS:
+            if not self.preview:
+                piece = piece.lstrip()
+            room = PREVIEW_CHARS - len(self.preview)
+            self.preview += piece[:room]
+            piece = piece[room:]
+        if not self.more_content and piece and not piece.isspace():
+            self.more_content = True
+
+    def finish(self):
+        """Closes the segment. Returns (words, mean_weight, cv, preview); cv is None if too short."""
+        preview = self.preview if self.more_content else self.preview.rstrip()
+        n = self.count
+        mean = self.total / n if n else 0.0
+        if n < 3:
+            return n, mean, None, preview
+        # n^2 * variance, exact in integers
+        spread = n * self.total_sq - self.total * self.total
+        cv = math.sqrt(spread) / self.total if self.total > 0 else 0
+        return n, mean, cv, preview
+
+def iter_segments(f, chunk_size=CHUNK_SIZE):
+    """
+    Yields (char_offset, words, mean_weight, cv, preview) per sentence of the
+    text stream f, in order, with the same segmentation as
+    re.split(r'(?<=[.!?])\s+', f.read()). Reads fixed-size buffers and weighs
+    each buffer's words in one vectorized pass; a sentence cut by a buffer
+    boundary carries over as running statistics, not text.
+    """
+    consumed = 0
+    last_char = ""
+    tail = None # Weight of a word cut by the buffer boundary
+    acc = SegmentAccumulator(0)
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        # Keep one character of context so a break right after the previous buffer's '.' is seen
+        text = last_char + chunk
+        base = consumed - len(last_char)
+        pos = len(last_char)
+        edges = [pos]
+        for m in SENTENCE_BREAK.finditer(text, pos):
+            edges.extend(m.span())
+        edges.append(len(text))
+        bounds = list(zip(edges[0::2], edges[1::2]))
+
+        lowered = chunk.lower()
+        if len(lowered) == len(chunk):
+            stats, tail = word_sums(lowered, [(start - pos, end - pos) for start, end in bounds], tail, open_end=True)
+            stats = list(zip(*stats))
+        else:
+            # lower() changed the length (e.g. 'İ'), so positions no longer line up; go piece by piece
+            stats = []
+            for i, (start, end) in enumerate(bounds):
+                is_last = i == len(bounds) - 1
+                piece = text[start:end].lower()
+                (counts, totals, totals_sq), open_weight = word_sums(piece, [(0, len(piece))], tail if i == 0 else None, open_end=is_last)
+                stats.append((counts[0], totals[0], totals_sq[0]))
+                if is_last:
+                    tail = open_weight
+                elif i == 0:
+                    tail = None
+
+        for i, (start, end) in enumerate(bounds):
+            acc.feed(text[start:end])
+            acc.add(*stats[i])
+            if i < len(bounds) - 1:
+                yield (acc.char_offset,) + acc.finish()
+                acc = SegmentAccumulator(base + bounds[i + 1][0])
+        consumed += len(chunk)
+        last_char = chunk[-1]
+    if tail is not None:
+        acc.add(1, tail, tail * tail)
+    yield (acc.char_offset,) + acc.finish()
+
+def scan_stream(f, chunk_size=CHUNK_SIZE):
+    """Yields one record dict per analyzable segment of the text stream f."""
+    index = 0
+    for char_offset, words, mean, cv, preview in iter_segments(f, chunk_size):
+        if cv is None: continue
+        yield {
+            "segment": index,
+            "char_offset": char_offset,
+            "words": words,
+            "mean_weight": round(mean, 6),
+            "cv": round(cv, 6),
+            "verdict": classify(cv),
+            "preview": preview.replace(chr(10), ' '),
+        }
+        index += 1
+
+def record_format(path, fmt=None):
+    if fmt:
+        return fmt
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+def scan_document(filepath, records_path=None, records_format=None, chunk_size=CHUNK_SIZE, table=True):
+    """
+    Streams filepath sentence by sentence, printing the human table and, if
+    records_path is given, writing one CSV or JSONL record per segment as it
+    is scored. Memory stays constant regardless of document size.
+    Returns (ancient_count, modern_count).
+    """
     print(f"\n--- HOAX SCANNER REPORT: {filepath} ---")
-    print(f"{'SEGMENT (First 50 chars)':<55} | {'CV SCORE':<10} | {'VERDICT'}")
-    print("-" * 85)
-    
-    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-        text = f.read()
-        
-    # Split into sentences or paragraphs
-    segments = re.split(r'(?<=[.!?])\s+', text)
+    if table:
+        print(f"{'SEGMENT (First 50 chars)':<55} | {'CV SCORE':<10} | {'VERDICT'}")
+        print("-" * 85)
     
     ancient_count = 0
     modern_count = 0
-    
-    for seg in segments:
-        seg = seg.strip()
-        if not seg: continue
-        
-        cv = analyze_segment(seg)
-        if cv is None: continue
-        
-        # Classification Logic
-        # Adjusted thresholds based on our previous findings
-        if cv < 0.45:
-            verdict = "ANCIENT (Likely Source)"
-            ancient_count += 1
-        elif cv > 0.55:
-            verdict = "MODERN (English/Hoax?)"
-            modern_count += 1
-        else:
-            verdict = "MIXED / TRANSITIONAL"
-            
-        print(f"{seg[:50].replace(chr(10), ' '):<55} | {cv:.4f}     | {verdict}")
+
+    out = None
+    writer = None
+    fmt = None
+    if records_path:
+        fmt = record_format(records_path, records_format)
+        out = open(records_path, 'w', encoding='utf-8', newline='')
+        if fmt == "csv":
+            writer = csv.DictWriter(out, fieldnames=RECORD_FIELDS)
+            writer.writeheader()
+
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            for record in scan_stream(f, chunk_size):
+                # Counted from the verdict: record["cv"] is rounded
+                if record["verdict"] == ANCIENT_VERDICT:
+                    ancient_count += 1
+                elif record["verdict"] == MODERN_VERDICT:
+                    modern_count += 1
+
+                if table:
+                    print(f"{record['preview']:<55} | {record['cv']:.4f}     | {record['verdict']}")
+                if writer is not None:
+                    writer.writerow(record)
+                elif out is not None:
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if out is not None:
+            out.close()
 
     print("-" * 85)
     print(f"SUMMARY:")
     print(f"  > Ancient/Faithful Sections: {ancient_count}")
     print(f"  > Modern/Suspicious Sections: {modern_count}")
+    if records_path:
+        print(f"  > Records ({fmt.upper()}): {records_path}")
     if modern_count > ancient_count:
         print("\n[!] WARNING: Document shows predominantly MODERN structural variance.")
         print("    View with SKEPTICISM if it claims to be a direct ancient translation.")
     else:
         print("\n[OK] Document retains significant ANCIENT structural characteristics.")
+    return ancient_count, modern_count
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python hoax_scanner.py <text_file>")
-    else:
-        scan_document(sys.argv[1])
+    parser = argparse.ArgumentParser(description="Score every sentence of a text file by bit-velocity CV.")
+    parser.add_argument("text_file")
+    parser.add_argument("--records", help="Also write one record per segment to this file (.csv or .jsonl)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Record format (default: from the --records extension)")
+    parser.add_argument("--chunk", type=int, default=CHUNK_SIZE, help="Characters read per buffer")
+    parser.add_argument("--no-table", action="store_true", help="Print only the summary")
+    args = parser.parse_args()
+    scan_document(args.text_file, args.records, args.format, args.chunk, table=not args.no_table)
@@ -1,5 +1,52 @@
 
 import re
+from collections import OrderedDict
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Scale words a .lang file may define, in order (10^3, 10^6, ...). Each may
+# come with a "<word>_sep" placed between the scale and a non-zero remainder.
+SCALE_WORDS = ["thousand", "million", "billion", "trillion", "quadrillion"]
+SCALE_KEYS = SCALE_WORDS + [f"{word}_sep" for word in SCALE_WORDS]
+
+# --- Helpers ---
+
+def clean_len(text):
+    """Length of a name once spaces and hyphens are removed."""
+    return len(text.replace(" ", "").replace("-", ""))
+
+class LRUMemo:
+    """Bounded memo keyed by integer: least recently used entries are dropped first."""
+
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, compute):
+        data = self.data
+        if key in data:
+            self.hits += 1
+            data.move_to_end(key)
+            return data[key]
+        self.misses += 1
+        value = compute(key)
+        data[key] = value
+        if len(data) > self.maxsize:
+            data.popitem(last=False)
+        return value
+
+    def info(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.data), "maxsize": self.maxsize}
+
+    def clear(self):
+        self.data.clear()
+        self.hits = self.misses = 0
 
 # --- Base Processor ---
 
@@ -12,12 +59,88 @@ class LanguageProcessor:
         """Returns the 'length' of number n in this language."""
         raise NotImplementedError
 
+    def length_table(self, max_n):
+        """
+        Returns a NumPy int64 array where table[n] == get_length(n) for 0 <= n < max_n.
+        Subclasses override this with a vectorized build; the default just
+        evaluates get_length once per entry.
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for length_table")
+        return np.fromiter((self.get_length(n) for n in range(max_n)), dtype=np.int64, count=max_n)
+
+    def lengths_of(self, values):
+        """
+        get_length over an int64 array of arbitrary (large) values, without a
+        table reaching up to them. The default evaluates get_length per value;
+        digit-group processors recurse on whole arrays instead.
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for lengths_of")
+        values = np.asarray(values, dtype=np.int64)
+        flat = values.ravel()
+        return np.fromiter((self.get_length(int(n)) for n in flat), dtype=np.int64,
+                           count=flat.size).reshape(values.shape)
+
+    def length_range(self, lo, hi):
+        """Lengths of lo <= n < hi, for ranges far past any length table."""
+        return self.lengths_of(np.arange(lo, hi, dtype=np.int64))
+
+    def _small_table(self, size):
+        """length_table(size), built once per processor for lengths_of."""
+        if getattr(self, "_small", None) is None or len(self._small) < size:
+            self._small = self.length_table(size)
+        return self._small
+
 # --- Specific Implementations ---
 
 class WesternProcessor(LanguageProcessor):
+    # Names and lengths kept per processor; long convergence runs revisit
+    # the same numbers (and the same remainders) over and over.
+    CACHE_SIZE = 65536
+
+    def __init__(self, name, rules=None):
+        super().__init__(name, rules)
+        self._names = LRUMemo(self.CACHE_SIZE)
+        self._lengths = LRUMemo(self.CACHE_SIZE)
+
+        # Scale words are used in order until the first one the file lacks;
+        # names stop below 1000^(scales + 1) (at 999 without any).
+        self.scales = []
+        for key in SCALE_WORDS:
+            if not self.rules.get(key):
+                break
+            self.scales.append((self.rules[key], self.rules.get(f"{key}_sep", "")))
+        self.max_value = 1000 ** (len(self.scales) + 1)
+        self._scale_lens = [(clean_len(word), clean_len(sep)) for word, sep in self.scales]
+
+    def cache_info(self):
+        """Hit/miss counters of the name and length memos."""
+        return {"names": self._names.info(), "lengths": self._lengths.info()}
+
     def get_name(self, n):
         """Generates the word name for a number."""
-        if n > 999: return ""
+        return self._names.get(n, self._build_name)
+
+    def _prefix(self, h):
+        """The multiplier word in front of "hundred" (and of scale words, for 1)."""
+        prefix = self.rules.get("direct", {}).get(h, "")
+        lang_name = self.name.lower()
+        # Special case for German "ein" vs "eins"
+        if "german" in lang_name and h == 1 and prefix == "eins":
+            prefix = "ein"
+        if "spanish" in lang_name and h == 1:
+            prefix = ""
+        return prefix
+
+    def _scale(self, n):
+        """For 1000 <= n: (k, group, remainder) with n = group * 1000^k + remainder."""
+        k = min((len(str(n)) - 1) // 3, len(self.scales))
+        group, rem = divmod(n, 1000 ** k)
+        return k, group, rem
+
+    def _build_name(self, n):
+        if n >= self.max_value: return ""
         
         direct_rules = self.rules.get("direct", {})
         lang_name = self.name.lower()
@@ -25,18 +148,22 @@ class WesternProcessor(LanguageProcessor):
         if n in direct_rules: return direct_rules[n]
         
         parts = []
+        if n >= 1000:
+            # Digit groups: <group> <scale word> [<scale sep>] <remainder>
+            k, group, rem = self._scale(n)
+            word, sep = self.scales[k - 1]
+            parts.append(self._prefix(1) if group == 1 else self.get_name(group))
+            parts.append(word)
+            if rem > 0:
+                parts.append(sep)
+                parts.append(self.get_name(rem))
+            return "".join(parts)
+
         if n >= 100:
             h = n // 100
             rem = n % 100
             
-            prefix = direct_rules.get(h, "")
-            
-            # Special case for German "ein" vs "eins"
-            if "german" in lang_name and h == 1 and prefix == "eins":
-                prefix = "ein"
-            if "spanish" in lang_name and h == 1:
-                prefix = ""
-                
+            prefix = self._prefix(h)
             parts.append(prefix)
             parts.append(self.rules.get("hundred", ""))
             
@@ -70,10 +197,120 @@ class WesternProcessor(LanguageProcessor):
         return "".join(parts)
 
     def get_length(self, n):
+        return self._lengths.get(n, self._build_length)
+
+    def _build_length(self, n):
+        if 1000 <= n < self.max_value and n not in self.rules.get("direct", {}):
+            # Same decomposition as _build_name, summed from memoized
+            # group lengths instead of concatenated
+            k, group, rem = self._scale(n)
+            word_len, sep_len = self._scale_lens[k - 1]
+            length = clean_len(self._prefix(1)) if group == 1 else self.get_length(group)
+            length += word_len
+            if rem > 0:
+                length += sep_len + self.get_length(rem)
+            return length
+
         name = self.get_name(n)
         # Remove spaces and hyphens for length calculation
         return len(name.replace(" ", "").replace("-", ""))
 
+    def length_table(self, max_n):
+        """
+        Vectorized get_length for 0 <= n < max_n.
+        Composes unit, tens and hundreds length arrays the same way get_name
+        composes strings; stripping spaces/hyphens is per character, so the
+        length of a name is the sum of the cleaned lengths of its parts.
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for length_table")
+
+        direct_rules = self.rules.get("direct", {})
+        tens_rules = self.rules.get("tens", [])
+        lang_name = self.name.lower()
+        ten_sep = self.rules.get("ten_sep", "")
+        inverted = ten_sep in ["und", "و"]
+
+        # Digit arrays
+        units = np.array([clean_len(direct_rules.get(u, "")) for u in range(10)], dtype=np.int64)
+        if inverted and "german" in lang_name and direct_rules.get(1, "") == "eins":
+            units[1] = clean_len("ein")
+        tens = np.array([clean_len(tens_rules[t]) if t < len(tens_rules) else 0 for t in range(10)], dtype=np.int64)
+
+        # 0-99: 20-99 are tens (+ separator + unit), 0-19 only exist as direct rules
+        low = np.zeros(100, dtype=np.int64)
+        n = np.arange(20, 100)
+        rem = n % 10
+        low[20:] = tens[n // 10] + (rem > 0) * (clean_len(ten_sep) + units[rem])
+        for num, value in direct_rules.items():
+            if 0 <= num < 100:
+                low[num] = clean_len(value)
+
+        # 100-999: hundreds prefix + "hundred" (+ separator + name of remainder)
+        prefixes = np.array([clean_len(self._prefix(h)) for h in range(10)], dtype=np.int64)
+
+        full = np.zeros(1000, dtype=np.int64)
+        full[:100] = low
+        n = np.arange(100, 1000)
+        rem = n % 100
+        full[100:] = (prefixes[n // 100] + clean_len(self.rules.get("hundred", ""))
+                      + (rem > 0) * (clean_len(self.rules.get("hundred_sep", "")) + low[rem]))
+        for num, value in direct_rules.items():
+            if 100 <= num < 1000:
+                full[num] = clean_len(value)
+
+        table = np.zeros(max_n, dtype=np.int64)
+        table[:min(max_n, 1000)] = full[:max_n]
+
+        # Scale blocks [1000^k, 1000^(k+1)): group and remainder are both
+        # below the block start, so they are already filled in
+        one_prefix = clean_len(self._prefix(1))
+        for k, (word_len, sep_len) in enumerate(self._scale_lens, 1):
+            start, end = 1000 ** k, min(1000 ** (k + 1), max_n)
+            if start >= end:
+                break
+            n = np.arange(start, end)
+            group, rem = np.divmod(n, 1000 ** k)
+            table[start:end] = (np.where(group == 1, one_prefix, table[group]) + word_len
+                                + (rem > 0) * (sep_len + table[rem]))
+            for num, value in direct_rules.items():
+                if start <= num < end:
+                    table[num] = clean_len(value)
+
+        # Names stop below max_value
+        return table
+
+    def lengths_of(self, values):
+        """Vectorized digit-group decomposition, recursing on the remainders."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for lengths_of")
+        values = np.asarray(values, dtype=np.int64)
+        base = self._small_table(1000)
+        out = np.zeros(values.shape, dtype=np.int64)
+        small = (values >= 0) & (values < 1000)
+        out[small] = base[values[small]]
+
+        large = (values >= 1000) & (values < self.max_value)
+        if large.any():
+            n = values[large]
+            k = np.ones(n.shape, dtype=np.int64)
+            for i in range(2, len(self.scales) + 1):
+                k += n >= 1000 ** i
+            sizes = np.array([1000 ** i for i in range(len(self.scales) + 1)], dtype=np.int64)
+            word_lens = np.array([0] + [w for w, _ in self._scale_lens], dtype=np.int64)
+            sep_lens = np.array([0] + [s for _, s in self._scale_lens], dtype=np.int64)
+
+            group, rem = np.divmod(n, sizes[k])
+            length = np.where(group == 1, clean_len(self._prefix(1)), base[group]) + word_lens[k]
+            nonzero = rem > 0
+            length[nonzero] += sep_lens[k[nonzero]] + self.lengths_of(rem[nonzero])
+            out[large] = length
+
+            for num, value in self.rules.get("direct", {}).items():
+                if 1000 <= num < self.max_value:
+                    out[values == num] = clean_len(value)
+        return out
+
 
 class SumerianProcessor(LanguageProcessor):
     def get_length(self, n):
@@ -124,6 +361,74 @@ class SumerianProcessor(LanguageProcessor):
 
         return length
 
+    def _remainder_lengths(self):
+        """Signs for the remainder 0-59 (tens sign + units sign), as an array."""
+        direct_rules = self.rules.get("direct", {})
+        tens_rules = self.rules.get("tens", [])
+
+        rem_len = np.zeros(60, dtype=np.int64)
+        for rem in range(1, 60):
+            tens = (rem // 10) * 10
+            units = rem % 10
+            length = 0
+            if tens > 0:
+                if tens in direct_rules:
+                    length += len(direct_rules[tens])
+                else:
+                    tens_idx = tens // 10
+                    if tens_idx < len(tens_rules) and tens_rules[tens_idx]:
+                        length += len(tens_rules[tens_idx])
+            if units > 0 and units in direct_rules:
+                length += len(direct_rules[units])
+            rem_len[rem] = length
+        return rem_len
+
+    def length_table(self, max_n):
+        """
+        Vectorized get_length for 0 <= n < max_n.
+        Built a base-60 place at a time: L(n) = L(n // 60) + L_rem(n % 60),
+        where the higher place is always an already-filled entry.
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for length_table")
+
+        direct_rules = self.rules.get("direct", {})
+        rem_len = self._remainder_lengths()
+
+        table = np.zeros(max_n, dtype=np.int64)
+        start = 0
+        end = min(60, max_n)
+        while start < max_n:
+            n = np.arange(start, end)
+            h = n // 60
+            table[start:end] = np.where(h > 0, table[h], 0) + rem_len[n % 60]
+            for num, value in direct_rules.items():
+                if start <= num < end and num != 0:
+                    table[num] = len(value)
+            start = end
+            end = min(end * 60, max_n)
+
+        return table
+
+    def lengths_of(self, values):
+        """Vectorized base-60 decomposition, recursing on the higher places."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for lengths_of")
+        values = np.asarray(values, dtype=np.int64)
+        base = self._small_table(3600)
+        out = np.zeros(values.shape, dtype=np.int64)
+        small = (values >= 0) & (values < 3600)
+        out[small] = base[values[small]]
+
+        large = values >= 3600
+        if large.any():
+            n = values[large]
+            out[large] = self.lengths_of(n // 60) + self._remainder_lengths()[n % 60]
+            for num, value in self.rules.get("direct", {}).items():
+                if num >= 3600:
+                    out[values == num] = len(value)
+        return out
+
 
 class HebrewProcessor(LanguageProcessor):
     def get_length(self, n):
@@ -131,7 +436,7 @@ class HebrewProcessor(LanguageProcessor):
         Calculates the length of the Hebrew name for n, counting native letters.
         Uses the standard masculine form for abstract counting.
         """
-        if n > 999: return 15 # Approximation for simplicity
+        if n > 999: return self._scale_length(n)
 
         # Letter counts for native Hebrew spelling (masculine form)
         units_len = {
@@ -191,6 +496,85 @@ class HebrewProcessor(LanguageProcessor):
 
         return 0 # Fallback
 
+    # Scales: (size, length of the bare word, length after a multiplier)
+    # milyard (7), milyon (6), elef / alafim (3 / 5, "alpayim" for 2000)
+    SCALES = [(10**9, 7, 7), (10**6, 6, 6), (1000, 3, 3)]
+
+    def _group_length(self, size, bare, after, g):
+        if g == 1: return bare
+        if size == 1000:
+            # shnei alafim (5), shlosha alafim .. asara alafim (+5),
+            # then the singular "elef" from 11 up: achad-asar elef (+3)
+            if g == 2: return 5
+            if g <= 10: return self.get_length(g) + 5
+        return self.get_length(g) + after
+
+    def _scale_length(self, n):
+        """Digit-group decomposition for n >= 1000, recursing on each group."""
+        for size, bare, after in self.SCALES:
+            if n >= size:
+                g, rem = divmod(n, size)
+                length = self._group_length(size, bare, after, g)
+                if rem > 0:
+                    length += 1 + self.get_length(rem) # ve- + remainder
+                return length
+
+    def length_table(self, max_n):
+        """Vectorized get_length, filled block by block from the table below each scale."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for length_table")
+        table = np.zeros(max_n, dtype=np.int64)
+        low = min(max_n, 1000)
+        table[:low] = super().length_table(low)
+
+        blocks = [(1000, 10**6), (10**6, 10**9), (10**9, None)]
+        for (start, stop), (size, bare, after) in zip(blocks, reversed(self.SCALES)):
+            end = max_n if stop is None else min(stop, max_n)
+            if start >= end:
+                break
+            # Work in chunks so huge tables never need a second full-size buffer
+            for lo in range(start, end, 1 << 22):
+                hi = min(lo + (1 << 22), end)
+                # Groups and remainders are below lo, so already in the table
+                g, rem = np.divmod(np.arange(lo, hi), size)
+                group = table[g] + after
+                if size == 1000:
+                    group = np.where(g <= 10, table[np.minimum(g, 10)] + 5, table[g] + 3)
+                    group = np.where(g == 2, 5, group)
+                group = np.where(g == 1, bare, group)
+                table[lo:hi] = group + (rem > 0) * (1 + table[rem])
+        return table
+
+    def lengths_of(self, values):
+        """Vectorized _scale_length over an array, recursing on groups and remainders."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for lengths_of")
+        values = np.asarray(values, dtype=np.int64)
+        base = self._small_table(1000)
+        out = np.zeros(values.shape, dtype=np.int64)
+        small = (values >= 0) & (values < 1000)
+        out[small] = base[values[small]]
+
+        large = values >= 1000
+        if large.any():
+            n = values[large]
+            scales = self.SCALES[::-1] # elef, milyon, milyard
+            i = np.zeros(n.shape, dtype=np.int64)
+            for size, _, _ in scales[1:]:
+                i += n >= size
+            sizes, bares, afters = (np.array(column, dtype=np.int64) for column in zip(*scales))
+
+            g, rem = np.divmod(n, sizes[i])
+            group = self.lengths_of(g) + afters[i]
+            thousands = i == 0
+            group[thousands & (g <= 10)] += 2 # shlosha .. asara alafim
+            group[thousands & (g == 2)] = 5
+            group = np.where(g == 1, bares[i], group)
+            nonzero = rem > 0
+            group[nonzero] += 1 + self.lengths_of(rem[nonzero])
+            out[large] = group
+        return out
+
 
 class HebrewGematriaProcessor(LanguageProcessor):
     def __init__(self, name, rules=None):
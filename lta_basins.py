@@ -0,0 +1,265 @@
+# --- LTA Basin Labelling ---
+# Labels every integer in [0, N) at once, instead of tracing seeds 0-100.
+#
+# Within a bounded range the map n -> n + L(n) is a forest: a path ends at
+# its last node below N (or where L is 0), and every node below it belongs to
+# exactly one tree. Each tree is a river, identified by its smallest member.
+# Per node the labels are:
+#
+#   source        smallest integer whose path passes through n (n itself if none)
+#   river         smallest member of n's tree (0 for the main trunk)
+#   merge_target  first node on n's path that also lies on the path of a smaller
+#                 integer (n itself if one passes through n), -1 if none does
+#   merge_depth   steps from n to merge_target, -1 if there is none
+#
+# These match lta_engine.ConvergenceGraph tracing seeds 0, 1, 2, ... in order
+# with max_steps >= N: merge_target is the merge point it reports for each seed.
+#
+# Successors always lie above a node and at most max(L) above it, so the range
+# is processed in chunks: one ascending pass for `source`, one descending pass
+# for the rest, each carrying only a few dozen boundary labels between chunks.
+# Inside a chunk paths are resolved by pointer jumping: O(log chunk_size)
+# NumPy rounds, so a node costs up to O(log chunk_size) work rather than the
+# O(1) of a node-by-node descending sweep, which would be a Python loop.
+# Labels are int32 .npy files written through memory maps, so N = 10^9 needs
+# about 16 GB of disk and only a few chunks of memory.
+
+import os
+import re
+import json
+import argparse
+
+import numpy as np
+
+from lta_engine import parse_count
+from lta_oracle import ENGLISH_RULES
+from language_math import WesternProcessor
+from linguistic_topology_app import parse_lang_file
+
+LABELS = ("source", "river", "merge_target", "merge_depth")
+DEFAULT_BASIN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "basins")
+CHUNK_SIZE = 1 << 22
+
+# --- 1. Chunk Kernels ---
+
+def _successors(processor, lo, hi, value_limit):
+    """Successors of lo..hi-1 as int64, with -1 where the path ends."""
+    lengths = processor.length_range(lo, hi)
+    nxt = np.arange(lo, hi, dtype=np.int64) + lengths
+    nxt[(lengths == 0) | (nxt >= value_limit)] = -1
+    return nxt
+
+def _min_ancestors(nxt, lo, hi, values):
+    """
+    In place: values[u] becomes the minimum over u and every in-chunk node
+    whose path reaches u. Pointer doubling: in round j each node pushes its
+    value 2^j steps ahead, then the pointers double, so a chunk takes at
+    most log2(len(nxt)) rounds.
+    """
+    ptr = np.where((nxt >= 0) & (nxt < hi), nxt - lo, -1)
+    live = np.flatnonzero(ptr >= 0)
+    while live.size:
+        target = ptr[live]
+        pushed = values[live]
+        np.minimum.at(values, target, pushed)
+        jump = ptr[target]
+        ptr[live] = jump
+        live = live[jump >= 0]
+
+def _follow(ptr, value, depth, done):
+    """
+    In-chunk list ranking. Unfinished nodes point (ptr, local index) at the
+    next node; finished nodes hold their final value and depth. Each
+    unfinished node takes the value of the first finished node along its
+    pointers, and its depth plus the steps to get there. Pointer jumping:
+    O(log) rounds, each over the nodes still unfinished.
+    """
+    steps = np.ones(len(ptr), dtype=np.int64)
+    todo = np.flatnonzero(~done)
+    while todo.size:
+        p = ptr[todo]
+        ready = done[p]
+        u, pu = todo[ready], p[ready]
+        value[u] = value[pu]
+        depth[u] = np.where(depth[pu] < 0, -1, steps[u] + depth[pu])
+        done[u] = True
+
+        u, pu = todo[~ready], p[~ready]
+        steps[u] += steps[pu]
+        ptr[u] = ptr[pu]
+        todo = u
+
+# --- 2. Labelling ---
+
+def _open_labels(out_dir, value_limit, mode):
+    os.makedirs(out_dir, exist_ok=True)
+    return {
+        name: np.lib.format.open_memmap(os.path.join(out_dir, f"{name}.npy"), mode=mode,
+                                        dtype=np.int32, shape=(value_limit,))
+        for name in LABELS
+    }
+
+def label_basins(processor, value_limit, out_dir, chunk_size=CHUNK_SIZE, progress=None):
+    """
+    Writes the labels of every n in [0, value_limit) to out_dir/<label>.npy
+    and a summary (basin sizes per river) to out_dir/basins.json.
+    Returns the summary. `progress`, if given, is called as
+    progress(pass_name, done, total) after each chunk.
+    """
+    if value_limit >= np.iinfo(np.int32).max:
+        raise ValueError("Basin labels are int32: value_limit must stay below 2^31 - 1")
+    labels = _open_labels(out_dir, value_limit, "w+")
+    source = labels["source"]
+    chunks = [(lo, min(lo + chunk_size, value_limit)) for lo in range(0, value_limit, chunk_size)]
+
+    # Ascending pass: source. Values pushed past a chunk wait in `carry`,
+    # indexed from the start of the next chunk.
+    carry = np.empty(0, dtype=np.int64)
+    max_step = 0
+    for done, (lo, hi) in enumerate(chunks, 1):
+        nxt = _successors(processor, lo, hi, value_limit)
+        values = np.arange(lo, hi, dtype=np.int64)
+        steps = nxt - values
+        if (nxt >= 0).any():
+            max_step = max(max_step, int(steps[nxt >= 0].max()))
+        head = min(len(carry), hi - lo)
+        np.minimum(values[:head], carry[:head], out=values[:head])
+        _min_ancestors(nxt, lo, hi, values)
+        source[lo:hi] = values
+
+        spill = np.flatnonzero(nxt >= hi)
+        rest = carry[hi - lo:]
+        span = max(len(rest), int(nxt[spill].max()) - hi + 1 if spill.size else 0)
+        carry = np.full(span, np.iinfo(np.int64).max, dtype=np.int64)
+        carry[:len(rest)] = rest
+        np.minimum.at(carry, nxt[spill] - hi, values[spill])
+        if progress: progress("source", done, len(chunks))
+
+    # Descending pass: river root, then the first node after n whose source
+    # is smaller than n's own. Labels of nodes above the chunk come from the
+    # chunks before (kept in `above`, indexed from hi); no node looks further
+    # ahead than the longest step.
+    sizes = {}
+    empty = np.empty(0, dtype=np.int64)
+    above = {"root": empty, "next": empty, "depth": empty}
+    for done, (lo, hi) in enumerate(reversed(chunks), 1):
+        nxt = _successors(processor, lo, hi, value_limit)
+        above = {key: array[:max_step] for key, array in above.items()}
+        nodes = np.arange(lo, hi, dtype=np.int64)
+        src = source[lo:hi].astype(np.int64)
+        inside = (nxt >= 0) & (nxt < hi)
+        outside = nxt >= hi
+        local = np.where(inside, nxt - lo, 0)
+
+        # Root of each path: the last node below value_limit
+        root = np.where(nxt < 0, nodes, 0)
+        root[outside] = above["root"][nxt[outside] - hi]
+        _follow(local.copy(), root, np.zeros(hi - lo, dtype=np.int64), ~inside)
+
+        # First smaller-source node after n
+        nxt_src = np.full(hi - lo, -1, dtype=np.int64)
+        nxt_src[inside] = src[nxt[inside] - lo]
+        nxt_src[outside] = source[nxt[outside]]
+        drops = (nxt >= 0) & (nxt_src < src)
+        next_node = np.where(drops, nxt, -1)
+        depth = np.where(drops, 1, -1)
+        carried = outside & ~drops
+        next_node[carried] = above["next"][nxt[carried] - hi]
+        depth[carried] = np.where(above["depth"][nxt[carried] - hi] < 0, -1,
+                                  1 + above["depth"][nxt[carried] - hi])
+        _follow(local.copy(), next_node, depth, ~inside | drops)
+
+        river = source[root]
+        own = src < nodes # Already on a smaller integer's path
+        labels["river"][lo:hi] = river
+        labels["merge_target"][lo:hi] = np.where(own, nodes, next_node)
+        labels["merge_depth"][lo:hi] = np.where(own, 0, depth)
+
+        ids, counts = np.unique(river, return_counts=True)
+        for river_id, count in zip(ids.tolist(), counts.tolist()):
+            sizes[river_id] = sizes.get(river_id, 0) + count
+
+        above = {"root": np.concatenate([root, above["root"]]),
+                 "next": np.concatenate([next_node, above["next"]]),
+                 "depth": np.concatenate([depth, above["depth"]])}
+        if progress: progress("rivers", done, len(chunks))
+
+    for array in labels.values():
+        array.flush()
+
+    summary = {
+        "language": processor.name,
+        "value_limit": value_limit,
+        "rivers": [{"river": river_id, "size": size}
+                   for river_id, size in sorted(sizes.items(), key=lambda item: (-item[1], item[0]))],
+    }
+    with open(os.path.join(out_dir, "basins.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+# --- 3. Queries ---
+
+class BasinLabels:
+    """Read-only, memory-mapped view of a labelled range."""
+
+    def __init__(self, out_dir):
+        with open(os.path.join(out_dir, "basins.json"), encoding="utf-8") as f:
+            self.summary = json.load(f)
+        self.value_limit = self.summary["value_limit"]
+        self.arrays = {name: np.load(os.path.join(out_dir, f"{name}.npy"), mmap_mode="r")
+                       for name in LABELS}
+
+    def label(self, n):
+        """{"n", "source", "river", "merge_target", "merge_depth"} for one integer."""
+        if not 0 <= n < self.value_limit:
+            raise ValueError(f"{n} is outside the labelled range [0, {self.value_limit})")
+        label = {"n": n}
+        label.update({name: int(array[n]) for name, array in self.arrays.items()})
+        return label
+
+    def river(self, n):
+        return int(self.arrays["river"][n])
+
+    def basin_sizes(self):
+        """{river: number of integers in its basin}, largest first."""
+        return {entry["river"]: entry["size"] for entry in self.summary["rivers"]}
+
+def default_out_dir(name, value_limit):
+    slug = re.sub(r"[^\w.-]+", "_", name).strip("_") or "language"
+    return os.path.join(DEFAULT_BASIN_DIR, f"{slug}.{value_limit}")
+
+def print_chunk_progress(pass_name, done, total):
+    print(f"  ... {pass_name}: {done}/{total} chunks", flush=True)
+
+# --- 4. Main Execution ---
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Label every integer below --limit with its river and merge point.")
+    parser.add_argument("language", help="A .lang file, or 'english' for the built-in English rules")
+    parser.add_argument("--limit", type=parse_count, default=10**6, help="Label 0 .. LIMIT-1 (e.g. 1e9)")
+    parser.add_argument("--out", help="Output directory (default results/basins/<language>.<limit>)")
+    parser.add_argument("--chunk", type=parse_count, default=CHUNK_SIZE, help="Integers per chunk")
+    parser.add_argument("--query", type=parse_count, nargs="*", default=[], help="Print the labels of these integers")
+    parser.add_argument("--reuse", action="store_true", help="Only answer --query from existing labels")
+    parser.add_argument("--progress", action="store_true", help="Print progress per chunk")
+    args = parser.parse_args()
+
+    if args.language.lower() == "english":
+        processor = WesternProcessor("English", ENGLISH_RULES)
+    else:
+        processor = parse_lang_file(args.language)["processor"]
+    out_dir = args.out or default_out_dir(processor.name, args.limit)
+
+    if not args.reuse:
+        print(f"Labelling 0-{args.limit - 1:,} for {processor.name} into {out_dir} ...")
+        summary = label_basins(processor, args.limit, out_dir, args.chunk,
+                               print_chunk_progress if args.progress else None)
+        print(f"{len(summary['rivers'])} rivers. Largest basins:")
+        for entry in summary["rivers"][:10]:
+            print(f"  River {entry['river']:<12} {entry['size']:>14,} integers "
+                  f"({entry['size'] / args.limit:.2%})")
+
+    if args.query:
+        labels = BasinLabels(out_dir)
+        for n in args.query:
+            print(labels.label(n))
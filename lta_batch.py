@@ -0,0 +1,142 @@
+# --- LTA Batch Runner ---
+# Fans a per-language task out across all cores with ProcessPoolExecutor.
+#
+# Every task runs isolated: an exception or a timeout in one language becomes
+# a failed result for that language and the batch keeps going. Results are
+# plain dicts (picklable, structured) instead of captured stdout.
+
+import os
+import time
+import signal
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+from linguistic_topology_app import simulate_language
+from lta_cache import TrajectoryCache
+from lta_rulepack import open_pack, load_lang_file
+
+DEFAULT_TIMEOUT = 300 # Seconds per language
+
+class TaskTimeout(BaseException):
+    """
+    Raised by SIGALRM inside a task. Not an Exception, so the engine's
+    `except Exception` fallbacks (a failed length counts as 0) cannot turn
+    a timeout into a silently truncated, "ok" result.
+    """
+
+def _on_alarm(signum, frame):
+    raise TaskTimeout()
+
+def run_isolated(task, item, timeout=DEFAULT_TIMEOUT):
+    """
+    Runs task(item) and returns a result dict:
+    {"item", "ok", "result", "error", "elapsed"}.
+    The timeout is enforced inside the worker with SIGALRM where available,
+    so a stuck language frees its worker instead of blocking the pool.
+    """
+    use_alarm = bool(timeout) and hasattr(signal, "setitimer")
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    start = time.time()
+    result = None
+    error = None
+    try:
+        result = task(item)
+    except TaskTimeout:
+        error = f"Timed out after {timeout}s"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    return {
+        "item": item,
+        "ok": error is None,
+        "result": result,
+        "error": error,
+        "elapsed": time.time() - start,
+    }
+
+def _crashed(item, error):
+    return {"item": item, "ok": False, "result": None,
+            "error": f"Worker crashed: {error}", "elapsed": 0.0}
+
+def run_batch(items, task, max_workers=None, timeout=DEFAULT_TIMEOUT, progress=None):
+    """
+    Runs task(item) for every item across a process pool.
+    Returns the result dicts in the order of `items`. `task` must be a
+    module-level function (or functools.partial of one) so it can be pickled.
+    `progress`, if given, is called with each result as it completes.
+    max_workers=1 runs in-process, which is handy for debugging.
+
+    At most max_workers items are in flight, so when a worker dies outright
+    (e.g. killed for memory) only those items are suspects: each is re-run
+    alone in a fresh one-worker pool, where only the one that crashes again
+    is recorded as crashed, and the rest of the batch continues on a new pool.
+    """
+    items = list(items)
+    results = [None] * len(items)
+
+    def finish(i, res):
+        results[i] = res
+        if progress: progress(res)
+
+    if max_workers == 1:
+        for i, item in enumerate(items):
+            finish(i, run_isolated(task, item, timeout))
+        return results
+
+    max_workers = max_workers or os.cpu_count() or 1
+    pending = list(reversed(range(len(items)))) # Popped from the end, in item order
+    suspects = []
+    while pending or suspects:
+        if suspects:
+            i = suspects.pop(0)
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                try:
+                    res = pool.submit(run_isolated, task, items[i], timeout).result()
+                except BrokenProcessPool as e:
+                    res = _crashed(items[i], e)
+            finish(i, res)
+            continue
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            running = {}
+            try:
+                while pending or running:
+                    while pending and len(running) < max_workers:
+                        i = pending.pop()
+                        running[pool.submit(run_isolated, task, items[i], timeout)] = i
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finish(running[future], future.result())
+                        del running[future]
+            except BrokenProcessPool:
+                # Keep what finished before the crash; retry the rest one by one
+                for future, i in sorted(running.items(), key=lambda fi: fi[1]):
+                    if future.done() and not future.cancelled() and future.exception() is None:
+                        finish(i, future.result())
+                    else:
+                        suspects.append(i)
+    return results
+
+# --- Language Tasks ---
+
+def simulate_file(lang_file, cache_dir=None, config=None, pack_path=None):
+    """
+    Parses and simulates one .lang file; returns the simulate_language() dict.
+    `config` (a lta_engine.SimulationConfig) is pickled to the worker, so its
+    progress callback must be a module-level function. With a rule pack the
+    file is only re-parsed if it changed since the pack was built.
+    """
+    cache = TrajectoryCache(cache_dir) if cache_dir else None
+    pack = open_pack(pack_path) if pack_path else None
+    try:
+        lang_data = load_lang_file(lang_file, pack)
+    finally:
+        if pack is not None: pack.close()
+    return simulate_language(lang_data, cache, config)
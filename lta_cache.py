@@ -0,0 +1,143 @@
+# --- LTA Trajectory Cache ---
+# Persists simulation results per language so batch scripts only recompute
+# languages whose rules changed.
+#
+# Each entry is a NumPy .npz file under results/trajectory_cache/, named after
+# the language and the consumer ("tag"). The file stores the hash of the parsed
+# rules, math type and simulation limits it was built from; a mismatch means
+# the .lang file (or the limits) changed and the entry is rebuilt.
+
+import os
+import re
+import json
+import hashlib
+
+import numpy as np
+
+import lta_engine
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "trajectory_cache")
+
+# --- 1. Keys ---
+
+def _canonical(value):
+    """Makes parsed rules JSON friendly (int dict keys -> sorted pairs)."""
+    if isinstance(value, dict):
+        return sorted([str(k), _canonical(v)] for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+def rules_hash(rules, math_type, **limits):
+    """Hash of the parsed rules, math type and simulation limits."""
+    payload = {
+        "version": CACHE_VERSION,
+        "math_type": str(math_type).lower(),
+        "rules": _canonical(rules),
+        "limits": _canonical(limits),
+    }
+    blob = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+# --- 2. Storage ---
+
+class TrajectoryCache:
+    """One .npz per (language, tag) under cache_dir."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, name, tag):
+        slug = re.sub(r"[^\w.-]+", "_", name).strip("_") or "language"
+        return os.path.join(self.cache_dir, f"{slug}.{tag}.npz")
+
+    def load(self, name, tag, key):
+        """Returns the stored arrays, or None if missing or stale."""
+        path = self._path(name, tag)
+        if os.path.exists(path):
+            try:
+                with np.load(path, allow_pickle=False) as data:
+                    if str(data["key"]) == key:
+                        self.hits += 1
+                        return {k: data[k] for k in data.files if k != "key"}
+            except (OSError, ValueError, KeyError):
+                pass # Corrupt or partial entry: rebuild it
+        self.misses += 1
+        return None
+
+    def save(self, name, tag, key, **arrays):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(name, tag)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        # Write then rename, so concurrent readers never see half a file
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(f, key=np.array(key), **arrays)
+        os.replace(tmp_path, path)
+
+# --- 3. Trajectories ---
+
+def paths_to_arrays(paths):
+    """{seed: [nodes]} -> (seeds, offsets, nodes) in CSR layout."""
+    seeds = np.fromiter(paths.keys(), dtype=np.int64, count=len(paths))
+    lengths = np.fromiter((len(p) for p in paths.values()), dtype=np.int64, count=len(paths))
+    offsets = np.zeros(len(paths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    nodes = np.fromiter((n for p in paths.values() for n in p), dtype=np.int64, count=int(offsets[-1]))
+    return seeds, offsets, nodes
+
+def arrays_to_paths(seeds, offsets, nodes):
+    """Inverse of paths_to_arrays."""
+    return {
+        int(seed): nodes[offsets[i]:offsets[i + 1]].tolist()
+        for i, seed in enumerate(seeds)
+    }
+
+def load_or_compute_paths(cache, lang_data, tag, config):
+    """
+    Returns {seed: path} over config.seeds for the classic simulation loop
+    (a lta_engine.SimulationConfig), reading it from the cache when the
+    language's rules and the limits are unchanged.
+    """
+    seeds = config.seeds
+    key = rules_hash(lang_data["rules"], lang_data.get("math_type", "western"),
+                     seeds=[seeds.start, seeds.stop], value_limit=config.value_limit,
+                     max_steps=config.max_steps)
+
+    if cache is not None:
+        data = cache.load(lang_data["name"], tag, key)
+        if data is not None:
+            return arrays_to_paths(data["seeds"], data["offsets"], data["nodes"])
+
+    graph = lta_engine.ConvergenceGraph.from_config(lang_data["processor"], config)
+    paths = {}
+    for done, seed in enumerate(seeds, 1):
+        paths[seed] = graph.path(seed)
+        config.report_progress(done)
+
+    if cache is not None:
+        seed_arr, offsets, nodes = paths_to_arrays(paths)
+        cache.save(lang_data["name"], tag, key, seeds=seed_arr, offsets=offsets, nodes=nodes)
+    return paths
+
+# --- 4. Jump Tables ---
+
+def load_or_build_jump_table(cache, lang_data, value_limit):
+    """
+    Returns a lta_engine.JumpTable over [0, value_limit) for the language,
+    reading it from the cache when the rules and the limit are unchanged.
+    """
+    key = rules_hash(lang_data["rules"], lang_data.get("math_type", "western"),
+                     value_limit=value_limit, index="jumps")
+
+    if cache is not None:
+        data = cache.load(lang_data["name"], "jumps", key)
+        if data is not None:
+            return lta_engine.JumpTable.from_arrays(data["lengths"], data["up"])
+
+    jumps = lta_engine.JumpTable.from_processor(lang_data["processor"], value_limit)
+    if cache is not None:
+        cache.save(lang_data["name"], "jumps", key, **jumps.to_arrays())
+    return jumps
@@ -0,0 +1,299 @@
+# --- LTA Conversion Pipeline ---
+# Converts a library of documents (EPUB, DOCX, DOC, PDF, images) to .txt with
+# a bounded worker pool, instead of one file and one pdftotext call at a time.
+#
+# Jobs are split by what they wait on. PDF, DOC and image jobs run an external
+# tool (pdftotext, strings, tesseract), so a thread only waits on a child
+# process and threads are enough. EPUB and DOCX jobs inflate zip members and
+# parse markup in Python, which holds the GIL, so they go to a process pool
+# through lta_batch.run_batch. Both pools run at the same time.
+#
+# Every outcome is appended to a JSONL manifest: source, output, size, mtime,
+# SHA-256, status, timing and the calculate_accuracy score. On the next run a
+# source is skipped when its output exists and its mtime and size match the
+# manifest, or, if only the mtime moved (a copy or a touch), when its hash
+# still does.
+
+import os
+import re
+import json
+import time
+import hashlib
+import zipfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from lta_epub import write_epub_text
+
+MANIFEST_NAME = "conversion_manifest.jsonl"
+TOOL_TIMEOUT = 600 # Seconds per external tool run
+HASH_BLOCK = 1 << 20
+
+# --- 1. Scoring ---
+
+PRINTABLE = re.compile(r'[a-zA-Z0-9\s.,!?;:()\'"-\[\]]')
+
+def calculate_accuracy(text):
+    if not text:
+        return 0.0
+    # Count printable characters and common whitespace
+    # We want to penalize "garbage" characters or replacement chars.
+    printable_chars = len(PRINTABLE.findall(text))
+    # Check for replacement characters or weird control codes (excluding standard whitespace)
+    replacement_chars = text.count('\ufffd')
+    return accuracy_from_counts(len(text), printable_chars, replacement_chars)
+
+def accuracy_from_counts(total_chars, printable_chars, replacement_chars):
+    if total_chars == 0:
+        return 0.0
+
+    # Simple heuristic: Ratio of good chars to total.
+    accuracy = (printable_chars / total_chars) * 100
+
+    # Penalize specific "bad" indicators heavily
+    if replacement_chars > 0:
+        accuracy -= (replacement_chars / total_chars) * 100 * 2 # Double penalty
+
+    return max(0.0, min(100.0, accuracy))
+
+class ScoredWriter:
+    """
+    Wraps a text file and keeps calculate_accuracy's counts of everything
+    written through it, so a streamed output is scored without re-reading it.
+    Every counted pattern is a single character, so the counts add up over
+    writes.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.chars = 0
+        self.printable = 0
+        self.replacement = 0
+        self.has_text = False # Anything but whitespace was written
+
+    def write(self, text):
+        self.f.write(text)
+        self.chars += len(text)
+        self.printable += len(PRINTABLE.findall(text))
+        self.replacement += text.count('\ufffd')
+        if not self.has_text and text.strip():
+            self.has_text = True
+
+    def accuracy(self):
+        return accuracy_from_counts(self.chars, self.printable, self.replacement)
+
+# --- 2. Extractors ---
+# Each takes a source path and returns its text, or raises. An extractor
+# with a true `writes_text` attribute is called as extractor(path, out)
+# instead and streams the text into the writer `out`.
+
+TAG = re.compile(r'<[^>]+>')
+SPACE = re.compile(r'\s+')
+
+def strip_markup(content):
+    """Simple HTML/XML tag stripping, whitespace collapsed."""
+    return SPACE.sub(' ', TAG.sub(' ', content)).strip()
+
+def extract_epub(path, out):
+    # One line per spine document, streamed (lta_epub)
+    write_epub_text(path, out)
+extract_epub.writes_text = True
+
+def extract_docx(path):
+    with zipfile.ZipFile(path, 'r') as z:
+        return strip_markup(z.read('word/document.xml').decode('utf-8', errors='ignore'))
+
+def _run_tool(args):
+    proc = subprocess.run(args, capture_output=True, check=True, timeout=TOOL_TIMEOUT)
+    return proc.stdout.decode('utf-8', errors='ignore')
+
+def extract_pdf(path):
+    return _run_tool(["pdftotext", path, "-"])
+
+def extract_doc(path):
+    # Legacy Word files: printable strings only
+    return _run_tool(["strings", path])
+
+def extract_ocr(path):
+    return _run_tool(["tesseract", path, "stdout"])
+
+# extension -> (extractor, pool); "threads" for external tools, "processes" for Python parsing
+EXTRACTORS = {
+    ".epub": (extract_epub, "processes"),
+    ".docx": (extract_docx, "processes"),
+    ".pdf": (extract_pdf, "threads"),
+    ".doc": (extract_doc, "threads"),
+}
+IMAGE_EXTRACTORS = {ext: (extract_ocr, "threads") for ext in (".jpg", ".jpeg", ".png", ".bmp", ".tiff")}
+
+# --- 3. Jobs ---
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def _source_record(source, output):
+    st = os.stat(source)
+    return {"source": source, "output": output, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+def convert_file(job):
+    """
+    Converts job = (source, output, extractor) and returns its manifest
+    record. The output is written to a temporary file and renamed, so an
+    interrupted run never leaves a partial .txt that looks converted.
+    """
+    source, output, extractor = job
+    start = time.time()
+    record = _source_record(source, output)
+    record["sha256"] = file_digest(source)
+    tmp_path = f"{output}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            out = ScoredWriter(f)
+            if getattr(extractor, "writes_text", False):
+                extractor(source, out)
+            else:
+                out.write(extractor(source))
+        if not out.has_text:
+            raise ValueError("no text extracted")
+        os.replace(tmp_path, output)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    record.update(status="converted", chars=out.chars, accuracy=out.accuracy(),
+                  elapsed=time.time() - start)
+    return record
+
+def _failed(job, error, elapsed):
+    source, output, _ = job
+    try:
+        record = _source_record(source, output)
+    except OSError:
+        record = {"source": source, "output": output}
+    record.update(status="failed", error=error, elapsed=elapsed)
+    return record
+
+def _convert_in_thread(job):
+    start = time.time()
+    try:
+        return convert_file(job)
+    except Exception as e:
+        return _failed(job, f"{type(e).__name__}: {e}", time.time() - start)
+
+# --- 4. Manifest ---
+
+class ConversionManifest:
+    """Append-only JSONL log of conversions; the last record per source wins."""
+
+    def __init__(self, path):
+        self.path = path
+        self.records = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue # Torn last line of an interrupted run
+                    self.records[record["source"]] = record
+
+    def append(self, record):
+        """Safe to call from any thread."""
+        record = dict(record, time=time.strftime('%Y-%m-%d %H:%M:%S'))
+        with self._lock:
+            self.records[record["source"]] = record
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def up_to_date(self, source, output):
+        """
+        None if source must be converted. Otherwise it is skipped: {} when the
+        manifest already says so, or a record to append when the skip was
+        decided by hash, or by an output written before there was a manifest.
+        """
+        if not os.path.exists(output):
+            return None
+        st = os.stat(source)
+        previous = self.records.get(source)
+        if previous and previous.get("output") == output and previous.get("sha256") \
+                and previous["status"] in ("converted", "skipped"):
+            if previous["mtime_ns"] == st.st_mtime_ns and previous["size"] == st.st_size:
+                return {}
+            if previous["size"] == st.st_size and file_digest(source) == previous["sha256"]:
+                return dict(previous, status="skipped", mtime_ns=st.st_mtime_ns, elapsed=0.0)
+            return None
+        if previous is None and os.stat(output).st_mtime_ns >= st.st_mtime_ns:
+            # Converted before there was a manifest
+            return dict(_source_record(source, output), sha256=file_digest(source),
+                        status="skipped", elapsed=0.0)
+        return None
+
+# --- 5. Pipeline ---
+
+def output_path(source, out_dir=None):
+    """name.txt in out_dir, or next to the source."""
+    base = os.path.splitext(os.path.basename(source))[0] + ".txt"
+    return os.path.join(out_dir or os.path.dirname(source), base)
+
+def convert_library(paths, out_dir=None, manifest_path=None, workers=None, extractors=EXTRACTORS,
+                    force=False, timeout=TOOL_TIMEOUT, progress=None):
+    """
+    Converts every path whose extension has an extractor and returns the
+    manifest records of this run, in the order of `paths`. Up to `workers`
+    threads run tool jobs while up to `workers` processes run Python jobs;
+    workers=1 converts everything in-process. `progress`, if given, is called
+    with each record as it completes (from any thread).
+    """
+    workers = workers or os.cpu_count() or 1
+    if manifest_path is None:
+        manifest_path = os.path.join(out_dir or ".", MANIFEST_NAME)
+    manifest = ConversionManifest(manifest_path)
+    records = [None] * len(paths)
+    lock = threading.Lock()
+
+    def finish(i, record):
+        manifest.append(record)
+        with lock:
+            records[i] = record
+        if progress: progress(record)
+
+    thread_jobs, process_jobs = [], []
+    for i, source in enumerate(paths):
+        ext = os.path.splitext(source)[1].lower()
+        output = output_path(source, out_dir)
+        if ext not in extractors:
+            records[i] = {"source": source, "output": output, "status": "unsupported"}
+            continue
+        if not os.path.isfile(source):
+            finish(i, _failed((source, output, None), "source not found", 0.0))
+            continue
+        skip = None if force else manifest.up_to_date(source, output)
+        if skip is not None:
+            if skip: manifest.append(skip)
+            records[i] = skip or dict(manifest.records[source], status="skipped", elapsed=0.0)
+            continue
+        extractor, pool = extractors[ext]
+        job = (source, output, extractor)
+        (thread_jobs if pool == "threads" and workers > 1 else process_jobs).append((i, job))
+
+    with ThreadPoolExecutor(max_workers=workers) as threads:
+        for i, job in thread_jobs:
+            future = threads.submit(_convert_in_thread, job)
+            future.add_done_callback(lambda f, i=i: finish(i, f.result()))
+
+        if process_jobs:
+            from lta_batch import run_batch
+            order = {job[0]: i for i, job in process_jobs}
+
+            def on_result(res):
+                record = res["result"] if res["ok"] else _failed(res["item"], res["error"], res["elapsed"])
+                finish(order[res["item"][0]], record)
+
+            run_batch([job for _, job in process_jobs], convert_file, max_workers=workers,
+                      timeout=timeout, progress=on_result)
+    return records
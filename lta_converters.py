@@ -6,6 +6,8 @@ import ebooklib
 from ebooklib import epub
 import bs4
 
+import lta_convert
+
 def docx_to_text(path):
     """Extracts text from a .docx file."""
     try:
@@ -80,6 +82,46 @@ def convert_document_to_text(input_path):
         
     print(result_message)
 
+def _checked(text):
+    if text.startswith("[ERROR]"):
+        raise RuntimeError(text[len("[ERROR] "):])
+    return text
+
+def docx_text_or_raise(path):
+    return _checked(docx_to_text(path))
+
+def epub_text_or_raise(path):
+    return _checked(epub_to_text(path))
+
+# The pipeline's extractors, with python-docx and ebooklib for the zip formats
+DOCUMENT_EXTRACTORS = {
+    ".docx": (docx_text_or_raise, "processes"),
+    ".epub": (epub_text_or_raise, "processes"),
+    ".pdf": (lta_convert.extract_pdf, "threads"),
+}
+
+def convert_documents(input_paths, workers=None, manifest_path=None, force=False):
+    """
+    convert_document_to_text() for many files at once: each .txt is written
+    next to its source by a bounded pool (lta_convert.convert_library), files
+    already converted are skipped, and every outcome goes to a JSONL manifest
+    (conversion_manifest.jsonl in the working directory by default).
+    Returns the manifest records.
+    """
+    def report(record):
+        name = os.path.basename(record["source"])
+        if record["status"] == "converted":
+            print(f"[SUCCESS] {name} converted to {record['output']} ({record['elapsed']:.1f}s)")
+        elif record["status"] == "failed":
+            print(f"[ERROR] {name}: {record['error']}")
+
+    records = lta_convert.convert_library(list(input_paths), manifest_path=manifest_path, workers=workers,
+                                          extractors=DOCUMENT_EXTRACTORS, force=force, progress=report)
+    for record in records:
+        if record["status"] == "unsupported":
+            print(f"[ERROR] Unsupported document type: {os.path.splitext(record['source'])[1].lower()}")
+    return records
+
 def convert_image_format(input_path, output_format):
     """
     Converts an image to a different format.
@@ -0,0 +1,245 @@
+# --- LTA Corpus Store ---
+# Keeps a text corpus content-addressed and indexed, so reorganizing it only
+# touches files that are new or changed since the last run.
+#
+# A SQLite index (index.sqlite under the store directory) remembers every
+# scanned file's path, size, mtime and BLAKE2b digest, and every stored
+# content's detected language and topic tags. A file whose size and mtime
+# match its row keeps its digest without being read. Duplicates are found
+# size first: only files sharing a size get their first HEAD_BYTES hashed,
+# and only files sharing size and head get a full hash. Organized texts are
+# also copied to objects/<2 hex>/<digest>.txt, one copy per distinct content.
+
+import os
+import json
+import shutil
+import sqlite3
+import hashlib
+from collections import Counter
+
+DIGEST_SIZE = 20 # BLAKE2b bytes; 40 hex characters
+HEAD_BYTES = 1 << 16 # Prefix hashed to tell same-size files apart
+HASH_BLOCK = 1 << 20
+STORE_DIR = "Corpus_Store"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    head TEXT,              -- digest of the first HEAD_BYTES, once needed
+    digest TEXT,            -- digest of the whole file, once needed
+    organized INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS files_size ON files (size);
+CREATE INDEX IF NOT EXISTS files_digest ON files (digest);
+CREATE TABLE IF NOT EXISTS content (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    language TEXT,
+    topics TEXT             -- JSON list of topic tags
+);
+"""
+
+# --- 1. Digests ---
+
+def bytes_digest(data):
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+def file_digest(path, limit=None):
+    """BLAKE2b of a file, or of its first `limit` bytes."""
+    h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    remaining = limit
+    with open(path, 'rb') as f:
+        while remaining is None or remaining > 0:
+            block = f.read(HASH_BLOCK if remaining is None else min(HASH_BLOCK, remaining))
+            if not block:
+                break
+            h.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+    return h.hexdigest()
+
+# --- 2. Language ---
+
+SCRIPTS = [
+    ("greek", 0x0370, 0x03FF), ("cyrillic", 0x0400, 0x04FF), ("hebrew", 0x0590, 0x05FF),
+    ("arabic", 0x0600, 0x06FF), ("devanagari", 0x0900, 0x097F), ("coptic", 0x2C80, 0x2CFF),
+    ("greek", 0x1F00, 0x1FFF), ("chinese", 0x4E00, 0x9FFF),
+]
+STOPWORDS = {
+    "english": {"the", "and", "of", "to", "is", "that", "in", "it", "was"},
+    "german": {"der", "die", "und", "das", "ist", "nicht", "ein", "zu", "den"},
+    "french": {"le", "la", "les", "et", "est", "des", "une", "que", "du"},
+    "spanish": {"el", "los", "las", "y", "que", "es", "una", "del", "por"},
+    "latin": {"et", "est", "non", "ad", "cum", "quod", "sed", "ut", "enim"},
+}
+
+def detect_language(text):
+    """
+    Rough language of a text sample: its dominant script, and for Latin
+    script the language whose common words it uses most. "unknown" if the
+    sample has no letters.
+    """
+    scripts = Counter()
+    for ch in text:
+        if not ch.isalpha():
+            continue
+        code = ord(ch)
+        scripts[next((name for name, lo, hi in SCRIPTS if lo <= code <= hi), "latin script")] += 1
+    if not scripts:
+        return "unknown"
+    script = scripts.most_common(1)[0][0]
+    if script != "latin script":
+        return script
+    words = Counter(text.lower().split())
+    votes = {lang: sum(words[w] for w in stop) for lang, stop in STOPWORDS.items()}
+    best = max(votes, key=votes.get)
+    return best if votes[best] else "unknown"
+
+# --- 3. Index ---
+
+class CorpusIndex:
+    """The store directory: index.sqlite plus the objects/ tree."""
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(root, "index.sqlite"))
+        self.conn.executescript(SCHEMA)
+        self.hashed_files = 0 # Files read in full this session
+        self.hashed_heads = 0
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    # --- Scanning ---
+
+    def scan(self, top, skip_dirs=(), suffix=".txt"):
+        """
+        Walks `top` and syncs the files table with it. Returns (paths, changed):
+        every matching path, and those that are new or whose size or mtime
+        changed (their digests are cleared). Rows of vanished files are dropped.
+        """
+        known = {path: (size, mtime_ns) for path, size, mtime_ns
+                 in self.conn.execute("SELECT path, size, mtime_ns FROM files")}
+        paths, changed = [], []
+        for root, dirs, files in os.walk(top):
+            dirs[:] = [d for d in dirs if d not in skip_dirs]
+            for name in files:
+                if not name.endswith(suffix):
+                    continue
+                path = os.path.join(root, name)
+                st = os.stat(path)
+                paths.append(path)
+                if known.pop(path, None) != (st.st_size, st.st_mtime_ns):
+                    changed.append(path)
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO files (path, size, mtime_ns) VALUES (?, ?, ?)",
+                        (path, st.st_size, st.st_mtime_ns))
+        self.conn.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in known])
+        self.conn.commit()
+        return paths, changed
+
+    def forget(self, path):
+        self.conn.execute("DELETE FROM files WHERE path = ?", (path,))
+        self.conn.commit()
+
+    # --- Digests ---
+
+    def _hash_column(self, paths, column):
+        """Fills head or digest for the given paths where it is still NULL; returns {path: value}."""
+        values = {}
+        for path in paths:
+            (value,) = self.conn.execute(f"SELECT {column} FROM files WHERE path = ?", (path,)).fetchone()
+            if value is None:
+                if column == "head":
+                    value = file_digest(path, HEAD_BYTES)
+                    self.hashed_heads += 1
+                else:
+                    value = file_digest(path)
+                    self.hashed_files += 1
+                self.conn.execute(f"UPDATE files SET {column} = ? WHERE path = ?", (value, path))
+            values[path] = value
+        return values
+
+    def digest(self, path):
+        """Full digest of an indexed file, hashed only if the index has none."""
+        return self._hash_column([path], "digest")[path]
+
+    def find_duplicates(self, paths):
+        """
+        Groups of identical files involving any of `paths`, each ordered with
+        the file to keep first (organized files first, then by path). Only
+        same-size files are hashed: their heads first, then in full where
+        the heads match.
+        """
+        groups = []
+        wanted = set(paths)
+        sizes = {size for path, size in self.conn.execute("SELECT path, size FROM files") if path in wanted}
+        for size in sorted(sizes):
+            rows = self.conn.execute(
+                "SELECT path, organized FROM files WHERE size = ? ORDER BY organized DESC, path", (size,)).fetchall()
+            if len(rows) < 2:
+                continue
+            order = [path for path, _ in rows]
+            heads = self._hash_column(order, "head") if size > HEAD_BYTES else {p: "" for p in order}
+            by_head = {}
+            for path in order:
+                by_head.setdefault(heads[path], []).append(path)
+            for same_head in by_head.values():
+                if len(same_head) < 2:
+                    continue
+                by_digest = {}
+                for path, value in self._hash_column(same_head, "digest").items():
+                    by_digest.setdefault(value, []).append(path)
+                groups.extend(g for g in by_digest.values() if len(g) > 1)
+        self.conn.commit()
+        return groups
+
+    def organized_path(self, digest):
+        """An organized, still existing file with this content, or None."""
+        for (path,) in self.conn.execute("SELECT path FROM files WHERE digest = ? AND organized = 1", (digest,)):
+            if os.path.exists(path):
+                return path
+        return None
+
+    # --- Storing ---
+
+    def object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest + ".txt")
+
+    def record(self, path, digest=None, language=None, topics=()):
+        """
+        Marks path as organized, stores its content under its digest (hashing
+        it only if `digest` is not given) and records the language and topic
+        tags of that content. Returns the digest.
+        """
+        st = os.stat(path)
+        if digest is None:
+            digest = file_digest(path)
+            self.hashed_files += 1
+        self.conn.execute(
+            "INSERT OR REPLACE INTO files (path, size, mtime_ns, digest, organized) VALUES (?, ?, ?, ?, 1)",
+            (path, st.st_size, st.st_mtime_ns, digest))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO content (digest, size, language, topics) VALUES (?, ?, ?, ?)",
+            (digest, st.st_size, language, json.dumps(list(topics))))
+
+        target = self.object_path(digest)
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            # A copy, not a hard link: organized files are rewritten in place
+            tmp_path = f"{target}.{os.getpid()}.tmp"
+            shutil.copyfile(path, tmp_path)
+            os.replace(tmp_path, target)
+        self.conn.commit()
+        return digest
+
+    def content(self, digest):
+        """{"size", "language", "topics"} of stored content, or None."""
+        row = self.conn.execute("SELECT size, language, topics FROM content WHERE digest = ?", (digest,)).fetchone()
+        if row is None:
+            return None
+        return {"size": row[0], "language": row[1], "topics": json.loads(row[2] or "[]")}
@@ -0,0 +1,567 @@
+# --- LTA Convergence Engine ---
+# Treats the "Erik Convergence" map n -> n + L(n) as a functional graph.
+#
+# Every integer has exactly one successor, so once a node has been labelled its
+# successor and its place on a chain never change. Seeds are traced only until
+# they reach a node that an earlier seed already labelled (or for max_steps
+# nodes); the rest of a seed's step-capped window is read from the labelled
+# chains' prefix sums, so the shared trunk below the merge point is never
+# re-walked.
+
+import math
+import bisect
+
+import numpy as np
+
+# Length tables are only built for value ranges this small; above it the
+# graph computes lengths lazily for the nodes it actually visits. Below it
+# a table is grown to the nodes in use, starting at TABLE_CHUNK entries and
+# never exceeding TABLE_DENSITY entries per node stepped so far.
+TABLE_LIMIT = 10**7
+TABLE_CHUNK = 1 << 16
+TABLE_DENSITY = 256
+
+# --- 0. Simulation Configuration ---
+
+def parse_count(text):
+    """Parses CLI integers, accepting 10000, 1e12 or 10**12."""
+    text = str(text).strip().replace("_", "")
+    if "**" in text:
+        base, exp = text.split("**", 1)
+        return int(base) ** int(exp)
+    if "e" in text.lower():
+        return int(float(text))
+    return int(text)
+
+class SimulationConfig:
+    """
+    Seed range and limits for one convergence run.
+
+    seeds are range(seed_start, seed_stop); a path never enters nodes
+    >= value_limit, keeps at most max_steps nodes, and rivers compare the
+    last tail_size nodes of paths with at least min_path nodes.
+    Full paths are only kept when store_paths is set. `progress`, if given,
+    is called as progress(done, total) every progress_every seeds.
+    """
+
+    def __init__(self, seed_start=0, seed_stop=101, value_limit=10000, max_steps=500,
+                 tail_size=20, min_path=5, store_paths=False, progress=None, progress_every=100000):
+        self.seed_start = seed_start
+        self.seed_stop = seed_stop
+        self.value_limit = value_limit
+        self.max_steps = max_steps
+        self.tail_size = tail_size
+        self.min_path = min_path
+        self.store_paths = store_paths
+        self.progress = progress
+        self.progress_every = progress_every
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(seeds={self.seed_start}:{self.seed_stop}, "
+                f"value_limit={self.value_limit}, max_steps={self.max_steps}, tail_size={self.tail_size})")
+
+    @property
+    def seeds(self):
+        return range(self.seed_start, self.seed_stop)
+
+    def limits(self):
+        """The settings that change results (used for cache keys)."""
+        return {
+            "seeds": [self.seed_start, self.seed_stop],
+            "value_limit": self.value_limit,
+            "max_steps": self.max_steps,
+            "tail_size": self.tail_size,
+            "min_path": self.min_path,
+        }
+
+    def replace(self, **changes):
+        """Returns a copy with some settings changed."""
+        settings = dict(self.__dict__)
+        settings.update(changes)
+        return SimulationConfig(**settings)
+
+    def report_progress(self, done):
+        """Calls the progress callback every progress_every seeds and at the end."""
+        total = self.seed_stop - self.seed_start
+        if self.progress and (done % self.progress_every == 0 or done == total):
+            self.progress(done, total)
+
+    # --- Command Line ---
+
+    @staticmethod
+    def add_arguments(parser):
+        """Adds --seeds/--limit/--steps/--tail options to an argparse parser."""
+        parser.add_argument("--seeds", help="Seed range START:STOP (e.g. 0:10000000)")
+        parser.add_argument("--limit", type=parse_count, help="Value ceiling (e.g. 1e12)")
+        parser.add_argument("--steps", type=parse_count, help="Maximum nodes per seed path")
+        parser.add_argument("--tail", type=int, help="Tail nodes compared between rivers")
+        parser.add_argument("--progress", action="store_true", help="Print progress while tracing seeds")
+
+    def from_args(self, args):
+        """Applies parsed CLI options on top of this config (the script's defaults)."""
+        changes = {}
+        if getattr(args, "seeds", None):
+            start, _, stop = args.seeds.partition(":")
+            if stop:
+                changes["seed_start"], changes["seed_stop"] = parse_count(start or 0), parse_count(stop)
+            else:
+                changes["seed_stop"] = parse_count(start)
+        if getattr(args, "limit", None): changes["value_limit"] = args.limit
+        if getattr(args, "steps", None): changes["max_steps"] = args.steps
+        if getattr(args, "tail", None): changes["tail_size"] = args.tail
+        if getattr(args, "progress", False):
+            changes["progress"] = print_progress
+        return self.replace(**changes)
+
+def print_progress(done, total):
+    """Default progress callback for command line runs."""
+    print(f"  ... {done:,}/{total:,} seeds traced", flush=True)
+
+# --- 1. The Functional Graph ---
+
+class Chain:
+    """
+    Consecutive stepped nodes along one path (nodes[i + 1] is the successor
+    of nodes[i]), with prefix sums for entropy: ent[i] and steps[i] are the
+    sum of log2(L) and the number of nodes with L > 0 over nodes[:i].
+    """
+    __slots__ = ("nodes", "ent", "steps")
+
+    def __init__(self):
+        self.nodes = []
+        self.ent = [0.0]
+        self.steps = [0]
+
+class ConvergenceGraph:
+    """
+    Lazily built successor graph for one language processor.
+
+    A node's path follows the same rules as the classic simulation loop:
+    nodes >= value_limit are never entered, a length of 0 (or an error in the
+    length function) ends the path on that node, and a seed keeps at most
+    max_steps nodes. Only nodes inside some seed's max_steps window are ever
+    stepped, so memory is bounded by seeds x max_steps, not by value_limit.
+
+    Stepped nodes are labelled with their place in a Chain. A seed's window
+    is read as a few chain slices (new nodes, then the chain it merged into,
+    extended only as far as the window needs), so the entropy, length and
+    tail of a seed that merges into a labelled trunk cost O(1) amortized
+    instead of a walk over max_steps nodes.
+    """
+
+    def __init__(self, processor, value_limit=10000, max_steps=500, tail_size=20, use_table=True):
+        self.processor = processor
+        self.value_limit = value_limit
+        self.max_steps = max_steps
+        self.tail_size = tail_size
+
+        # Bulk length lookups, grown on demand (see _length)
+        self.table = None
+        self.table_limit = min(value_limit, TABLE_LIMIT) if use_table else 0
+
+        # Per-node labels, filled in once per node.
+        self.successor = {}      # node -> next node (None if the path ends here)
+        self.chain = {}          # node -> (Chain, index of the node in it)
+
+        # Per-seed labels.
+        self.merge_point = {}    # seed -> first already-labelled node of its window
+
+        self._window = (None, None)
+
+    @classmethod
+    def from_config(cls, processor, config):
+        return cls(processor, value_limit=config.value_limit, max_steps=config.max_steps,
+                   tail_size=config.tail_size)
+
+    # --- Node Labelling ---
+
+    def _length(self, node):
+        """
+        L(node), from the length table where it reaches. The table covers
+        [0, 2 * node) when first needed and doubles from there, but only while
+        it stays within TABLE_DENSITY entries per stepped node, so a small
+        seed range never builds a table up to value_limit.
+        """
+        table = self.table
+        if table is not None and node < len(table):
+            return int(table[node])
+        if node < self.table_limit:
+            size = min(self.table_limit, max(2 * node + 1, 2 * len(table) if table is not None else 0))
+            if size <= TABLE_CHUNK or size <= TABLE_DENSITY * len(self.successor):
+                try:
+                    self.table = self.processor.length_table(max(size, min(TABLE_CHUNK, self.table_limit)))
+                    return int(self.table[node])
+                except Exception:
+                    self.table_limit = 0
+        try:
+            return self.processor.get_length(node)
+        except Exception:
+            return 0
+
+    def _step(self, chain, node):
+        """Computes the successor of `node`, appends the node to `chain` and returns the successor."""
+        length = self._length(node)
+        if length == 0:
+            nxt = None
+        else:
+            nxt = node + length
+            if nxt >= self.value_limit:
+                nxt = None
+        self.successor[node] = nxt
+        self.chain[node] = (chain, len(chain.nodes))
+        chain.nodes.append(node)
+        chain.ent.append(chain.ent[-1] + (math.log2(length) if length > 0 else 0.0))
+        chain.steps.append(chain.steps[-1] + (length > 0))
+        return nxt
+
+    def _extend(self, chain, size):
+        """Steps past the end of `chain` until it has `size` nodes, its path ends or it meets a labelled node."""
+        nxt = self.successor[chain.nodes[-1]]
+        while len(chain.nodes) < size and nxt is not None and nxt not in self.chain:
+            nxt = self._step(chain, nxt)
+
+    def trace(self, seed):
+        """
+        Labels the nodes of `seed`'s window up to the first node that is
+        already labelled (at most max_steps nodes). Returns that merge
+        point, or None if the window never meets an earlier one.
+        """
+        if seed in self.merge_point:
+            return self.merge_point[seed]
+        if seed >= self.value_limit:
+            self.merge_point[seed] = None # Never entered: an empty path
+            return None
+
+        chain = Chain()
+        curr = seed
+        while curr is not None and curr not in self.chain and len(chain.nodes) < self.max_steps:
+            curr = self._step(chain, curr)
+
+        merge = curr if curr in self.chain and len(chain.nodes) < self.max_steps else None
+        self.merge_point[seed] = merge
+        return merge
+
+    def _slices(self, seed):
+        """
+        The seed's (step capped) path as (count, entropy sum, entropy steps,
+        [(chain, start, stop), ...]). The last seed's result is kept, since
+        the river pass asks for its length and its tail in turn.
+        """
+        if self._window[0] == seed:
+            return self._window[1]
+        self.trace(seed)
+
+        slices = []
+        total = 0.0
+        steps = 0
+        budget = self.max_steps
+        node = seed if seed < self.value_limit else None
+        while node is not None and budget > 0:
+            chain, start = self.chain[node]
+            if len(chain.nodes) - start < budget:
+                self._extend(chain, start + budget)
+            stop = min(len(chain.nodes), start + budget)
+            slices.append((chain, start, stop))
+            total += chain.ent[stop] - chain.ent[start]
+            steps += chain.steps[stop] - chain.steps[start]
+            budget -= stop - start
+            node = self.successor[chain.nodes[stop - 1]] if budget else None
+
+        window = (self.max_steps - budget, total, steps, slices)
+        self._window = (seed, window)
+        return window
+
+    # --- Seed Queries ---
+
+    def walk(self, node, steps):
+        """Follows recorded successors for `steps` hops (no length calls)."""
+        for _ in range(steps):
+            node = self.successor[node]
+        return node
+
+    def path(self, seed):
+        """The (step capped) path of a seed."""
+        nodes = []
+        for chain, start, stop in self._slices(seed)[3]:
+            nodes.extend(chain.nodes[start:stop])
+        return nodes
+
+    def path_length(self, seed):
+        """Number of nodes in the (step capped) path of a seed."""
+        return self._slices(seed)[0]
+
+    def tail(self, seed):
+        """The last `tail_size` nodes of the seed's path, as a tuple."""
+        nodes = []
+        wanted = self.tail_size
+        for chain, start, stop in reversed(self._slices(seed)[3]):
+            if len(nodes) >= wanted:
+                break
+            nodes[:0] = chain.nodes[max(start, stop - (wanted - len(nodes))):stop]
+        return tuple(nodes)
+
+    def entropy(self, seed):
+        """Returns (sum of log2 L, contributing steps) over the seed's path."""
+        _, total, steps, _ = self._slices(seed)
+        return total, steps
+
+
+# --- 2. River Clustering ---
+
+class DisjointSet:
+    """Union-find over graph nodes (union by size, path halving)."""
+
+    def __init__(self):
+        self.parent = {}
+        self.size = {}
+
+    def find(self, node):
+        parent = self.parent
+        if node not in parent:
+            parent[node] = node
+            self.size[node] = 1
+            return node
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, a, b):
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return root_a
+
+
+def group_rivers(graph, seeds, min_path=5):
+    """
+    Groups seeds into rivers: seeds whose tails share any node are joined.
+    Returns a list of (tail, members) in order of each river's first seed,
+    where `tail` is the tail of that first seed.
+
+    Joining is transitive: if A's tail meets B's and B's meets C's, all three
+    form one river even when A's and C's tails are disjoint. The original loop
+    compared each seed only with every river's first tail, which is not
+    transitive. The two agree whenever paths run to their natural end (the
+    default limits; see verify_river_grouping.py), but on step-capped runs,
+    where tails are seed-specific stretches of one trunk, this joins rivers
+    the old loop split (e.g. czech, seeds 0-999 below 10^6 with 2000 steps:
+    2 rivers here, 5 from first-tail matching).
+    """
+    rivers = DisjointSet()
+    tails = {}
+    joined = set()
+
+    for seed in seeds:
+        if graph.path_length(seed) < min_path:
+            continue
+        tail = graph.tail(seed)
+        tails[seed] = tail
+        # Seeds ending in the same tail only need joining once
+        if tail in joined:
+            continue
+        joined.add(tail)
+        for node in tail[1:]:
+            rivers.union(tail[0], node)
+
+    groups = {}
+    for seed, tail in tails.items():
+        root = rivers.find(tail[0])
+        if root not in groups:
+            groups[root] = (tail, [])
+        groups[root][1].append(seed)
+    return list(groups.values())
+
+
+def find_merge(length_fn, a, b, max_steps_a=None, max_steps_b=None, value_limit=None):
+    """
+    Lock-step merge detection for the paths of `a` and `b`.
+
+    Both paths strictly increase, so whichever pointer is behind is advanced
+    until they meet; neither path is stored. A path stops when its step cap
+    (successor hops) is used up, its length is 0, or its next node would
+    reach value_limit. Returns {"merged", "merge_point", "steps_a", "steps_b"}
+    where the steps are hops from each seed to the merge point (or to where
+    the search gave up) and merge_point is None without a merge.
+    """
+    x, y = a, b
+    steps_a = steps_b = 0
+    while x != y:
+        if x < y:
+            if max_steps_a is not None and steps_a >= max_steps_a:
+                break
+            length = length_fn(x)
+            if not length or (value_limit is not None and x + length >= value_limit):
+                break
+            x += length
+            steps_a += 1
+        else:
+            if max_steps_b is not None and steps_b >= max_steps_b:
+                break
+            length = length_fn(y)
+            if not length or (value_limit is not None and y + length >= value_limit):
+                break
+            y += length
+            steps_b += 1
+
+    merged = x == y
+    return {
+        "merged": merged,
+        "merge_point": x if merged else None,
+        "steps_a": steps_a,
+        "steps_b": steps_b,
+    }
+
+# --- 3. Trunk Storage ---
+
+class TrunkIndex:
+    """
+    Membership index for a strictly increasing trunk (every path of
+    n -> n + L(n) is one). Nodes are stored as per-block deltas in the
+    smallest integer dtype that fits (usually uint8), with one absolute
+    start value per block, so 10^8 nodes take roughly 100-200 MB instead
+    of several GB for a set of ints. Lookups bisect the block starts and
+    search one decoded block; the last decoded block is kept, since rebel
+    walks query increasing values.
+    """
+
+    def __init__(self, block_size=4096):
+        self.block_size = block_size
+        self.starts = []      # first node of each sealed block
+        self.blocks = []      # deltas within each sealed block (first delta is 0)
+        self._pending = []    # nodes of the block being filled
+        self._decoded = (-1, None)
+        self.count = 0
+        self.last = None
+
+    def add(self, node):
+        if self.last is not None and node <= self.last:
+            if node == self.last:
+                return # Re-adding the current end of the trunk
+            raise ValueError(f"Trunk must increase: {node} after {self.last}")
+        self._pending.append(node)
+        self.last = node
+        self.count += 1
+        if len(self._pending) == self.block_size:
+            self._seal()
+
+    def _seal(self):
+        nodes = np.array(self._pending, dtype=np.int64)
+        deltas = np.diff(nodes, prepend=nodes[0])
+        self.starts.append(self._pending[0])
+        self.blocks.append(deltas.astype(np.min_scalar_type(int(deltas.max()))))
+        self._pending = []
+
+    def _block(self, i):
+        if self._decoded[0] != i:
+            nodes = (np.cumsum(self.blocks[i], dtype=np.int64) + self.starts[i]).tolist()
+            self._decoded = (i, nodes)
+        return self._decoded[1]
+
+    def __contains__(self, node):
+        if self.last is None or node > self.last:
+            return False
+        if self._pending and node >= self._pending[0]:
+            i = bisect.bisect_left(self._pending, node)
+            return self._pending[i] == node
+        i = bisect.bisect_right(self.starts, node) - 1
+        if i < 0:
+            return False
+        nodes = self._block(i)
+        j = bisect.bisect_left(nodes, node)
+        return j < len(nodes) and nodes[j] == node
+
+    def __len__(self):
+        return self.count
+
+    def nbytes(self):
+        """Approximate memory held by the sealed blocks."""
+        return sum(b.nbytes for b in self.blocks) + 8 * (len(self.starts) + len(self._pending))
+
+# --- 4. Jump Tables ---
+
+class JumpTable:
+    """
+    Binary-lifting index over the bounded range [0, value_limit).
+
+    up[j][n] is the node 2^j steps after n, or the sink value_limit when
+    the path ends (length 0) or leaves the range within those steps. Levels
+    are added until one is all sink, so k-step and first-crossing queries
+    take O(log k) lookups instead of k length calls. Arrays are int32 when
+    the range allows, and round-trip through to_arrays/from_arrays.
+    """
+
+    def __init__(self, lengths, up=None):
+        self.lengths = np.asarray(lengths)
+        self.value_limit = sink = len(self.lengths)
+        if up is not None:
+            self.up = list(up)
+            return
+
+        dtype = np.int32 if sink < np.iinfo(np.int32).max else np.int64
+        nxt = np.arange(sink, dtype=np.int64) + self.lengths
+        nxt[(self.lengths == 0) | (nxt >= sink)] = sink
+        level = np.append(nxt, sink).astype(dtype)
+        self.up = [level]
+        while (level[:-1] != sink).any():
+            level = level[level]
+            self.up.append(level)
+
+    @classmethod
+    def from_processor(cls, processor, value_limit):
+        return cls(processor.length_table(value_limit))
+
+    def to_arrays(self):
+        return {"lengths": self.lengths, "up": np.stack(self.up)}
+
+    @classmethod
+    def from_arrays(cls, lengths, up):
+        return cls(lengths, up=up)
+
+    def nbytes(self):
+        return self.lengths.nbytes + sum(level.nbytes for level in self.up)
+
+    def walk(self, node, steps):
+        """The node `steps` hops after `node`, or None if the path ends or leaves the range first."""
+        if node >= self.value_limit:
+            return None
+        if steps >> (len(self.up) - 1):
+            return None # At least 2^top steps: the top level is all sink
+        j = 0
+        while steps:
+            if steps & 1:
+                node = int(self.up[j][node])
+                if node == self.value_limit:
+                    return None
+            steps >>= 1
+            j += 1
+        return node
+
+    def first_reaching(self, node, target):
+        """
+        Returns (steps, value) for the first node on the path of `node` that
+        is >= target, or None if the path ends (or leaves the range below
+        target) before that. The crossing value itself may lie past value_limit.
+        """
+        if node >= target:
+            return 0, node
+        if node >= self.value_limit:
+            return None
+        sink = self.value_limit
+        steps = 0
+        for j in range(len(self.up) - 1, -1, -1):
+            nxt = int(self.up[j][node])
+            if nxt != sink and nxt < target:
+                node = nxt
+                steps += 1 << j
+
+        # One more step crosses the target, unless the path stops here
+        length = int(self.lengths[node])
+        if length == 0 or node + length < target:
+            return None
+        return steps + 1, node + length
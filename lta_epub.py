@@ -0,0 +1,181 @@
+# --- LTA EPUB Streaming ---
+# Extracts the text of an EPUB in reading order without holding a chapter,
+# or the book, in memory.
+#
+# Documents come in the order of the OPF spine (sorted file names if the book
+# has no usable OPF). Each zip entry is decompressed in CHUNK_SIZE pieces and
+# fed to an lxml HTML parser whose target receives start/end/data events; no
+# tree is built, and text goes to the output file as soon as a tag closes the
+# run it belongs to. Memory stays at one chunk plus the text of one paragraph
+# (or one tag-free run, for flat text), whatever the size of the book.
+
+import posixpath
+import zipfile
+from urllib.parse import unquote
+
+from lxml import etree
+
+CHUNK_SIZE = 1 << 16 # Compressed-entry bytes fed to the parser at a time
+MAX_RUN = 1 << 20 # Characters of tag-free text kept before flushing at a space
+HTML_SUFFIXES = ('.html', '.xhtml', '.htm')
+PARAGRAPH_TAGS = frozenset(["p", "h1", "h2", "h3"])
+SKIPPED_TAGS = frozenset(["script", "style"])
+
+# --- 1. Reading Order ---
+
+def _local(tag):
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ""
+
+def spine_entries(z):
+    """Zip member names of the book's documents, in spine order."""
+    names = set(z.namelist())
+    try:
+        container = etree.fromstring(z.read("META-INF/container.xml"))
+        opf_path = next(el.get("full-path") for el in container.iter()
+                        if _local(el.tag) == "rootfile" and el.get("full-path"))
+        opf = etree.fromstring(z.read(opf_path))
+    except (KeyError, StopIteration, etree.XMLSyntaxError):
+        opf = None
+
+    entries = []
+    if opf is not None:
+        base = posixpath.dirname(opf_path)
+        hrefs = {el.get("id"): el.get("href") for el in opf.iter() if _local(el.tag) == "item"}
+        for el in opf.iter():
+            if _local(el.tag) != "itemref" or el.get("linear") == "no":
+                continue
+            href = hrefs.get(el.get("idref"))
+            if not href:
+                continue
+            name = posixpath.normpath(posixpath.join(base, unquote(href.split('#', 1)[0])))
+            if name in names and name not in entries:
+                entries.append(name)
+    if not entries:
+        entries = sorted(n for n in names if n.endswith(HTML_SUFFIXES))
+    return entries
+
+# --- 2. Parser Targets ---
+
+class FlatText:
+    """
+    All text of a document (script and style excepted) as one line: tags
+    count as spaces and whitespace runs collapse to one space, like the
+    regex strippers did. `prefix` is written just before the first word,
+    so an empty document writes nothing at all.
+    """
+
+    def __init__(self, out, prefix=""):
+        self.out = out
+        self.prefix = prefix
+        self.run = []
+        self.run_chars = 0
+        self.skipping = 0
+        self.started = False # A word of this document was written
+
+    def _flush(self, keep_tail=False):
+        text = "".join(self.run)
+        self.run, self.run_chars = [], 0
+        if keep_tail and not text[-1:].isspace():
+            # A word may continue in the next data event
+            cut = max(text.rfind(c) for c in " \t\n\r\f\v")
+            if cut < 0:
+                self.run, self.run_chars = [text], len(text)
+                return
+            text, tail = text[:cut], text[cut:]
+            self.run, self.run_chars = [tail], len(tail)
+        words = text.split()
+        if words:
+            self.out.write((" " if self.started else self.prefix) + " ".join(words))
+            self.started = True
+
+    def start(self, tag, attrib):
+        self._flush()
+        if _local(tag) in SKIPPED_TAGS:
+            self.skipping += 1
+
+    def end(self, tag):
+        self._flush()
+        if _local(tag) in SKIPPED_TAGS and self.skipping:
+            self.skipping -= 1
+
+    def data(self, text):
+        if self.skipping:
+            return
+        self.run.append(text)
+        self.run_chars += len(text)
+        if self.run_chars > MAX_RUN:
+            self._flush(keep_tail=True)
+
+    def close(self):
+        self._flush()
+        return self.started
+
+class ParagraphText:
+    """
+    Text of every <p>, <h1>, <h2> and <h3> in document order, stripped, one
+    per paragraph. `separator` goes between paragraphs, across documents too.
+    """
+
+    def __init__(self, out, separator="\n\n", written=False):
+        self.out = out
+        self.separator = separator
+        self.written = written # A paragraph was written, in this or an earlier document
+        self.depth = 0
+        self.parts = []
+
+    def start(self, tag, attrib):
+        if _local(tag) in PARAGRAPH_TAGS:
+            self.depth += 1
+
+    def end(self, tag):
+        if _local(tag) not in PARAGRAPH_TAGS or not self.depth:
+            return
+        self.depth -= 1
+        if self.depth:
+            return
+        text = "".join(self.parts).strip()
+        self.parts = []
+        if text:
+            self.out.write(self.separator + text if self.written else text)
+            self.written = True
+
+    def data(self, text):
+        if self.depth:
+            self.parts.append(text)
+
+    def close(self):
+        return self.written
+
+# --- 3. Extraction ---
+
+def feed_entry(z, name, target, chunk_size=CHUNK_SIZE):
+    """Streams one zip member through an HTML parser driving `target`; returns target.close()."""
+    parser = etree.HTMLParser(target=target, encoding="utf-8")
+    fed = False
+    with z.open(name) as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            parser.feed(chunk)
+            fed = True
+    # libxml2 refuses to close a parser that never saw a byte
+    return parser.close() if fed else target.close()
+
+def write_epub_text(epub_path, out, paragraphs=False, chunk_size=CHUNK_SIZE):
+    """
+    Writes the text of an EPUB to `out` (anything with .write(str)).
+    Flat mode writes one line per non-empty document, separated by newlines.
+    With paragraphs=True it writes the <p>/<h1-3> paragraphs separated by
+    blank lines. Returns True if any text was written.
+    """
+    written = False
+    with zipfile.ZipFile(epub_path, 'r') as z:
+        for name in spine_entries(z):
+            if paragraphs:
+                written = feed_entry(z, name, ParagraphText(out, written=written), chunk_size)
+            else:
+                written = feed_entry(z, name, FlatText(out, "\n" if written else ""), chunk_size) or written
+    return written
+
+def extract_epub_file(epub_path, output_path, paragraphs=False):
+    """Streams the text of an EPUB into output_path; returns True if any text was written."""
+    with open(output_path, 'w', encoding='utf-8') as out:
+        return write_epub_text(epub_path, out, paragraphs)
@@ -0,0 +1,223 @@
+# --- LTA Fingerprint Engine ---
+# One pass over a text collects everything the fingerprint tools report:
+# word-weight moments and histogram, sentence lengths, and vocabulary counts.
+#
+# The state is plain integers, a Counter and a bincount array, so two states
+# merge by addition and the merged fingerprint is identical to the one of
+# the whole text. A file is split for workers only right after a run of
+# sentence terminators, where no word or sentence is ever cut, so
+# fingerprint_file(path, workers=8) equals fingerprint_file(path, workers=1).
+
+import os
+import re
+import math
+from collections import Counter
+
+import numpy as np
+
+from lta_weights import WeightTable, WordPattern, ALPHA_WEIGHTS, ALPHA_WORDS, code_points
+
+ALPHA_TABLE = WeightTable(ALPHA_WEIGHTS, fold_case=True)
+
+FRICTION_MIN_WORDS = 4 # Sentences shorter than this are left out of the friction metrics
+TOP_VOCABULARY = 100 # Words the vocabulary-density proxy looks at
+BLOCK_SIZE = 1 << 22 # Bytes read per block
+SNAP_BLOCK = 1 << 16 # Bytes scanned at a time for a sentence boundary
+
+# The sentences and whitespace tokens of re.split(r'[.!?]+', text) / s.split()
+TERMINATORS = WordPattern(lambda c: c in ".!?")
+TOKENS = WordPattern(lambda c: not c.isspace() and c not in ".!?")
+# A terminator run followed by something else; the boundary is its end
+BOUNDARY = re.compile(rb"[.!?](?=[^.!?])")
+
+class FingerprintState:
+    """
+    Mergeable fingerprint accumulator. Every field is an exact count or sum,
+    so merge() is associative and order does not change any metric.
+    """
+
+    def __init__(self):
+        self.words = 0
+        self.weight_sum = 0
+        self.weight_sq = 0
+        self.histogram = np.zeros(0, dtype=np.int64) # Words per weight
+        self.sentences = 0 # Sentences with at least one word
+        self.long_sentences = 0 # Sentences with at least FRICTION_MIN_WORDS words
+        self.long_sum = 0
+        self.long_sq = 0
+        self.vocabulary = Counter()
+
+    # --- Feeding ---
+
+    def add_weights(self, weights):
+        """Adds a batch of integer word weights."""
+        weights = np.asarray(weights, dtype=np.int64)
+        if not len(weights):
+            return
+        self.words += len(weights)
+        self.weight_sum += int(weights.sum())
+        self.weight_sq += int((weights * weights).sum())
+        self._add_histogram(np.bincount(weights))
+
+    def add_sentence_lengths(self, lengths):
+        """Adds the word counts of a batch of sentences; empty ones are not counted."""
+        lengths = np.asarray(lengths, dtype=np.int64)
+        self.sentences += int(np.count_nonzero(lengths))
+        long = lengths[lengths >= FRICTION_MIN_WORDS]
+        self.long_sentences += len(long)
+        self.long_sum += int(long.sum())
+        self.long_sq += int((long * long).sum())
+
+    def add_words(self, words):
+        self.vocabulary.update(words)
+
+    def add_text(self, text, table=ALPHA_TABLE, pattern=ALPHA_WORDS):
+        """
+        Adds a block of text: words are `pattern` runs weighed by `table`,
+        sentences are the pieces between runs of . ! ? and their length is
+        their whitespace-separated token count. A block must end right after
+        a terminator run (or at the end of the text) for merges to be exact.
+        """
+        codes = code_points(text)
+        starts, ends = pattern.spans(codes)
+        self.add_weights(table.weigh(codes, starts, ends))
+        self.add_words(map(text.__getitem__, map(slice, starts.tolist(), ends.tolist())))
+
+        breaks, _ = TERMINATORS.spans(codes)
+        token_starts, _ = TOKENS.spans(codes)
+        sentence_of = np.searchsorted(breaks, token_starts, side="right")
+        self.add_sentence_lengths(np.bincount(sentence_of, minlength=len(breaks) + 1))
+
+    def _add_histogram(self, counts):
+        if len(counts) > len(self.histogram):
+            counts, self.histogram = self.histogram, counts.astype(np.int64)
+        self.histogram[:len(counts)] += counts
+
+    # --- Combining ---
+
+    def merge(self, other):
+        """Adds another state into this one and returns self."""
+        self.words += other.words
+        self.weight_sum += other.weight_sum
+        self.weight_sq += other.weight_sq
+        self._add_histogram(other.histogram)
+        self.sentences += other.sentences
+        self.long_sentences += other.long_sentences
+        self.long_sum += other.long_sum
+        self.long_sq += other.long_sq
+        self.vocabulary.update(other.vocabulary)
+        return self
+
+    # --- Metrics ---
+
+    def mean_weight(self):
+        return self.weight_sum / self.words if self.words else 0.0
+
+    def weight_deviation(self):
+        """Population standard deviation of the word weights."""
+        if not self.words:
+            return 0.0
+        return math.sqrt(self.words * self.weight_sq - self.weight_sum ** 2) / self.words
+
+    def median_weight(self):
+        """Median word weight, read off the histogram."""
+        n = self.words
+        if not n:
+            return 0.0
+        cumulative = np.cumsum(self.histogram)
+        upper = int(np.searchsorted(cumulative, n // 2 + 1))
+        if n % 2:
+            return upper
+        return (int(np.searchsorted(cumulative, n // 2)) + upper) / 2
+
+    def sentence_friction(self):
+        """(average length, standard deviation) of sentences with FRICTION_MIN_WORDS+ words."""
+        n = self.long_sentences
+        if not n:
+            return 0, 0
+        return self.long_sum / n, math.sqrt(n * self.long_sq - self.long_sum ** 2) / n
+
+    def vocabulary_density(self):
+        # Simple Zipf proxy over the most common words
+        top = min(len(self.vocabulary), TOP_VOCABULARY)
+        return sum(1 / i for i in range(1, top + 1)) / top if top else 0
+
+    def fingerprint(self):
+        mean = self.mean_weight()
+        std_dev = self.weight_deviation()
+        median = self.median_weight()
+        avg_sent, sent_friction = self.sentence_friction()
+        return {
+            "Words": self.words,
+            "Mean Word Weight": mean,
+            "Style Volatility (SD)": std_dev,
+            "Median Word Weight": median,
+            "Style Skewness": (mean - median) / std_dev if std_dev > 0 else 0,
+            "Syntactic Friction": sent_friction,
+            "Avg Sentence Length": avg_sent,
+            "Vocabulary Density": self.vocabulary_density(),
+        }
+
+# --- Files ---
+
+def snap_to_sentence(f, pos, size):
+    """The first offset >= pos right after a run of . ! ? (or size) in binary file f."""
+    if pos <= 0:
+        return 0
+    if pos >= size:
+        return size
+    f.seek(pos - 1)
+    offset = pos - 1 # File offset of data[0]
+    data = f.read(SNAP_BLOCK)
+    while True:
+        m = BOUNDARY.search(data)
+        if m:
+            return offset + m.end()
+        block = f.read(SNAP_BLOCK)
+        if not block:
+            return size
+        # Keep one byte so a terminator at the end of the last block is seen
+        offset += len(data) - 1
+        data = data[-1:] + block
+
+def iter_blocks(f, start, stop, block_size=BLOCK_SIZE):
+    """Decoded text of [start, stop) in blocks that each end on a sentence boundary."""
+    size = os.fstat(f.fileno()).st_size
+    pos = start
+    while pos < stop:
+        end = min(snap_to_sentence(f, pos + block_size, size), stop)
+        f.seek(pos)
+        yield f.read(end - pos).decode("utf-8", errors="ignore")
+        pos = end
+
+def fingerprint_range(item, block_size=BLOCK_SIZE):
+    """FingerprintState of the byte range item = (path, start, stop), snapped to sentence boundaries."""
+    path, start, stop = item
+    state = FingerprintState()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        start = snap_to_sentence(f, start, size)
+        stop = snap_to_sentence(f, stop, size)
+        for text in iter_blocks(f, start, stop, block_size):
+            state.add_text(text)
+    return state
+
+def fingerprint_file(path, workers=1, block_size=BLOCK_SIZE):
+    """
+    FingerprintState of a whole file. With workers > 1 the file is cut into
+    that many byte ranges, each fingerprinted in its own process, and the
+    states are merged; the result is the same as with one worker.
+    """
+    size = os.path.getsize(path)
+    if workers <= 1 or size < 2 * block_size:
+        return fingerprint_range((path, 0, size), block_size)
+
+    from lta_batch import run_batch
+    cuts = [size * i // workers for i in range(workers + 1)]
+    items = [(path, cuts[i], cuts[i + 1]) for i in range(workers)]
+    state = FingerprintState()
+    for res in run_batch(items, fingerprint_range, max_workers=workers, timeout=None):
+        if not res["ok"]:
+            raise RuntimeError(f"Fingerprinting {path} {res['item'][1]}-{res['item'][2]} failed: {res['error']}")
+        state.merge(res["result"])
+    return state
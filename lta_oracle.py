@@ -0,0 +1,77 @@
+# --- LTA Length Oracle ---
+# One shared source of L(n) for the analysis scripts, instead of a private
+# num_to_english() per script.
+#
+# The oracle wraps a language_math processor: lengths below table_size come
+# from its precomputed length table (one list lookup), larger n fall through
+# to the processor's digit-group arithmetic, which is memoized per group.
+
+from language_math import WesternProcessor
+
+DEFAULT_TABLE_SIZE = 1 << 17 # Covers every range the English scripts walk
+
+# English number words, concatenated without spaces, hyphens or "and"
+# ("onehundredtwentythree"), the spelling all the English scripts use.
+ENGLISH_RULES = {
+    "direct": {
+        0: "zero", 1: "one", 2: "two", 3: "three", 4: "four", 5: "five",
+        6: "six", 7: "seven", 8: "eight", 9: "nine", 10: "ten",
+        11: "eleven", 12: "twelve", 13: "thirteen", 14: "fourteen", 15: "fifteen",
+        16: "sixteen", 17: "seventeen", 18: "eighteen", 19: "nineteen",
+        20: "twenty", 30: "thirty", 40: "forty", 50: "fifty",
+        60: "sixty", 70: "seventy", 80: "eighty", 90: "ninety",
+    },
+    "tens": ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"],
+    "ten_sep": "",
+    "hundred": "hundred",
+    "hundred_sep": "",
+    "thousand": "thousand",
+    "million": "million",
+    "billion": "billion",
+    "trillion": "trillion",
+    "quadrillion": "quadrillion",
+}
+
+class LengthOracle:
+    """L(n) for one processor: a table lookup below table_size, arithmetic above it."""
+
+    def __init__(self, processor, table_size=DEFAULT_TABLE_SIZE):
+        self.processor = processor
+        self.table_size = table_size
+        try:
+            self._table = processor.length_table(table_size).tolist()
+        except ImportError:
+            self._table = [processor.get_length(n) for n in range(table_size)]
+
+    def length(self, n):
+        if 0 <= n < self.table_size:
+            return self._table[n]
+        return self.processor.get_length(n)
+
+    __call__ = length
+
+    def name(self, n):
+        return self.processor.get_name(n)
+
+    def next(self, n):
+        """One step of the map n -> n + L(n)."""
+        return n + self.length(n)
+
+    def path(self, seed, steps):
+        """The first `steps` nodes starting at `seed`."""
+        path = []
+        curr = seed
+        for _ in range(steps):
+            path.append(curr)
+            curr += self.length(curr)
+        return path
+
+# --- Shared Instances ---
+
+_english = {}
+
+def english_oracle(table_size=DEFAULT_TABLE_SIZE):
+    """The process-wide English oracle (built once per table size)."""
+    if table_size not in _english:
+        _english[table_size] = LengthOracle(WesternProcessor("English", ENGLISH_RULES), table_size)
+    return _english[table_size]
@@ -0,0 +1,212 @@
+# --- LTA Rule Pack ---
+# Bundles every parsed and validated .lang file into one binary file, so batch
+# tools load the whole catalogue without re-parsing or re-validating it.
+#
+# Layout: a 24-byte header (magic, index offset, index length), one UTF-8 JSON
+# record per language, then a JSON index {source: [offset, length, sha256, name]}.
+# The pack is read through mmap: opening it decodes only the index, and each
+# record is decoded when a caller asks for that language.
+#
+# Every entry carries the sha256 of its source file. Rebuilding reuses the
+# stored record of any file whose hash is unchanged; only edited or new files
+# are parsed and validated again.
+
+import os
+import sys
+import json
+import glob
+import mmap
+import struct
+import hashlib
+
+from linguistic_topology_app import parse_lang_file, make_lang_data
+
+PACK_MAGIC = b"LTAPACK2"
+HEADER = struct.Struct("<8sQQ")
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PACK_PATH = os.path.join(REPO_DIR, "results", "languages.ltapack")
+
+# --- 1. Records ---
+
+def source_key(path):
+    """Index key of a .lang file: its path relative to the repo."""
+    return os.path.relpath(os.path.abspath(path), REPO_DIR).replace(os.sep, "/")
+
+def source_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def _encode_record(path):
+    """Parses and validates one file; failures are stored so they are not re-validated either."""
+    try:
+        lang_data = parse_lang_file(path)
+    except ValueError as e:
+        return None, {"error": str(e)}
+
+    rules = dict(lang_data["rules"])
+    rules["direct"] = list(rules["direct"].items())
+    record = {"name": lang_data["name"], "math_type": lang_data["math_type"], "rules": rules}
+    return lang_data["name"], record
+
+def _decode_record(record):
+    if "error" in record:
+        raise ValueError(record["error"])
+    rules = dict(record["rules"])
+    rules["direct"] = {int(k): v for k, v in rules["direct"]}
+    return make_lang_data(record["name"], record["math_type"], rules)
+
+# --- 2. Reading ---
+
+class RulePack:
+    """Read-only, memory-mapped view of a rule pack."""
+
+    def __init__(self, pack_path=DEFAULT_PACK_PATH):
+        self.path = pack_path
+        self._file = open(pack_path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, index_offset, index_length = HEADER.unpack_from(self._map, 0)
+            if magic != PACK_MAGIC:
+                raise ValueError(f"{pack_path} is not a rule pack")
+            self.index = json.loads(self._map[index_offset:index_offset + index_length])
+        except Exception:
+            self.close()
+            raise
+
+        # Language name -> source key (first file wins for duplicate names)
+        self.by_name = {}
+        for key, (_, _, _, name) in self.index.items():
+            if name is not None:
+                self.by_name.setdefault(name, key)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def raw(self, key):
+        """The encoded record bytes of a source key."""
+        offset, length, _, _ = self.index[key]
+        return self._map[offset:offset + length]
+
+    def sha256(self, key):
+        return self.index[key][2] if key in self.index else None
+
+    def load(self, key):
+        """Language data for a source key; raises ValueError for files that failed validation."""
+        return _decode_record(json.loads(self.raw(key)))
+
+    def get(self, name):
+        """Language data by language name."""
+        return self.load(self.by_name[name])
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def open_pack(pack_path=DEFAULT_PACK_PATH):
+    """Returns a RulePack, or None if the pack is missing or unreadable."""
+    try:
+        return RulePack(pack_path)
+    except (OSError, ValueError, struct.error):
+        return None
+
+# --- 3. Building ---
+
+def build_rule_pack(lang_files, pack_path=DEFAULT_PACK_PATH):
+    """
+    Writes a rule pack for `lang_files`, reusing the records of unchanged
+    files from the existing pack. Returns {"reused": n, "parsed": n}.
+    """
+    stats = {"reused": 0, "parsed": 0}
+    previous = open_pack(pack_path)
+    records = []
+    try:
+        for path in lang_files:
+            key = source_key(path)
+            digest = source_hash(path)
+            if previous is not None and previous.sha256(key) == digest:
+                name = previous.index[key][3]
+                blob = previous.raw(key)
+                stats["reused"] += 1
+            else:
+                name, record = _encode_record(path)
+                blob = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                stats["parsed"] += 1
+            records.append((key, digest, name, blob))
+
+        # Keep entries of other files, so tools packing subsets share one pack
+        if previous is not None:
+            wanted = {record[0] for record in records}
+            for key, (_, _, digest, name) in previous.index.items():
+                if key not in wanted:
+                    records.append((key, digest, name, previous.raw(key)))
+    finally:
+        if previous is not None:
+            previous.close()
+
+    os.makedirs(os.path.dirname(os.path.abspath(pack_path)), exist_ok=True)
+    tmp_path = f"{pack_path}.{os.getpid()}.tmp"
+    index = {}
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(PACK_MAGIC, 0, 0))
+        for key, digest, name, blob in records:
+            index[key] = [f.tell(), len(blob), digest, name]
+            f.write(blob)
+        index_blob = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        index_offset = f.tell()
+        f.write(index_blob)
+        f.seek(0)
+        f.write(HEADER.pack(PACK_MAGIC, index_offset, len(index_blob)))
+    # Write then rename, so readers never map half a pack
+    os.replace(tmp_path, pack_path)
+    return stats
+
+def load_catalogue(lang_files, pack_path=DEFAULT_PACK_PATH):
+    """
+    Returns {path: language data or ValueError} for every file, through the
+    pack. The pack is rebuilt first if any file is new or has changed.
+    """
+    pack = open_pack(pack_path)
+    stale = pack is None or any(pack.sha256(source_key(p)) != source_hash(p) for p in lang_files)
+    if stale:
+        if pack is not None:
+            pack.close()
+        build_rule_pack(lang_files, pack_path)
+        pack = RulePack(pack_path)
+
+    catalogue = {}
+    with pack:
+        for path in lang_files:
+            try:
+                catalogue[path] = pack.load(source_key(path))
+            except ValueError as e:
+                catalogue[path] = e
+    return catalogue
+
+def load_lang_file(path, pack=None):
+    """parse_lang_file(), served from `pack` when the file's hash matches."""
+    if pack is not None:
+        key = source_key(path)
+        if pack.sha256(key) == source_hash(path):
+            return pack.load(key)
+    return parse_lang_file(path)
+
+# --- 4. Main Execution ---
+
+if __name__ == "__main__":
+    lang_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(REPO_DIR, "languages")
+    pack_path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PACK_PATH
+    files = sorted(glob.glob(os.path.join(lang_dir, "*.lang")))
+    stats = build_rule_pack(files, pack_path)
+    print(f"Rule pack: {pack_path}")
+    print(f"  {len(files)} languages ({stats['parsed']} parsed, {stats['reused']} unchanged)")
@@ -1,9 +1,10 @@
 import os
+import re
 import sys
 import warnings
 import math
 from pathlib import Path
-from typing import Union, Iterable, List, Optional
+from typing import Union, Iterable, Iterator, List, Optional, Callable
 
 # --- Dependency Handling ---
 # We try to import torch, but provide a fallback/warning if missing.
@@ -36,6 +37,54 @@ def gelu(x):
         raise ImportError("PyTorch is required for gelu")
     return torch.nn.functional.gelu(x.float()).type_as(x)
 
+# --- Symbol Scanning ---
+
+def _trie_pattern(symbols: Iterable[str]) -> str:
+    """
+    A regex matching the longest of `symbols` at a position. The symbols are
+    folded into a trie first, so at each position the regex engine follows
+    one branch per character instead of trying every symbol in turn.
+    """
+    trie = {}
+    for symbol in symbols:
+        node = trie
+        for ch in symbol:
+            node = node.setdefault(ch, {})
+        node[""] = True # End of a symbol
+
+    def render(node):
+        alternatives = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not alternatives:
+            return ""
+        body = alternatives[0] if len(alternatives) == 1 else "(?:" + "|".join(alternatives) + ")"
+        # A symbol ends here: the longer continuations are optional and tried first
+        return "(?:" + body + ")?" if "" in node else body
+
+    return render(trie)
+
+class SymbolScanner:
+    """
+    Splits lines into non-linguistic symbols and single characters, taking
+    the longest symbol that starts at each position. The symbol set is
+    compiled once; a line is split by the regex engine in one left-to-right
+    pass, so scanning is linear in the line length.
+    """
+    def __init__(self, symbols: Iterable[str]):
+        self.symbols = frozenset(s for s in symbols if s) # "" would match everywhere
+        self.pattern = re.compile("(" + _trie_pattern(self.symbols) + ")") if self.symbols else None
+
+    def scan(self, line: str, keep_symbols: bool = True, drop_spaces: bool = False) -> List[str]:
+        pieces = self.pattern.split(line) if self.pattern is not None else [line]
+        tokens = []
+        # split() alternates plain text and matched symbols
+        for i, piece in enumerate(pieces):
+            if i % 2:
+                if keep_symbols:
+                    tokens.append(piece)
+            elif piece:
+                tokens.extend(piece.replace(" ", "") if drop_spaces else piece)
+        return tokens
+
 # --- Tokenizer Classes ---
 
 class AbsTokenizer:
@@ -46,6 +95,9 @@ class AbsTokenizer:
     def text2tokens(self, line: str) -> List[str]:
         raise NotImplementedError
 
+    def batch_text2tokens(self, lines: Iterable[str]) -> List[List[str]]:
+        return [self.text2tokens(line) for line in lines]
+
     def tokens2text(self, tokens: Iterable[str]) -> str:
         raise NotImplementedError
 
@@ -78,6 +130,7 @@ class CharTokenizer(AbsTokenizer):
             self.non_linguistic_symbols = set(non_linguistic_symbols)
         self.remove_non_linguistic_symbols = remove_non_linguistic_symbols
         self.split_with_space = split_with_space
+        self.scanner = SymbolScanner(self.non_linguistic_symbols)
         self.seg_dict = None
         
         # Placeholder for load_seg_dict which was not provided in snippets
@@ -100,22 +153,12 @@ class CharTokenizer(AbsTokenizer):
             # tokens = seg_tokenize(tokens, self.seg_dict)
             return tokens
         else:
-            tokens = []
-            while len(line) != 0:
-                for w in self.non_linguistic_symbols:
-                    if line.startswith(w):
-                        if not self.remove_non_linguistic_symbols:
-                            tokens.append(line[: len(w)])
-                        line = line[len(w) :]
-                        break
-                else:
-                    t = line[0]
-                    if t == " ":
-                        # t = "<space>"
-                        line = line[1:]
-                        continue
-                    tokens.append(t)
-                    line = line[1:]
+            # Spaces are dropped (not mapped to "<space>")
+            tokens = self.scanner.scan(
+                line,
+                keep_symbols=not self.remove_non_linguistic_symbols,
+                drop_spaces=True,
+            )
         return tokens
 
     def tokens2text(self, tokens: Iterable[str]) -> str:
@@ -173,13 +216,82 @@ class WordTokenizer(AbsTokenizer):
             delimiter = self.delimiter
         return delimiter.join(tokens)
 
+# --- G2P Phoneme Cache ---
+
+DEFAULT_G2P_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "g2p_cache.sqlite")
+DEFAULT_G2P_CHUNK = 1024 # Words per backend call
+
+class PhonemeCache:
+    """
+    Persistent word -> phonemes dictionary in SQLite, shared across runs and
+    processes. Entries are keyed by backend (the g2p_type) as well as by
+    word, so different backends never see each other's results.
+    """
+    QUERY_CHUNK = 500 # Host parameters per SELECT
+
+    def __init__(self, path: Union[Path, str] = DEFAULT_G2P_CACHE, backend: str = "default"):
+        import sqlite3
+        self.path = str(path)
+        self.backend = str(backend)
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.db = sqlite3.connect(self.path, timeout=60)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS phonemes ("
+            "backend TEXT NOT NULL, word TEXT NOT NULL, phonemes TEXT NOT NULL, "
+            "PRIMARY KEY (backend, word))"
+        )
+        self.db.commit()
+
+    def get_many(self, words: List[str]) -> dict:
+        """{word: phonemes} for the words that are stored."""
+        import json
+        found = {}
+        for i in range(0, len(words), self.QUERY_CHUNK):
+            chunk = words[i : i + self.QUERY_CHUNK]
+            rows = self.db.execute(
+                f"SELECT word, phonemes FROM phonemes WHERE backend = ? AND word IN ({','.join('?' * len(chunk))})",
+                [self.backend, *chunk],
+            )
+            for word, phonemes in rows:
+                found[word] = json.loads(phonemes)
+        return found
+
+    def put_many(self, items: dict):
+        import json
+        self.db.executemany(
+            "INSERT OR REPLACE INTO phonemes (backend, word, phonemes) VALUES (?, ?, ?)",
+            [(self.backend, word, json.dumps(phonemes, ensure_ascii=False)) for word, phonemes in items.items()],
+        )
+        self.db.commit()
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM phonemes WHERE backend = ?", (self.backend,)).fetchone()[0]
+
+    def close(self):
+        self.db.close()
+
 class G2PTokenizer(AbsTokenizer):
+    """
+    Phonemizes lines with a G2P backend.
+
+    batch_text2tokens() is the batched mode: it phonemizes each distinct
+    word once, sending the words to the backend g2p_chunk_size at a time,
+    and keeps the results in memory and, with g2p_cache, in a PhonemeCache
+    on disk (True for the default path). With a cache, text2tokens() goes
+    through the same path. g2p_backend replaces the library backend with
+    any callable mapping a list of words to their phonemes (a list of
+    tokens or a space-separated string per word), e.g. an offline stub.
+    """
     def __init__(
         self,
         g2p_type: Union[None, str],
         non_linguistic_symbols: Union[Path, str, Iterable[str]] = None,
         space_symbol: str = "<space>",
         remove_non_linguistic_symbols: bool = False,
+        g2p_backend: Optional[Callable[[List[str]], List]] = None,
+        g2p_cache: Union[None, bool, Path, str] = None,
+        g2p_chunk_size: int = DEFAULT_G2P_CHUNK,
         **kwargs
     ):
         super().__init__(**kwargs)
@@ -189,24 +301,33 @@ class G2PTokenizer(AbsTokenizer):
         # which may not be installed. We will attempt to import them only if requested.
         
         self.g2p = None
+        self.g2p_batch = None # words -> phonemes per word, for the batched mode
+        self.word_separator = [] # Tokens the backend puts between words
         
-        if g2p_type is None:
+        if g2p_backend is not None:
+            self.g2p_batch = g2p_backend
+            self.g2p = lambda text: g2p_backend([text])[0]
+        elif g2p_type is None:
             self.g2p = lambda x: x.split(" ") # Fallback
         elif g2p_type == "g2p_en":
             from g2p_en import G2p as G2p_en
             self.g2p = G2p_en(no_space=False)
+            self.g2p_batch = lambda words: [self.g2p(w) for w in words]
+            self.word_separator = [" "]
         elif g2p_type == "g2p_en_no_space":
             from g2p_en import G2p as G2p_en
             self.g2p = G2p_en(no_space=True)
+            self.g2p_batch = lambda words: [self.g2p(w) for w in words]
         elif "pyopenjtalk" in g2p_type:
             import pyopenjtalk
             # Mapping pyopenjtalk functions based on type string
             # Simplified for integration:
             if g2p_type == "pyopenjtalk":
                 self.g2p = pyopenjtalk.g2p
+                self.g2p_batch = lambda words: [pyopenjtalk.g2p(w) for w in words]
             # ... other variants would map to specific wrappers ...
         elif "espeak" in g2p_type:
-            from phonemizer.phonemize import phonemize
+            from phonemizer.backend import EspeakBackend
             # Wrapper for phonemizer
             lang_map = {
                 "espeak_ng_arabic": "ar", "espeak_ng_german": "de",
@@ -215,7 +336,10 @@ class G2PTokenizer(AbsTokenizer):
                 "espeak_ng_english_us_vits": "en-us"
             }
             lang = lang_map.get(g2p_type, "en-us")
-            self.g2p = lambda text: phonemize(text, language=lang, backend='espeak', strip=True, with_stress=True).split()
+            # One backend for the tokenizer's lifetime; phonemize() would start espeak on every call
+            espeak = EspeakBackend(lang, with_stress=True)
+            self.g2p = lambda text: espeak.phonemize([text], strip=True)[0].split()
+            self.g2p_batch = lambda words: espeak.phonemize(words, strip=True)
         elif "korean" in g2p_type:
              # from jaso import Jaso ...
              raise NotImplementedError("Korean Jaso G2P not installed.")
@@ -238,6 +362,15 @@ class G2PTokenizer(AbsTokenizer):
         else:
             self.non_linguistic_symbols = set(non_linguistic_symbols)
         self.remove_non_linguistic_symbols = remove_non_linguistic_symbols
+        self.scanner = SymbolScanner(self.non_linguistic_symbols)
+
+        self.g2p_chunk_size = g2p_chunk_size
+        self.phonemes = {} # word -> phonemes, this run
+        self.backend_words = 0 # Words actually sent to the backend
+        self.phoneme_cache = None
+        if g2p_cache and self.g2p_batch is not None:
+            path = DEFAULT_G2P_CACHE if g2p_cache is True else g2p_cache
+            self.phoneme_cache = PhonemeCache(path, backend=g2p_type or "custom")
 
     def __repr__(self):
         return (
@@ -247,19 +380,56 @@ class G2PTokenizer(AbsTokenizer):
             f")"
         )
 
+    def _filter(self, line: str) -> str:
+        return "".join(self.scanner.scan(line, keep_symbols=not self.remove_non_linguistic_symbols))
+
+    def _phonemize_words(self, words: Iterable[str]):
+        """Makes sure every word is in self.phonemes, asking the backend only for unseen ones."""
+        missing = [w for w in dict.fromkeys(words) if w not in self.phonemes]
+        if missing and self.phoneme_cache is not None:
+            found = self.phoneme_cache.get_many(missing)
+            self.phonemes.update(found)
+            missing = [w for w in missing if w not in found]
+        for i in range(0, len(missing), self.g2p_chunk_size):
+            chunk = missing[i : i + self.g2p_chunk_size]
+            results = {
+                word: out.split() if isinstance(out, str) else list(out)
+                for word, out in zip(chunk, self.g2p_batch(chunk))
+            }
+            self.backend_words += len(chunk)
+            self.phonemes.update(results)
+            if self.phoneme_cache is not None:
+                self.phoneme_cache.put_many(results)
+
+    def iter_text2tokens(self, lines: Iterable[str]) -> Iterator[List[str]]:
+        """Batched mode over any iterable of lines; yields the tokens of each line in order."""
+        if self.g2p_batch is None:
+            for line in lines:
+                yield self.text2tokens(line)
+            return
+        lines = iter(lines)
+        while True:
+            # Enough lines to fill roughly one backend chunk with new words
+            batch = [self._filter(line).split() for _, line in zip(range(self.g2p_chunk_size), lines)]
+            if not batch:
+                return
+            self._phonemize_words(w for words in batch for w in words)
+            for words in batch:
+                tokens = []
+                for i, word in enumerate(words):
+                    if i:
+                        tokens.extend(self.word_separator)
+                    tokens.extend(self.phonemes[word])
+                yield tokens
+
+    def batch_text2tokens(self, lines: Iterable[str]) -> List[List[str]]:
+        return list(self.iter_text2tokens(lines))
+
     def text2tokens(self, line: str) -> List[str]:
-        tokens = []
-        while len(line) != 0:
-            for w in self.non_linguistic_symbols:
-                if line.startswith(w):
-                    if not self.remove_non_linguistic_symbols:
-                        tokens.append(line[: len(w)])
-                    line = line[len(w) :]
-                    break
-            else:
-                t = line[0]
-                tokens.append(t)
-                line = line[1:]
+        if self.phoneme_cache is not None:
+            return self.batch_text2tokens([line])[0]
+
+        tokens = self.scanner.scan(line, keep_symbols=not self.remove_non_linguistic_symbols)
 
         # Reconstruct filtered line
         line = "".join(tokens)
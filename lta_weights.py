@@ -0,0 +1,135 @@
+# --- LTA Word-Weight Kernel ---
+# One word-weight computation for the stylometry scripts, instead of a
+# per-character dict lookup inside a Python generator per word.
+#
+# A document is turned into its code points once (one uint32 per character,
+# so array positions are str positions). Letter weights are a uint16 table
+# indexed by code point, words are runs of a character class, and every word
+# weight comes out of a single np.add.reduceat over the word boundaries.
+
+import numpy as np
+
+BMP_SIZE = 0x10000
+
+# a=1, b=2, ... z=26, the letter values most of the scripts use
+ALPHA_WEIGHTS = {chr(ord('a') + i): i + 1 for i in range(26)}
+
+def code_points(text):
+    """The document as a uint32 array with one entry per character."""
+    return np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+
+def _is_word_char(c):
+    # What re's \w matches in a str pattern
+    return c.isalnum() or c == "_"
+
+class WordPattern:
+    """
+    A word definition: maximal runs of characters for which `member` holds.
+    With isolated=True a run is dropped if it touches a \\w character outside
+    the class, which is what \\b<class>+\\b matches.
+    """
+
+    def __init__(self, member, isolated=False):
+        self.member = member
+        self.isolated = isolated
+        self._tables = {}
+
+    def _table(self, predicate):
+        table = self._tables.get(predicate)
+        if table is None:
+            table = np.fromiter((predicate(chr(i)) for i in range(BMP_SIZE)), dtype=bool, count=BMP_SIZE)
+            # Surrogates only appear in undecodable input, never inside words
+            table[0xD800:0xE000] = False
+            self._tables[predicate] = table
+        return table
+
+    def _mask(self, codes, predicate):
+        mask = self._table(predicate).take(codes, mode="clip")
+        if len(codes) and codes.max() >= BMP_SIZE:
+            astral = codes >= BMP_SIZE
+            values, inverse = np.unique(codes[astral], return_inverse=True)
+            mask[astral] = np.array([predicate(chr(v)) for v in values], dtype=bool)[inverse]
+        return mask
+
+    def spans(self, codes):
+        """(starts, ends) of every word in a code point array, in order."""
+        inside = np.zeros(len(codes) + 2, dtype=bool)
+        inside[1:-1] = self._mask(codes, self.member)
+        edges = np.flatnonzero(inside[1:] != inside[:-1])
+        starts, ends = edges[0::2], edges[1::2]
+        if self.isolated and len(starts):
+            word = self._mask(codes, _is_word_char)
+            before = np.zeros(len(starts), dtype=bool)
+            has_before = starts > 0
+            before[has_before] = word[starts[has_before] - 1]
+            after = np.zeros(len(ends), dtype=bool)
+            has_after = ends < len(codes)
+            after[has_after] = word[ends[has_after]]
+            keep = ~(before | after)
+            starts, ends = starts[keep], ends[keep]
+        return starts, ends
+
+LOWER_WORDS = WordPattern(lambda c: "a" <= c <= "z") # [a-z]+
+ALPHA_WORDS = WordPattern(lambda c: "a" <= c <= "z" or "A" <= c <= "Z", isolated=True) # \b[a-zA-Z]+\b
+WORD_RUNS = WordPattern(_is_word_char) # \b\w+\b
+ARABIC_WORDS = WordPattern(lambda c: "\u0600" <= c <= "\u06ff") # [\u0600-\u06FF]+
+
+class WeightTable:
+    """
+    Letter weights as a uint16 array indexed by code point; characters
+    without a weight count as `default`. With fold_case=True the upper-case
+    form of every single-letter key gets the same weight, so words need not be
+    lower-cased first.
+    """
+
+    def __init__(self, weight_map, default=0, fold_case=False):
+        weights = dict(weight_map)
+        if fold_case:
+            for char, weight in list(weights.items()):
+                upper = char.upper()
+                if len(upper) == 1 and upper.lower() == char:
+                    weights.setdefault(upper, weight)
+        # One slot past the largest key holds the default for every higher code point
+        size = max((ord(c) for c in weights if len(c) == 1), default=0) + 2
+        self.default = default
+        self.table = np.full(size, default, dtype=np.uint16)
+        for char, weight in weights.items():
+            if len(char) == 1:
+                self.table[ord(char)] = weight
+
+    def char_weights(self, codes):
+        """Weight of every character in a code point array."""
+        return self.table.take(codes, mode="clip")
+
+    def word_weight(self, word):
+        """Weight of a single word."""
+        return int(self.char_weights(code_points(word)).sum(dtype=np.int64))
+
+    def weigh(self, codes, starts, ends):
+        """Weights of the words codes[starts[i]:ends[i]] in one reduceat."""
+        if not len(starts):
+            return np.zeros(0, dtype=np.int64)
+        # Slices alternate word, gap, word, ...; words are disjoint runs, so
+        # the boundaries are strictly increasing. A word running to the end
+        # of the text needs no closing boundary.
+        bounds = np.empty(2 * len(starts), dtype=np.int64)
+        bounds[0::2] = starts
+        bounds[1::2] = ends
+        if bounds[-1] == len(codes):
+            bounds = bounds[:-1]
+        return np.add.reduceat(self.char_weights(codes), bounds, dtype=np.int64)[0::2]
+
+    def word_weights(self, text, pattern=LOWER_WORDS):
+        """Weight of every word of text (a str or code point array), in order."""
+        codes = code_points(text) if isinstance(text, str) else text
+        starts, ends = pattern.spans(codes)
+        return self.weigh(codes, starts, ends)
+
+def weight_stats(weights):
+    """(n, mean, population standard deviation) of a weight array."""
+    n = len(weights)
+    if n == 0:
+        return 0, 0.0, 0.0
+    values = np.asarray(weights, dtype=np.float64)
+    mean = float(values.mean())
+    return n, mean, float(np.sqrt(((values - mean) ** 2).mean()))
@@ -3,6 +3,10 @@ import subprocess
 import json
 import sys
 import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import linguistic_topology_app
 
 # Path to the compiled Go binary
@@ -22,43 +26,229 @@ def run_go_analysis(file_path):
             check=True
         )
         return json.loads(result.stdout)
-    except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
+    except (subprocess.CalledProcessError, json.JSONDecodeError, OSError) as e:
         print(f"Warning: Go accelerator failed ({e}). Falling back to Python.")
         return None
 
-def print_results(data):
-    """Formats and prints the analysis results (matches original app style)."""
-    print(f"\n--- Analysis for: {data['language_name']} ---")
-    print(f"Structure: {data['distinct_rivers']} Distinct River(s) found for integers 0-100.")
-    print("-" * 40)
-    
-    # Sort just in case JSON order varied (Go handles sorting, but good to be safe)
-    rivers = sorted(data['rivers'], key=lambda x: x['count'], reverse=True)
-    
-    for i, river in enumerate(rivers):
-        tail = river['tail_preview']
-        # Extract just the numbers for the preview if needed, or use as is
-        # The Go app returns "...1 2 3", Python app expects "...(1, 2, 3)"
-        # We'll format it to look similar
-        
-        print(f"  River #{i+1}: {river['percentage']}% of numbers converge here.")
-        print(f"     -> Ends in pattern: {tail}")
+def go_limits(config):
+    """SimulationConfig -> the limit fields of a Go request (Go seeds always start at 0)."""
+    if config is None:
+        return {}
+    if config.seed_start != 0 or config.min_path != 5:
+        raise ValueError("Go accelerator only runs seeds from 0 with 5-node minimum paths")
+    return {
+        "seeds": config.seed_stop,
+        "value_limit": config.value_limit,
+        "max_steps": config.max_steps,
+        "tail_size": config.tail_size,
+    }
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python lta_wrapper.py <lang_file>")
-        sys.exit(1)
+class GoWorker:
+    """
+    A long-lived `lta_core -serve` process. Requests and results are
+    newline-delimited JSON, so one worker answers any number of languages
+    without paying process start-up per file.
+    """
+
+    def __init__(self, binary_path=GO_BINARY_PATH):
+        self.proc = subprocess.Popen(
+            [binary_path, "-serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1
+        )
+        self._next_id = 0
+        # stderr is drained continuously, so diagnostics can never fill the
+        # pipe and block the server; the last lines are kept for errors.
+        self._stderr = deque(maxlen=20)
+        self._drain = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._drain.start()
+        self._probe()
+
+    def _drain_stderr(self):
+        for line in self.proc.stderr:
+            self._stderr.append(line.rstrip("\n"))
+
+    def _stderr_line(self, default, first=False):
+        """The first (or last) kept stderr line of an exited process, or `default`."""
+        self._drain.join(timeout=1)
+        if not self._stderr:
+            return default
+        return self._stderr[0] if first else self._stderr[-1]
+
+    def _probe(self):
+        """
+        Sends an empty request, which a -serve process answers with an error
+        line. Builds without -serve exit on the unknown flag instead; raises
+        OSError for those so callers fall back to the Python engine.
+        """
+        try:
+            self.proc.stdin.write("{}\n")
+            self.proc.stdin.flush()
+            line = self.proc.stdout.readline()
+        except OSError:
+            line = ""
+        if not line:
+            self.proc.kill()
+            self.proc.wait()
+            raise OSError(f"lta_core has no -serve mode ({self._stderr_line('exited', first=True)}); "
+                          f"rebuild it with: cd go_core && go build -o lta_core lta_core.go")
+
+    def analyze(self, file_path=None, rules=None, config=None):
+        """
+        Analyzes a .lang file path, or an inline rule set given as the
+        {key: value} pairs of a .lang file. Returns the result dict.
+        `config` is an optional lta_engine.SimulationConfig.
+        """
+        self._next_id += 1
+        request = {"id": self._next_id, **go_limits(config)}
+        if file_path is not None:
+            request["file"] = file_path
+        else:
+            request["rules"] = {str(k): str(v) for k, v in rules.items()}
+
+        self.proc.stdin.write(json.dumps(request, ensure_ascii=False) + "\n")
+        self.proc.stdin.flush()
+        line = self.proc.stdout.readline()
+        if not line:
+            raise RuntimeError(f"Go accelerator exited unexpectedly ({self._stderr_line('no message')})")
+
+        response = json.loads(line)
+        if response.get("error"):
+            raise RuntimeError(response["error"])
+        return response["result"]
+
+    def close(self):
+        if self.proc.poll() is None:
+            self.proc.stdin.close()
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class GoWorkerPool:
+    """A fixed set of GoWorkers shared by threads; each request borrows an idle one."""
+
+    def __init__(self, size=None, binary_path=GO_BINARY_PATH):
+        size = size or os.cpu_count() or 1
+        self.workers = []
+        try:
+            for _ in range(size):
+                self.workers.append(GoWorker(binary_path))
+        except OSError:
+            self.close()
+            raise
+        self._idle = queue.Queue()
+        for worker in self.workers:
+            self._idle.put(worker)
+
+    def analyze(self, file_path=None, rules=None, config=None):
+        worker = self._idle.get()
+        try:
+            return worker.analyze(file_path=file_path, rules=rules, config=config)
+        finally:
+            self._idle.put(worker)
+
+    def analyze_many(self, file_paths, config=None):
+        """Analyzes every path across the pool; results are in input order."""
+        with ThreadPoolExecutor(max_workers=len(self.workers)) as executor:
+            return list(executor.map(lambda p: self.analyze(file_path=p, config=config), file_paths))
+
+    def close(self):
+        for worker in self.workers:
+            worker.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def start_go_worker():
+    """Returns a GoWorker, or None if the binary is missing, will not start or cannot serve."""
+    if not os.path.exists(GO_BINARY_PATH):
+        return None
+    try:
+        return GoWorker()
+    except OSError as e:
+        print(f"Warning: Go accelerator failed to start ({e}). Falling back to Python.")
+        return None
+
+def analyze_file(file_path, worker=None):
+    """
+    Analyzes one language and prints the report, preferring the Go engine.
+    Pass a GoWorker to reuse one accelerator process across calls.
+    """
+    go_result = None
+    if worker is not None:
+        try:
+            go_result = worker.analyze(file_path=file_path)
+        except (RuntimeError, OSError, ValueError) as e:
+            print(f"Warning: Go accelerator failed ({e}). Falling back to Python.")
+    else:
+        go_result = run_go_analysis(file_path)
+
+    if go_result and not is_current_result(go_result):
+        print("Warning: Go accelerator is an older build (no seeds/entropy in its results). Falling back to Python.")
+        go_result = None
 
-    file_path = sys.argv[1]
-    
-    # 1. Try Go Accelerator
-    go_result = run_go_analysis(file_path)
-    
     if go_result:
         print("(Using High-Performance Go Engine)")
         print_results(go_result)
     else:
-        # 2. Fallback to Python
         print("(Using Standard Python Engine)")
         lang_data = linguistic_topology_app.parse_lang_file(file_path)
         linguistic_topology_app.analyze_language(lang_data)
+
+# Result fields every current lta_core build reports
+GO_RESULT_KEYS = ("language_name", "seeds", "rivers", "entropy")
+
+def is_current_result(data):
+    """False for results of lta_core builds older than the seeds/entropy fields."""
+    return all(key in data for key in GO_RESULT_KEYS)
+
+def go_result_to_analysis(data):
+    """Converts a Go result into the simulate_language() dict shape."""
+    if not is_current_result(data):
+        missing = [key for key in GO_RESULT_KEYS if key not in data]
+        raise ValueError(f"Go result lacks {', '.join(missing)}; rebuild go_core/lta_core")
+    return {
+        "name": data["language_name"],
+        "seeds": data["seeds"],
+        "rivers": [river["members"] for river in data["rivers"]],
+        "entropy": data["entropy"],
+    }
+
+def print_results(data):
+    """Formats and prints the analysis results (same report as the Python engine)."""
+    print(linguistic_topology_app.format_analysis(go_result_to_analysis(data)))
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python lta_wrapper.py <lang_file> [<lang_file> ...]")
+        sys.exit(1)
+
+    file_paths = sys.argv[1:]
+
+    if len(file_paths) == 1:
+        analyze_file(file_paths[0])
+    else:
+        # Several languages: keep one accelerator process alive for all of them
+        worker = start_go_worker()
+        try:
+            for file_path in file_paths:
+                analyze_file(file_path, worker)
+        finally:
+            if worker is not None:
+                worker.close()
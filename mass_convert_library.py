@@ -1,62 +1,46 @@
 import os
-import subprocess
-import zipfile
-import re
+import argparse
+
+from lta_convert import convert_library, MANIFEST_NAME
+from lta_epub import extract_epub_file
 
 # Source files from the list generated
 INPUT_LIST = "files_to_convert.txt"
 OUTPUT_DIR = "/data/data/com.termux/files/home/coffee/test_documents/converted_library/"
-os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 def extract_epub(path, out_path):
     try:
-        with zipfile.ZipFile(path, 'r') as z:
-            html_files = [n for n in z.namelist() if n.endswith(('.html', '.xhtml', '.htm'))]
-            html_files.sort()
-            text_content = []
-            for h in html_files:
-                with z.open(h) as f:
-                    content = f.read().decode('utf-8', errors='ignore')
-                    text = re.sub(r'<[^>]+>', ' ', content)
-                    text = re.sub(r'\s+', ' ', text).strip()
-                    if text: text_content.append(text)
-            with open(out_path, 'w', encoding='utf-8') as f:
-                f.write("\n".join(text_content))
+        extract_epub_file(path, out_path)
         return True
     except: return False
 
+def print_record(record):
+    if record["status"] == "converted":
+        print(f"  [OK]   {os.path.basename(record['source'])} "
+              f"({record['elapsed']:.1f}s, accuracy {record['accuracy']:.1f}%)", flush=True)
+    elif record["status"] == "failed":
+        print(f"  [FAIL] {os.path.basename(record['source'])}: {record['error']}", flush=True)
+
 def main():
-    with open(INPUT_LIST, 'r') as f:
-        files = [line.strip() for line in f.readlines()]
+    parser = argparse.ArgumentParser(description="Convert every file in a list to .txt.")
+    parser.add_argument("--list", default=INPUT_LIST, help="File with one source path per line")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="Directory for the .txt files and the manifest")
+    parser.add_argument("--workers", type=int, default=None, help="Worker threads and processes (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="Convert even when the manifest says the output is current")
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    with open(args.list, 'r') as f:
+        files = [line.strip() for line in f if line.strip()]
 
     print(f"Starting mass conversion of {len(files)} files...")
-    
-    for path in files:
-        base = os.path.basename(path)
-        name, ext = os.path.splitext(base)
-        ext = ext.lower()
-        out_path = os.path.join(OUTPUT_DIR, name + ".txt")
-        
-        if os.path.exists(out_path): continue
-
-        if ext == ".epub":
-            extract_epub(path, out_path)
-        elif ext == ".pdf":
-            subprocess.run(["pdftotext", path, out_path], capture_output=True)
-        elif ext in [".docx", ".doc"]:
-            # Basic fallback: strings extraction or simple zip parse if docx
-            if ext == ".docx":
-                try:
-                    with zipfile.ZipFile(path, 'r') as z:
-                        content = z.read('word/document.xml').decode('utf-8')
-                        text = re.sub(r'<[^>]+>', ' ', content)
-                        with open(out_path, 'w', encoding='utf-8') as f:
-                            f.write(text)
-                except: pass
-            else:
-                subprocess.run(["strings", path, ">", out_path], shell=True)
-
-    print("Conversion complete.")
+    records = convert_library(files, args.out, os.path.join(args.out, MANIFEST_NAME),
+                              workers=args.workers, force=args.force, progress=print_record)
+
+    counts = {}
+    for record in records:
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+    print("Conversion complete. " + ", ".join(f"{n} {status}" for status, n in sorted(counts.items())))
 
 if __name__ == "__main__":
     main()
@@ -4,10 +4,12 @@ import re
 import shutil
 from collections import Counter
 
+from lta_corpus import CorpusIndex, STORE_DIR, bytes_digest, detect_language
+
 # Configuration
 SOURCE_DIR = "."
 # Skip these directories to avoid messing up code or system files
-SKIP_DIRS = {".git", ".gemini", "__pycache__", "node_modules", "Lazylist", "erik_calc"}
+SKIP_DIRS = {".git", ".gemini", "__pycache__", "node_modules", "Lazylist", "erik_calc", STORE_DIR}
 # Heuristics for splitting
 SPLIT_PATTERNS = [
     r"(\n\s*Chapter\s+[IVX0-9]+.*?\n)",  # Chapter I...
@@ -18,17 +20,6 @@ SPLIT_PATTERNS = [
     r"(\n\s*Date: \d{4}-\d{2}-\d{2}.*?\n)" # Date: YYYY-MM-DD...
 ]
 
-def calculate_md5(filepath):
-    """Calculates MD5 hash of a file."""
-    hash_md5 = hashlib.md5()
-    try:
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
-    except Exception:
-        return None
-
 def normalize_text(text):
     """
     Cleans up line breaks and spacing.
@@ -72,26 +63,27 @@ def normalize_text(text):
     normalized_lines.append(buffer_line)
     return "\n".join(normalized_lines)
 
+# Topic -> keywords, in priority order
+TOPIC_KEYWORDS = [
+    ("Machiavelli", ("machiavelli", "prince")),
+    ("OEIS_Sequences", ("oeis", "sequence")),
+    ("Gemini_Conversations", ("gemini", "assistant")),
+    ("Linguistic_Topology", ("linguistic", "topology")),
+    ("Ancient_Languages", ("sumerian", "cuneiform")),
+    ("Code_Snippets", ("python", "import os")),
+]
+
+def get_topic_tags(text):
+    """Every topic whose keywords appear in the text, in priority order."""
+    text_lower = text.lower()
+    return [topic for topic, keywords in TOPIC_KEYWORDS if any(k in text_lower for k in keywords)]
+
 def get_topics(text):
     """
     Simple keyword extraction to guess topic/group.
     """
-    text_lower = text.lower()
-    
-    if "machiavelli" in text_lower or "prince" in text_lower:
-        return "Machiavelli"
-    if "oeis" in text_lower or "sequence" in text_lower:
-        return "OEIS_Sequences"
-    if "gemini" in text_lower or "assistant" in text_lower:
-        return "Gemini_Conversations"
-    if "linguistic" in text_lower or "topology" in text_lower:
-        return "Linguistic_Topology"
-    if "sumerian" in text_lower or "cuneiform" in text_lower:
-        return "Ancient_Languages"
-    if "python" in text_lower or "import os" in text_lower:
-        return "Code_Snippets"
-    
-    return "Misc_Text"
+    tags = get_topic_tags(text)
+    return tags[0] if tags else "Misc_Text"
 
 def split_and_save(filepath, content):
     """
@@ -154,36 +146,35 @@ def split_and_save(filepath, content):
 
 def main():
     print("Starting Text Corpus Cleanup...")
-    
+    # Files organized by an earlier run and unchanged since are left alone
+    index = CorpusIndex(os.path.join(SOURCE_DIR, STORE_DIR))
+    try:
+        organize(index)
+    finally:
+        index.close()
+
+def organize(index):
     # 1. Deduplication
     print("\n--- Deduplication ---")
-    seen_hashes = {}
+    all_txt_files, changed = index.scan(SOURCE_DIR, SKIP_DIRS)
+    print(f"{len(all_txt_files)} text files, {len(changed)} new or changed since the last run.")
     duplicates_removed = 0
     
-    all_txt_files = []
-    for root, dirs, files in os.walk(SOURCE_DIR):
-        # Filter dirs
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            if file.endswith(".txt"):
-                path = os.path.join(root, file)
-                h = calculate_md5(path)
-                if h in seen_hashes:
-                    print(f"Removing duplicate: {path} (matches {seen_hashes[h]})")
-                    os.remove(path)
-                    duplicates_removed += 1
-                else:
-                    seen_hashes[h] = path
-                    all_txt_files.append(path)
+    for keep, *duplicates in index.find_duplicates(changed):
+        for path in duplicates:
+            print(f"Removing duplicate: {path} (matches {keep})")
+            os.remove(path)
+            index.forget(path)
+            duplicates_removed += 1
                     
     print(f"Removed {duplicates_removed} duplicates.")
     
     # 2. Cleaning & Splitting
     print("\n--- Cleaning & Splitting ---")
     processed_files = [] # List of final file paths
+    digests = {} # Final path -> digest, when the cleaned text was hashed in memory
     
-    for path in all_txt_files:
+    for path in changed:
         # Check if file still exists (might be removed if dup)
         if not os.path.exists(path): continue
         
@@ -193,12 +184,22 @@ def main():
                 
             cleaned_content = normalize_text(content)
             
+            # Cleaning can make a new file identical to one already organized
+            digest = bytes_digest(cleaned_content.encode('utf-8'))
+            existing = index.organized_path(digest)
+            if existing and existing != path:
+                print(f"Removing duplicate: {path} (matches {existing})")
+                os.remove(path)
+                index.forget(path)
+                continue
+            
             # Save or Split
             new_files = split_and_save(path, cleaned_content)
             if new_files:
                 processed_files.extend(new_files)
             else:
                 processed_files.append(path)
+                digests[path] = digest
                 
         except Exception as e:
             print(f"Error processing {path}: {e}")
@@ -207,8 +208,7 @@ def main():
     print("\n--- Grouping by Topic ---")
     
     # Ensure group dirs exist
-    groups = ["Machiavelli", "OEIS_Sequences", "Gemini_Conversations", 
-              "Linguistic_Topology", "Ancient_Languages", "Code_Snippets", "Misc_Text"]
+    groups = [topic for topic, _ in TOPIC_KEYWORDS] + ["Misc_Text"]
     
     for g in groups:
         os.makedirs(os.path.join(SOURCE_DIR, "Corpus_Groups", g), exist_ok=True)
@@ -221,17 +221,24 @@ def main():
                 # Read first 2000 chars for topic guess
                 sample = f.read(2000)
                 
-            topic = get_topics(sample)
+            tags = get_topic_tags(sample)
+            topic = tags[0] if tags else "Misc_Text"
             dest_dir = os.path.join(SOURCE_DIR, "Corpus_Groups", topic)
             filename = os.path.basename(path)
             dest_path = os.path.join(dest_dir, filename)
             
+            # Already in its group (a changed file from an earlier run)
+            in_place = os.path.exists(dest_path) and os.path.samefile(dest_path, path)
+            
             # Handle name collision in destination
-            if os.path.exists(dest_path):
+            if os.path.exists(dest_path) and not in_place:
                 base, ext = os.path.splitext(filename)
                 dest_path = os.path.join(dest_dir, f"{base}_{hashlib.md5(path.encode()).hexdigest()[:4]}{ext}")
             
-            shutil.move(path, dest_path)
+            if not in_place:
+                shutil.move(path, dest_path)
+                index.forget(path)
+            index.record(dest_path, digests.get(path), detect_language(sample), tags)
             
         except Exception as e:
             print(f"Error moving {path}: {e}")
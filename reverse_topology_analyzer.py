@@ -2,6 +2,10 @@ import os
 import re
 import numpy as np
 from language_math import HebrewGematriaProcessor
+from lta_weights import WeightTable, ALPHA_WEIGHTS, WORD_RUNS
+
+# a=1 ... z=26 in either case; digits and other word characters weigh 0
+LETTER_TABLE = WeightTable(ALPHA_WEIGHTS, fold_case=True)
 
 class ReverseTranslator:
     def __init__(self):
@@ -30,13 +34,12 @@ class ReverseTranslator:
         Calculates the 'Stress Point' where English grammar 
         fails to accommodate the original language's topology.
         """
-        eng_words = re.findall(r"\b\w+\b", eng_text)
         # Measure local convergence velocity (variance of word weights)
-        weights = [sum(ord(c)-96 for c in w.lower() if 'a'<=c<='z') for w in eng_words]
+        weights = LETTER_TABLE.word_weights(eng_text, WORD_RUNS)
         
         # High variance in English often indicates a 'forced' translation of 
         # a high-density original concept.
-        local_variance = np.var(weights) if weights else 0
+        local_variance = np.var(weights) if len(weights) else 0
         return local_variance
 
     def trace_enoch(self):
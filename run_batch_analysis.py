@@ -1,18 +1,24 @@
 import sys
 import os
 import glob
+import argparse
+from functools import partial
 
 # Ensure the current directory is in the path to import the app
 sys.path.append(os.getcwd())
 
 try:
-    from linguistic_topology_app import parse_lang_file, analyze_language
+    from linguistic_topology_app import format_analysis
+    from lta_batch import run_batch, simulate_file
+    from lta_engine import SimulationConfig
 except ImportError:
     # Try importing from the current directory if run from outside
     sys.path.append(os.path.join(os.getcwd(), 'linguistic_topology_repo'))
-    from linguistic_topology_app import parse_lang_file, analyze_language
+    from linguistic_topology_app import format_analysis
+    from lta_batch import run_batch, simulate_file
+    from lta_engine import SimulationConfig
 
-def run_analysis():
+def run_analysis(config=None):
     # List of new languages to check
     new_languages = [
         "apiaka_of_tocantins.lang", "arakaju.lang", "old_aramaic.lang", "baenan.lang", 
@@ -32,17 +38,24 @@ def run_analysis():
 
     print(f"Searching for language files in: {base_path}")
     
+    found = []
     for lang_file in new_languages:
         full_path = os.path.join(base_path, lang_file)
         if os.path.exists(full_path):
-            try:
-                print(f"\nProcessing {lang_file}...")
-                lang_data = parse_lang_file(full_path)
-                analyze_language(lang_data)
-            except Exception as e:
-                print(f"Error processing {lang_file}: {e}")
+            found.append(full_path)
         else:
             print(f"File not found: {full_path}")
 
+    # Simulate in parallel, report in list order
+    for res in run_batch(found, partial(simulate_file, config=config)):
+        lang_file = os.path.basename(res["item"])
+        print(f"\nProcessing {lang_file}...")
+        if res["ok"]:
+            print(format_analysis(res["result"]))
+        else:
+            print(f"Error processing {lang_file}: {res['error']}")
+
 if __name__ == "__main__":
-    run_analysis()
+    parser = argparse.ArgumentParser(description="Analyze the newly added languages in parallel.")
+    SimulationConfig.add_arguments(parser)
+    run_analysis(SimulationConfig().from_args(parser.parse_args()))
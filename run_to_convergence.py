@@ -5,67 +5,72 @@
 # This version runs the simulation until a true convergence point (a loop or
 # termination) is found, with safety breaks for exceptionally long paths.
 
-import sys
 import re
-from language_math import get_processor
+import argparse
+from collections import deque
+from language_math import get_processor, SCALE_KEYS
+from lta_engine import SimulationConfig
+
+# Seeds 0-100, values below 10^8, 10000 steps, exact 5-node tails
+DEFAULT_CONFIG = SimulationConfig(value_limit=100000000, max_steps=10000, tail_size=5)
 
 # --- 1. The Core Analysis Engine ---
 
-def analyze_language(lang_data):
-    """Runs the simulation for a given language's rules until convergence."""
-    paths = {}
-    
-    for start_num in range(101):
-        path = []
-        seen_in_path = set()
-        curr = start_num
+def trace_tail(lang_data, start_num, config):
+    """
+    Runs one seed until convergence with safety limits.
+    Returns (path length, last tail_size entries), or the full path as the
+    tail when config.store_paths is set.
+    """
+    path = [] if config.store_paths else deque(maxlen=config.tail_size)
+    count = 0
+    curr = start_num
+
+    # n -> n + L(n) strictly increases, so a path can never loop back
+    while curr < config.value_limit and count < config.max_steps:
+        path.append(curr)
+        count += 1
         
-        # Run until convergence with safety limits - pushed for full unity
-        while curr < 100000000 and len(path) < 10000:
-            if curr in seen_in_path:
-                path.append(f"LOOP_TO_{curr}")
-                break # Loop detected
-            
-            path.append(curr)
-            seen_in_path.add(curr)
-            
-            try:
-                length = lang_data["get_len_func"](curr, lang_data["rules"])
-                if length == 0: 
-                    break # Path terminated
-                curr += length
-            except Exception:
-                break # Error in length calculation
-        paths[start_num] = path
+        try:
+            length = lang_data["get_len_func"](curr, lang_data["rules"])
+            if length == 0: 
+                break # Path terminated
+            curr += length
+        except Exception:
+            break # Error in length calculation
+    return count, path
 
+def analyze_language(lang_data, config=DEFAULT_CONFIG):
+    """Runs the simulation for a given language's rules until convergence."""
     unique_rivers = []
     groups = {}
+    river_index = {} # tail -> river_id, replaces a scan over every river
     
-    for start_num in range(101):
-        my_path = paths.get(start_num, [])
-        if len(my_path) < 5: continue
-        my_tail = tuple(my_path[-5:])
+    # Only each seed's tail is kept, so memory does not grow with path length
+    for done, start_num in enumerate(config.seeds, 1):
+        count, my_path = trace_tail(lang_data, start_num, config)
+        config.report_progress(done)
+        if count < config.min_path: continue
+        my_tail = tuple(my_path)[-config.tail_size:]
         
-        found_river = False
-        for river_id, river_tail in enumerate(unique_rivers):
-            if my_tail == river_tail:
-                groups[river_id].append(start_num)
-                found_river = True
-                break
-        if not found_river:
+        river_id = river_index.get(my_tail)
+        if river_id is not None:
+            groups[river_id].append(start_num)
+        else:
             new_id = len(unique_rivers)
             unique_rivers.append(my_tail)
+            river_index[my_tail] = new_id
             groups[new_id] = [start_num]
 
     print(f"\n--- Full Convergence Analysis for: {lang_data['name']} ---")
-    print(f"Structure: {len(unique_rivers)} Distinct River(s) found for integers 0-100.")
+    print(f"Structure: {len(unique_rivers)} Distinct River(s) found for integers {config.seed_start}-{config.seed_stop - 1}.")
     print("-" * 40)
     
     sorted_groups = sorted(groups.items(), key=lambda item: len(item[1]), reverse=True)
     
     for i, (river_id, members) in enumerate(sorted_groups):
         count = len(members)
-        percent = count
+        percent = round(count * 100 / len(config.seeds), 2)
         tail_preview = unique_rivers[river_id]
         
         # Format the tail preview to be more readable
@@ -108,7 +113,7 @@ def parse_lang_file(filepath):
             num = int(key)
             rules["direct"][num] = value
             if 20 <= num <= 90 and num % 10 == 0: rules["tens"][num // 10] = value
-        elif key in ["hundred", "ten_sep", "hundred_sep"]: rules[key] = value
+        elif key in ["hundred", "ten_sep", "hundred_sep"] or key in SCALE_KEYS: rules[key] = value
 
     math_type = "western"
     name_lower = name.lower()
@@ -124,12 +129,13 @@ def parse_lang_file(filepath):
 # --- 3. Main Execution ---
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python run_to_convergence.py <lang.lang>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Run every seed of a language to full convergence.")
+    parser.add_argument("lang_file", metavar="lang.lang")
+    SimulationConfig.add_arguments(parser)
+    args = parser.parse_args()
     try:
-        lang_data = parse_lang_file(sys.argv[1])
-        analyze_language(lang_data)
+        lang_data = parse_lang_file(args.lang_file)
+        analyze_language(lang_data, DEFAULT_CONFIG.from_args(args))
     except FileNotFoundError as e:
         print(f"Error: {e}")
     except Exception as e:
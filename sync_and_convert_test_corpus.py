@@ -6,6 +6,9 @@ import subprocess
 import time
 import sys
 
+from lta_convert import calculate_accuracy, ScoredWriter # Also scores the conversion pipeline's manifest
+from lta_epub import write_epub_text
+
 # Configuration
 SOURCE_DIR = "/sdcard/Documents/test_files/"
 DEST_DIR = "/data/data/com.termux/files/home/coffee/test_documents/"
@@ -19,47 +22,22 @@ os.makedirs(DEST_DIR, exist_ok=True)
 os.makedirs(REPORT_DIR, exist_ok=True)
 os.makedirs(MAIN_STORAGE_REPORT_DIR, exist_ok=True)
 
-def calculate_accuracy(text):
-    if not text:
-        return 0.0
-    
-    total_chars = len(text)
-    if total_chars == 0:
-        return 0.0
-
-    # Count printable characters and common whitespace
-    # We want to penalize "garbage" characters or replacement chars.
-    printable_chars = len(re.findall(r'[a-zA-Z0-9\s.,!?;:()\'"-\[\]]', text))
-    
-    # Check for replacement characters or weird control codes (excluding standard whitespace)
-    replacement_chars = text.count('\ufffd')
-    
-    # Simple heuristic: Ratio of good chars to total.
-    accuracy = (printable_chars / total_chars) * 100
-    
-    # Penalize specific "bad" indicators heavily
-    if replacement_chars > 0:
-        accuracy -= (replacement_chars / total_chars) * 100 * 2 # Double penalty
-    
-    return max(0.0, min(100.0, accuracy))
-
-def extract_epub(path):
+def extract_epub(path, txt_path):
+    """Streams the EPUB's text into txt_path; returns its accuracy, or None if it has no text."""
+    tmp_path = txt_path + ".tmp"
     try:
-        text_content = []
-        with zipfile.ZipFile(path, 'r') as z:
-            html_files = [n for n in z.namelist() if n.endswith(('.html', '.xhtml', '.htm'))]
-            html_files.sort()
-            for h in html_files:
-                with z.open(h) as f:
-                    content = f.read().decode('utf-8', errors='ignore')
-                    # Simple HTML tag stripping
-                    text = re.sub(r'<[^>]+>', ' ', content)
-                    text = re.sub(r'\s+', ' ', text).strip()
-                    if text: text_content.append(text)
-        return "\n".join(text_content)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            out = ScoredWriter(f)
+            write_epub_text(path, out)
+        if out.has_text:
+            os.replace(tmp_path, txt_path)
+            return out.accuracy()
     except Exception as e:
         print(f"Error extracting EPUB {path}: {e}")
-        return None
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return None
 
 def extract_pdf(path):
     try:
@@ -171,9 +149,12 @@ def main():
         
         original_size = os.path.getsize(file_path)
         converted_text = None
+        accuracy = None
+        txt_path = os.path.join(DEST_DIR, base_name + ".txt")
         
         if ext == '.epub':
-            converted_text = extract_epub(file_path)
+            # Written and scored as it streams, never held in memory
+            accuracy = extract_epub(file_path, txt_path)
         elif ext == '.pdf':
             converted_text = extract_pdf(file_path)
         elif ext == '.docx':
@@ -187,11 +168,11 @@ def main():
             
         if converted_text and len(converted_text.strip()) > 0:
             accuracy = calculate_accuracy(converted_text)
-            error_pct = 100.0 - accuracy
-            
-            txt_path = os.path.join(DEST_DIR, base_name + ".txt")
             with open(txt_path, 'w', encoding='utf-8') as f:
                 f.write(converted_text)
+
+        if accuracy is not None:
+            error_pct = 100.0 - accuracy
             
             status = "SUCCESS"
             if accuracy < 50.0:
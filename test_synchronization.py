@@ -1,22 +1,9 @@
-def num_to_english(n):
-    ones = ["zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten", 
-            "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
-    tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
-    
-    if n < 20: return ones[n]
-    if n < 100:
-        res = tens[n // 10]
-        if n % 10 > 0: res += ones[n % 10]
-        return res
-    if n < 1000:
-        res = ones[n // 100] + "hundred"
-        if n % 100 > 0: res += num_to_english(n % 100)
-        return res
-    return str(n)
+from lta_oracle import english_oracle
+
+oracle = english_oracle()
 
 def get_next_val(curr):
-    name = num_to_english(curr)
-    length = len(name.replace(" ", "").replace("-", ""))
+    length = oracle.length(curr)
     # Parity logic: Even = Positive, Odd = Negative
     val = length if curr % 2 == 0 else -length
     return curr + length, val
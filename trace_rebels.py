@@ -1,37 +1,9 @@
-def get_english_name(n):
-    ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten", 
-            "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
-    tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
-    
-    if n == 0: return "zero"
-    
-    if n >= 1000: # Simple support for larger numbers to track long convergences
-        k = n // 1000
-        rem = n % 1000
-        base = get_english_name(k) + "thousand"
-        if rem == 0: return base
-        return base + get_english_name(rem)
-        
-    if n >= 100:
-        h = n // 100
-        rem = n % 100
-        base = ones[h] + "hundred"
-        if rem == 0: return base
-        return base + get_english_name(rem)
+from lta_oracle import english_oracle
 
-    if n < 20: return ones[n]
-    if n < 100: return tens[n // 10] + ones[n % 10]
-    return ""
+oracle = english_oracle()
 
 def trace_path(start_num, limit=50):
-    path = []
-    curr = start_num
-    for _ in range(limit):
-        path.append(curr)
-        name = get_english_name(curr)
-        length = len(name.replace(" ", "").replace("-", ""))
-        curr = curr + length
-    return path
+    return oracle.path(start_num, limit)
 
 # Trace Main Trunk (0) and Rebel (83)
 trunk_path = trace_path(0, 100)
@@ -1,5 +1,11 @@
 import os
 import sys
+import argparse
+
+import numpy as np
+
+from lta_cache import TrajectoryCache, rules_hash
+from lta_engine import TrunkIndex, find_merge
 
 # --- CONFIGURATION ---
 LANG_DIR = "linguistic_topology_repo/languages"
@@ -91,16 +97,41 @@ def get_name_length(n, lang_data):
     if n == 0: return len(rules["direct"].get(0, "zero").replace(" ", ""))
     return construct_len(n)
 
-def verify_language_convergence(lang_path):
+def format_result(name, steps, rebels):
+    if not rebels:
+        return f"{name}: 100% Convergence (Verified up to {steps} steps)."
+    else:
+        return f"{name}: FAILED CONVERGENCE. Rebels persist: {rebels[:5]}... (Checked {EXTENSION_LIMIT} steps)"
+
+def verify_language_convergence(lang_path, cache=None, compact_trunk=False):
+    """
+    Checks that seeds 1-20 merge into the trunk of seed 0 (or 1) within
+    MAX_STEPS, then extends rebels and the trunk to EXTENSION_LIMIT steps
+    with lock-step merge detection (no path is stored). With compact_trunk
+    the MAX_STEPS trunk is kept in a lta_engine.TrunkIndex instead of a set:
+    about 1-2 bytes per node instead of ~60, at roughly half the lookup speed.
+    """
     lang_data = parse_lang_file(lang_path)
     name = lang_data["name"]
+
+    # Reuse the verdict if neither the rules nor the limits changed
+    # (extension_steps: older verdicts cached EXTENSION_LIMIT, not the walk)
+    key = rules_hash(lang_data["rules"], "verify", max_steps=MAX_STEPS,
+                     extension_limit=EXTENSION_LIMIT, seeds=[1, 21],
+                     extension_steps="walked")
+    if cache is not None:
+        data = cache.load(name, "convergence", key)
+        if data is not None:
+            return format_result(name, int(data["steps"]), data["rebels"].tolist())
+
     print(f"Verifying Convergence: {name}...")
 
     # 1. Generate Main Trunk (Seed 0)
-    trunk_set = set()
+    trunk_set = TrunkIndex() if compact_trunk else set()
     trunk_max = 0
     curr = 0
     if 0 not in lang_data["rules"]["direct"] and "TECH" not in name: curr = 1
+    trunk_start = curr
     
     # Run Trunk for initial MAX_STEPS
     steps = 0
@@ -149,54 +180,50 @@ def verify_language_convergence(lang_path):
     if rebels:
         print(f"  ! Found {len(rebels)} Potential Rebels (e.g., {rebels[0]}). Extending search...")
         
-        # Extend Trunk further
-        while steps < EXTENSION_LIMIT:
-            trunk_set.add(curr)
-            l = get_name_length(curr, lang_data)
-            if l == 0: break
-            curr += l
-            steps += 1
-            
-        # Retry Rebels against extended trunk
+        # Both paths strictly increase, so each rebel is walked in lock-step
+        # with the trunk from its start: whichever is behind advances.
+        # Nothing is stored, so EXTENSION_LIMIT is bounded by time only.
+        length_fn = lambda n: get_name_length(n, lang_data)
         still_rebel = []
         for r_seed in rebels:
-            r_curr = r_seed
-            r_steps = 0
-            r_merged = False
-            while r_steps < EXTENSION_LIMIT:
-                if r_curr in trunk_set:
-                    r_merged = True
-                    break
-                l = get_name_length(r_curr, lang_data)
-                if l == 0: break
-                r_curr += l
-                r_steps += 1
-            
-            if not r_merged:
+            merge = find_merge(length_fn, trunk_start, r_seed,
+                               EXTENSION_LIMIT - 1, EXTENSION_LIMIT - 1)
+            if not merge["merged"]:
                 still_rebel.append(r_seed)
         
         rebels = still_rebel
 
+        # Report how far the trunk really runs, which may end short of
+        # EXTENSION_LIMIT; the walk is not stored either
+        while steps < EXTENSION_LIMIT:
+            l = get_name_length(curr, lang_data)
+            if l == 0: break
+            curr += l
+            steps += 1
+
     # Result
-    if not rebels:
-        return f"{name}: 100% Convergence (Verified up to {steps} steps)."
-    else:
-        return f"{name}: FAILED CONVERGENCE. Rebels persist: {rebels[:5]}... (Checked {EXTENSION_LIMIT} steps)"
+    if cache is not None:
+        cache.save(name, "convergence", key, steps=np.int64(steps), rebels=np.array(rebels, dtype=np.int64))
+    return format_result(name, steps, rebels)
 
-def main():
+def main(compact_trunk=False):
     files = sorted([f for f in os.listdir(LANG_DIR) if f.endswith('.lang')])
     report_path = os.path.join(OUTPUT_DIR, "PROOF_OF_CONVERGENCE.txt")
+    cache = TrajectoryCache()
     
     with open(report_path, 'w') as f:
         f.write("LINGUISTIC TOPOLOGY: CONVERGENCE PROOF REPORT\n")
         f.write("=============================================\n")
         
         for lang_file in files:
-            result = verify_language_convergence(os.path.join(LANG_DIR, lang_file))
+            result = verify_language_convergence(os.path.join(LANG_DIR, lang_file), cache, compact_trunk)
             print(f"  > {result}")
             f.write(result + "\n")
             
     print(f"\nProof Report Saved: {report_path}")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Verify that every language converges to one trunk.")
+    parser.add_argument("--compact-trunk", action="store_true",
+                        help="Store the trunk as compressed sorted blocks (for very large EXTENSION_LIMIT)")
+    main(parser.parse_args().compact_trunk)
@@ -0,0 +1,90 @@
+import os
+import sys
+import glob
+import tempfile
+
+import numpy as np
+
+# Ensure we can import the app
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lta_rulepack import load_catalogue
+from lta_engine import ConvergenceGraph
+from lta_basins import LABELS, label_basins
+
+# --- CONFIGURATION ---
+LANG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "languages")
+VALUE_LIMIT = 3000
+CHUNK_SIZE = 211 # Small and odd, so paths cross many chunk boundaries
+
+def reference_labels(processor, value_limit):
+    """The same labels from ConvergenceGraph merge points and plain walks."""
+    graph = ConvergenceGraph(processor, value_limit=value_limit, max_steps=value_limit, tail_size=1)
+    succ = []
+    for n in range(value_limit):
+        graph.trace(n)
+        nxt = graph.successor[n]
+        succ.append(-1 if nxt is None else nxt)
+
+    source = list(range(value_limit))
+    for n in range(value_limit):
+        if succ[n] >= 0:
+            source[succ[n]] = min(source[succ[n]], source[n])
+
+    labels = {name: [] for name in LABELS}
+    for n in range(value_limit):
+        root = n
+        while succ[root] >= 0:
+            root = succ[root]
+        merge = graph.merge_point[n]
+        depth = -1
+        if merge is not None:
+            depth, curr = 0, n
+            while curr != merge:
+                curr = succ[curr]
+                depth += 1
+        labels["source"].append(source[n])
+        labels["river"].append(source[root])
+        labels["merge_target"].append(-1 if merge is None else merge)
+        labels["merge_depth"].append(depth)
+    return labels
+
+def check_language(processor):
+    """Returns the first label that disagrees with the reference, or None."""
+    expected = reference_labels(processor, VALUE_LIMIT)
+    with tempfile.TemporaryDirectory() as out_dir:
+        label_basins(processor, VALUE_LIMIT, out_dir, chunk_size=CHUNK_SIZE)
+        for name in LABELS:
+            got = np.load(os.path.join(out_dir, f"{name}.npy"))
+            bad = np.flatnonzero(got != np.array(expected[name]))
+            if bad.size:
+                n = int(bad[0])
+                return f"{name}[{n}] = {got[n]}, expected {expected[name][n]}"
+    return None
+
+def main():
+    lang_files = sorted(glob.glob(os.path.join(LANG_DIR, "*.lang")))
+    print(f"Verifying basin labels for {len(lang_files)} languages (0-{VALUE_LIMIT - 1})...")
+
+    failures = []
+    checked = 0
+    catalogue = load_catalogue(lang_files)
+    for lang_file in lang_files:
+        lang_data = catalogue[lang_file]
+        if isinstance(lang_data, Exception):
+            continue # Skipped languages are reported by verify_length_tables
+        problem = check_language(lang_data["processor"])
+        checked += 1
+        if problem is not None:
+            failures.append(f"{os.path.basename(lang_file)}: {problem}")
+
+    print(f"Checked {checked} languages.")
+    if failures:
+        print("MISMATCHES:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("All basin labels match ConvergenceGraph and plain walks.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+import functools
+
+# Ensure we can import the engine
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lta_batch import run_batch
+from lta_engine import ConvergenceGraph
+
+# --- CONFIGURATION ---
+STEPS = 100 # Nodes in every seed's path
+DELAY = 0.02 # Seconds per length call
+SHORT_TIMEOUT = 0.5 # Fires after about 25 length calls
+LONG_TIMEOUT = 30
+
+class SlowProcessor:
+    """Every number has length 1, after DELAY seconds; length_table is slow and then fails."""
+    name = "Slow"
+
+    def get_length(self, n):
+        time.sleep(DELAY)
+        return 1
+
+    def length_table(self, max_n):
+        time.sleep(10 * DELAY)
+        raise MemoryError("no table")
+
+def path_length(use_table, seed):
+    graph = ConvergenceGraph(SlowProcessor(), value_limit=10**6, max_steps=STEPS, use_table=use_table)
+    return graph.path_length(seed)
+
+def check(use_table, max_workers):
+    """Returns a description of the first problem, or None."""
+    task = functools.partial(path_length, use_table)
+    slow, = run_batch([0], task, max_workers=max_workers, timeout=SHORT_TIMEOUT)
+    if slow["ok"] or "Timed out" not in (slow["error"] or ""):
+        return f"timeout inside get_length reported as {slow}"
+    full, = run_batch([0], task, max_workers=max_workers, timeout=LONG_TIMEOUT)
+    if not full["ok"] or full["result"] != STEPS:
+        return f"untimed run gave {full}"
+    return None
+
+def main():
+    print("Verifying that batch timeouts fire through the engine's length fallbacks...")
+    failures = []
+    for use_table in (False, True):
+        for max_workers in (1, 2):
+            problem = check(use_table, max_workers)
+            if problem is not None:
+                failures.append(f"table {use_table}, workers {max_workers}: {problem}")
+
+    if failures:
+        print("MISMATCHES:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("Timed-out tasks fail instead of returning truncated paths.")
+
+if __name__ == "__main__":
+    main()
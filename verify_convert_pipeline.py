@@ -0,0 +1,136 @@
+import os
+import re
+import sys
+import html
+import json
+import random
+import zipfile
+import tempfile
+
+# Ensure we can import the engine
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lta_convert import convert_library, calculate_accuracy, MANIFEST_NAME
+
+# --- CONFIGURATION ---
+DOCUMENTS = 24 # Per format
+WORKER_COUNTS = [1, 4]
+
+WORDS = ["In", "the", "beginning", "was", "Fohat", "café", "ΣΟΦΙΑ", "<b>", "</b>", "&amp;", "\n", "  "]
+
+def serial_epub(path):
+    """EPUB extraction as mass_convert_library first did it, plus the entity decoding a parser does."""
+    with zipfile.ZipFile(path, 'r') as z:
+        html_files = [n for n in z.namelist() if n.endswith(('.html', '.xhtml', '.htm'))]
+        html_files.sort()
+        text_content = []
+        for h in html_files:
+            with z.open(h) as f:
+                content = f.read().decode('utf-8', errors='ignore')
+                text = re.sub(r'<[^>]+>', ' ', content)
+                text = re.sub(r'\s+', ' ', text).strip()
+                if text: text_content.append(html.unescape(text))
+    return "\n".join(text_content)
+
+def serial_docx(path):
+    with zipfile.ZipFile(path, 'r') as z:
+        content = z.read('word/document.xml').decode('utf-8', errors='ignore')
+        text = re.sub(r'<[^>]+>', ' ', content)
+        return re.sub(r'\s+', ' ', text).strip()
+
+def random_markup(rng):
+    return "<p>" + " ".join(rng.choice(WORDS) for _ in range(rng.randrange(1, 200))) + "</p>"
+
+def make_library(folder, rng):
+    """Writes EPUB, DOCX and DOC files; returns (paths, {path: expected text})."""
+    paths, expected = [], {}
+    for i in range(DOCUMENTS):
+        path = os.path.join(folder, f"book_{i}.epub")
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr("mimetype", "application/epub+zip")
+            for c in range(rng.randrange(1, 6)):
+                z.writestr(f"OEBPS/chapter_{c}.xhtml", random_markup(rng))
+        paths.append(path)
+        expected[path] = serial_epub(path)
+
+        path = os.path.join(folder, f"letter_{i}.docx")
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr("word/document.xml", f"<w:document><w:body>{random_markup(rng)}</w:body></w:document>")
+        paths.append(path)
+        expected[path] = serial_docx(path)
+
+    path = os.path.join(folder, "legacy.doc")
+    with open(path, 'wb') as f:
+        f.write(b"\x00\x01binary\x02The legacy text survives\x00\xff")
+    paths.append(path)
+    paths.append(os.path.join(folder, "missing.epub"))
+    paths.append(os.path.join(folder, "notes.odt"))
+    return paths, expected
+
+def manifest_lines(out_dir):
+    with open(os.path.join(out_dir, MANIFEST_NAME), encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+def check(workers):
+    """Returns a description of the first problem, or None."""
+    with tempfile.TemporaryDirectory() as folder:
+        out_dir = os.path.join(folder, "converted")
+        os.makedirs(out_dir)
+        paths, expected = make_library(folder, random.Random(workers))
+
+        records = convert_library(paths, out_dir, workers=workers)
+        status = {os.path.basename(r["source"]): r["status"] for r in records}
+        if status["missing.epub"] != "failed" or status["notes.odt"] != "unsupported":
+            return f"missing/unsupported files: {status['missing.epub']}, {status['notes.odt']}"
+        if status["legacy.doc"] != "converted":
+            return f"legacy.doc: {status['legacy.doc']}"
+        for record in records:
+            if record["source"] not in expected:
+                continue
+            if record["status"] != "converted":
+                return f"{record['source']}: {record.get('error', record['status'])}"
+            with open(record["output"], encoding='utf-8') as f:
+                text = f.read()
+            if text != expected[record["source"]]:
+                return f"{record['source']}: text differs from the serial extraction"
+            if record["accuracy"] != calculate_accuracy(text) or record["elapsed"] < 0:
+                return f"{record['source']}: manifest score or timing is wrong"
+        logged = len(manifest_lines(out_dir))
+        if logged != len(expected) + 2:
+            return f"manifest has {logged} records after the first run"
+
+        # Nothing changed: every source is skipped and nothing is logged
+        records = convert_library(paths, out_dir, workers=workers)
+        if any(r["status"] == "converted" for r in records) or len(manifest_lines(out_dir)) != logged + 1:
+            return "second run reconverted a file (only missing.epub may be logged again)"
+
+        # Touched: skipped by hash. Rewritten: converted again.
+        touched, rewritten = paths[0], paths[2]
+        os.utime(touched, ns=(0, 10**18))
+        with zipfile.ZipFile(rewritten, 'a') as z:
+            z.writestr("OEBPS/zz_appendix.xhtml", "<p>Appendix</p>")
+        records = {r["source"]: r["status"] for r in convert_library(paths, out_dir, workers=workers)}
+        if records[touched] != "skipped" or records[rewritten] != "converted":
+            return f"touched: {records[touched]}, rewritten: {records[rewritten]}"
+        with open(os.path.splitext(os.path.join(out_dir, os.path.basename(rewritten)))[0] + ".txt", encoding='utf-8') as f:
+            if f.read() != serial_epub(rewritten):
+                return "rewritten source: text differs"
+    return None
+
+def main():
+    print(f"Verifying the conversion pipeline on {2 * DOCUMENTS + 3} files per run...")
+    failures = []
+    for workers in WORKER_COUNTS:
+        problem = check(workers)
+        if problem is not None:
+            failures.append(f"workers {workers}: {problem}")
+
+    if failures:
+        print("MISMATCHES:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("Pipeline output matches serial extraction, and unchanged sources are skipped.")
+
+if __name__ == "__main__":
+    main()
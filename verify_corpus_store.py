@@ -0,0 +1,122 @@
+import io
+import os
+import sys
+import random
+import tempfile
+import contextlib
+
+# Ensure we can import the engine
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import organize_text_corpus
+from lta_corpus import CorpusIndex, STORE_DIR, file_digest, HEAD_BYTES
+
+# --- CONFIGURATION ---
+UNIQUE_FILES = 60
+SAME_SIZE_FILES = 8 # Different texts of one size, above HEAD_BYTES, differing only at the end
+
+TOPIC_WORDS = ["topology", "sequence", "prince", "cuneiform", "python", "river", "stone", "word"]
+
+def random_text(rng, words=120):
+    return " ".join(rng.choice(TOPIC_WORDS) for _ in range(words)) + ".\n"
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def tree_state(top):
+    """{path: (size, mtime_ns)} of every file outside the store."""
+    state = {}
+    for root, dirs, files in os.walk(top):
+        dirs[:] = [d for d in dirs if d != STORE_DIR]
+        for name in files:
+            st = os.stat(os.path.join(root, name))
+            state[os.path.join(root, name)] = (st.st_size, st.st_mtime_ns)
+    return state
+
+def run(top):
+    """One organize_text_corpus pass over top; returns the index counters."""
+    organize_text_corpus.SOURCE_DIR = top
+    index = CorpusIndex(os.path.join(top, STORE_DIR))
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            organize_text_corpus.organize(index)
+        return index.hashed_files, index.hashed_heads
+    finally:
+        index.close()
+
+def check_store(top):
+    """Every organized file has an identical object and a content row."""
+    index = CorpusIndex(os.path.join(top, STORE_DIR))
+    try:
+        rows = index.conn.execute("SELECT path, digest, organized FROM files").fetchall()
+        for path, digest, organized in rows:
+            if not organized or digest != file_digest(path):
+                return f"{path}: not organized, or stale digest"
+            with open(path, 'rb') as a, open(index.object_path(digest), 'rb') as b:
+                if a.read() != b.read():
+                    return f"{path}: stored object differs"
+            content = index.content(digest)
+            if content is None or not content["language"]:
+                return f"{path}: no content metadata"
+        if len(rows) != len(tree_state(top)):
+            return f"index has {len(rows)} files, tree has {len(tree_state(top))}"
+    finally:
+        index.close()
+    return None
+
+def main():
+    rng = random.Random(0)
+    print(f"Verifying the incremental corpus store on {UNIQUE_FILES + SAME_SIZE_FILES} texts...")
+    failures = []
+    with tempfile.TemporaryDirectory() as top:
+        texts = [random_text(rng, rng.randrange(20, 400)) for _ in range(UNIQUE_FILES)]
+        for i, text in enumerate(texts):
+            write(os.path.join(top, "inbox", f"text_{i}.txt"), text)
+        # Duplicates in another folder
+        for i in range(0, UNIQUE_FILES, 5):
+            write(os.path.join(top, "copies", f"copy_{i}.txt"), texts[i])
+        # Same size and same head: only a full hash tells them apart
+        filler = "stone " * (HEAD_BYTES // 6 + 10)
+        for i in range(SAME_SIZE_FILES):
+            write(os.path.join(top, "large", f"large_{i}.txt"), filler + f"end {i}.\n")
+
+        hashed, _ = run(top)
+        problem = check_store(top)
+        if problem:
+            failures.append(f"first run: {problem}")
+        digests = [file_digest(p) for p in tree_state(top)]
+        if len(set(digests)) != len(digests):
+            failures.append("first run: a duplicate survived")
+        if len(digests) != UNIQUE_FILES + SAME_SIZE_FILES:
+            failures.append(f"first run: {len(digests)} files organized")
+
+        # Nothing changed: nothing is hashed, moved or rewritten
+        before = tree_state(top)
+        hashed, heads = run(top)
+        if hashed or heads or tree_state(top) != before:
+            failures.append(f"second run: {hashed} files and {heads} heads hashed, tree changed: {tree_state(top) != before}")
+
+        # A copy of an organized text, and one new text
+        write(os.path.join(top, "inbox", "late_copy.txt"), texts[1])
+        write(os.path.join(top, "inbox", "late_new.txt"), random_text(rng))
+        hashed, heads = run(top)
+        names = {os.path.basename(p) for p in tree_state(top)}
+        if "late_copy.txt" in names or "late_new.txt" not in names:
+            failures.append("third run: the copy was kept or the new text lost")
+        if hashed > 2:
+            failures.append(f"third run: {hashed} files hashed for 2 new files")
+        problem = check_store(top)
+        if problem:
+            failures.append(f"third run: {problem}")
+
+    if failures:
+        print("MISMATCHES:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("Duplicates removed, store consistent, and unchanged files never rehashed.")
+
+if __name__ == "__main__":
+    main()
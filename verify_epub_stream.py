@@ -0,0 +1,181 @@
+import io
+import os
+import re
+import sys
+import html
+import time
+import random
+import zipfile
+import tempfile
+import contextlib
+import tracemalloc
+
+from lxml import etree
+
+# Ensure we can import the engine
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import lta_epub
+import extract_epub_text
+import extract_epub_text_cli
+from lta_epub import write_epub_text, extract_epub_file
+
+# --- CONFIGURATION ---
+SAMPLES = 40 # Random books
+CHUNK_SIZES = [1, 7, 4096] # Compressed bytes per parser feed
+MAX_RUNS = [3, 1 << 20] # Flat-text run limits; 3 forces flushes inside runs
+LARGE_MB = 16 # Uncompressed size of the single-chapter memory test
+PEAK_LIMIT_MB = 8 # Python heap allowed while streaming it
+
+WORDS = ["In", "the", "beginning", "was", "Fohat", "café", "ΣΟΦΙΑ", "&amp;", "&eacute;",
+         "<b>", "</b>", "<i>x</i>", "<br/>", "\n", "  ", "\t"]
+BLOCKS = ["p", "h1", "h2", "h3", "div", "li"]
+
+def random_document(rng):
+    parts = ['<?xml version="1.0" encoding="utf-8"?><html xmlns="http://www.w3.org/1999/xhtml"><body>']
+    for _ in range(rng.randrange(0, 12)):
+        tag = rng.choice(BLOCKS)
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randrange(0, 30)))
+        parts.append(f"<{tag}>{words}</{tag}>\n")
+    parts.append("</body></html>")
+    return "".join(parts)
+
+def random_book(rng, path):
+    """Writes a book with an OPF spine that is not in name order; returns its documents in spine order."""
+    names = [f"Text/part{i:02d}.xhtml" for i in range(rng.randrange(1, 7))]
+    spine = names[:]
+    rng.shuffle(spine)
+    documents = {name: random_document(rng) for name in names}
+    manifest = "".join(f'<item id="i{i}" href="{name}" media-type="application/xhtml+xml"/>'
+                       for i, name in enumerate(names))
+    itemrefs = "".join(f'<itemref idref="i{names.index(name)}"/>' for name in spine)
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr("mimetype", "application/epub+zip")
+        z.writestr("META-INF/container.xml",
+                   '<container xmlns="urn:oasis:names:tc:opendocument:xmlns:container"><rootfiles>'
+                   '<rootfile full-path="OEBPS/content.opf"/></rootfiles></container>')
+        z.writestr("OEBPS/content.opf",
+                   f'<package xmlns="http://www.idpf.org/2007/opf"><manifest>{manifest}</manifest>'
+                   f'<spine>{itemrefs}</spine></package>')
+        for name, doc in documents.items():
+            z.writestr(f"OEBPS/{name}", doc)
+        z.writestr("OEBPS/Text/not_in_spine.xhtml", "<p>Never read</p>")
+    return [documents[name] for name in spine]
+
+def reference_flat(documents):
+    """The regex stripper, with entities decoded as a parser does."""
+    lines = []
+    for doc in documents:
+        text = re.sub(r'\s+', ' ', re.sub(r'<[^>]+>', ' ', doc)).strip()
+        if text: lines.append(html.unescape(text))
+    return "\n".join(lines)
+
+def reference_paragraphs(documents):
+    """The tree-based extractor, with paragraphs and headers in document order."""
+    paragraphs = []
+    for doc in documents:
+        tree = etree.fromstring(doc.encode("utf-8"), etree.HTMLParser())
+        for el in tree.iter("p", "h1", "h2", "h3"):
+            text = "".join(el.itertext()).strip()
+            if text: paragraphs.append(text)
+    return "\n\n".join(paragraphs)
+
+def check_book(path, documents):
+    want = {False: reference_flat(documents), True: reference_paragraphs(documents)}
+    for chunk_size in CHUNK_SIZES:
+        for max_run in MAX_RUNS:
+            lta_epub.MAX_RUN = max_run
+            for paragraphs in (False, True):
+                out = io.StringIO()
+                write_epub_text(path, out, paragraphs, chunk_size)
+                if out.getvalue() != want[paragraphs]:
+                    mode = "paragraphs" if paragraphs else "flat"
+                    return f"{mode}, chunk {chunk_size}, run {max_run}: text differs"
+    return None
+
+def check_scripts(folder):
+    """
+    extract_epub_text.py and extract_epub_text_cli.py on a fixed book whose
+    spine is not in name order and whose header sits between paragraphs.
+    The extractors before lta_epub read sorted names and wrote a document's
+    <p> text before its headers (the CLI skipped headers): "Later chapter",
+    "First paragraph", "Second paragraph", "Chapter Two".
+    """
+    path = os.path.join(folder, "ordered.epub")
+    documents = {
+        "b_chapter.xhtml": "<html><body><p>First paragraph</p><h2>Chapter Two</h2><p>Second paragraph</p></body></html>",
+        "a_chapter.xhtml": "<html><body><p>Later chapter</p></body></html>",
+    }
+    with zipfile.ZipFile(path, 'w') as z:
+        z.writestr("META-INF/container.xml",
+                   '<container xmlns="urn:oasis:names:tc:opendocument:xmlns:container"><rootfiles>'
+                   '<rootfile full-path="content.opf"/></rootfiles></container>')
+        z.writestr("content.opf",
+                   '<package xmlns="http://www.idpf.org/2007/opf"><manifest>'
+                   '<item id="a" href="a_chapter.xhtml"/><item id="b" href="b_chapter.xhtml"/>'
+                   '</manifest><spine><itemref idref="b"/><itemref idref="a"/></spine></package>')
+        for name, doc in documents.items():
+            z.writestr(name, doc)
+    want = "First paragraph\n\nChapter Two\n\nSecond paragraph\n\nLater chapter"
+
+    problems = []
+    output_path = os.path.join(folder, "ordered.txt") # The CLI's output name too
+    for script in ("extract_epub_text", "extract_epub_text_cli"):
+        if script == "extract_epub_text":
+            extract_epub_text.extract_epub_text(path, output_path)
+        else:
+            with contextlib.redirect_stdout(io.StringIO()):
+                extract_epub_text_cli.extract_epub_text(path)
+        with open(output_path, encoding='utf-8') as f:
+            got = f.read()
+        if got != want:
+            problems.append(f"{script}: {got!r} != {want!r}")
+    return problems
+
+def check_memory(folder):
+    """Streams one LARGE_MB chapter; returns (seconds, peak Python heap in MB)."""
+    path = os.path.join(folder, "large.epub")
+    paragraph = "<p>" + " ".join(["In the beginning was Fohat"] * 40) + "</p>\n"
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+        with z.open("OEBPS/chapter.xhtml", 'w') as f:
+            f.write(b"<html><body>")
+            block = (paragraph * 1000).encode("utf-8")
+            for _ in range(LARGE_MB * (1 << 20) // len(block)):
+                f.write(block)
+            f.write(b"</body></html>")
+    start = time.time()
+    extract_epub_file(path, os.path.join(folder, "large.txt"))
+    elapsed = time.time() - start
+    # Traced separately: tracemalloc slows every allocation down
+    tracemalloc.start()
+    extract_epub_file(path, os.path.join(folder, "large.txt"))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1 << 20)
+
+def main():
+    print(f"Verifying streamed EPUB text on {SAMPLES} random books...")
+    failures = []
+    with tempfile.TemporaryDirectory() as folder:
+        for i in range(SAMPLES):
+            path = os.path.join(folder, f"book_{i}.epub")
+            problem = check_book(path, random_book(random.Random(i), path))
+            if problem is not None:
+                failures.append(f"book {i}: {problem}")
+        lta_epub.MAX_RUN = MAX_RUNS[-1]
+        failures.extend(check_scripts(folder))
+
+        elapsed, peak = check_memory(folder)
+        print(f"{LARGE_MB} MB chapter streamed in {elapsed:.2f}s, peak Python heap {peak:.1f} MB")
+        if peak > PEAK_LIMIT_MB:
+            failures.append(f"large chapter: peak heap {peak:.1f} MB > {PEAK_LIMIT_MB} MB")
+
+    if failures:
+        print("MISMATCHES:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("Streamed text matches the whole-document extractors, in spine order, with headers in place.")
+
+if __name__ == "__main__":
+    main()
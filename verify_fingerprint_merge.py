@@ -0,0 +1,105 @@
+import os
+import re
+import sys
+import math
+import random
+import tempfile
+import statistics
+from collections import Counter
+
+# Ensure we can import the engine
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lta_fingerprint import FingerprintState, fingerprint_file, fingerprint_range
+from lta_weights import ALPHA_WEIGHTS
+
+# --- CONFIGURATION ---
+SAMPLES = 30 # Random documents
+BLOCK_SIZES = [1, 7, 64, 4096] # Bytes per block; 1 forces a block per sentence
+WORKERS = 3
+TOLERANCE = 1e-9
+
+PIECES = ["In", "the", "beginning", "was", "Fohat", "and", "Dzyan", "spoke",
+          "l'air", "[note]", "1888", "café", "ΣΟΦΙΑ", "x_y",
+          ".", "!", "?", "...", "?!", ",", ";", " ", "\n", "\n\n", "\t"]
+
+def plain_fingerprint(text):
+    """The metrics as author_fingerprint_analyzer first computed them, in separate passes."""
+    words = re.findall(r'\b[a-zA-Z]+\b', text)
+    weights = [sum(ALPHA_WEIGHTS.get(c, 0) for c in w.lower()) for w in words]
+    n = len(weights)
+    mean = sum(weights) / n if n else 0.0
+    std_dev = math.sqrt(sum((x - mean) ** 2 for x in weights) / n) if n else 0.0
+    sent_lengths = [len(s.split()) for s in re.split(r'[.!?]+', text) if len(s.split()) > 3]
+    avg_sent = sum(sent_lengths) / len(sent_lengths) if sent_lengths else 0
+    friction = math.sqrt(sum((x - avg_sent) ** 2 for x in sent_lengths) / len(sent_lengths)) if sent_lengths else 0
+    counts = Counter(words).most_common(100)
+    return {
+        "Words": n,
+        "Mean Word Weight": mean,
+        "Style Volatility (SD)": std_dev,
+        "Median Word Weight": statistics.median(weights) if weights else 0.0,
+        "Syntactic Friction": friction,
+        "Avg Sentence Length": avg_sent,
+        "Vocabulary Density": sum(1 / i for i in range(1, len(counts) + 1)) / len(counts) if counts else 0,
+    }
+
+def differs(got, want):
+    for key, value in want.items():
+        if abs(got[key] - value) > TOLERANCE:
+            return f"{key} {got[key]} != {value}"
+    return None
+
+def check_text(text):
+    """Returns a description of the first disagreement, or None."""
+    state = FingerprintState()
+    state.add_text(text)
+    whole = state.fingerprint()
+    problem = differs(whole, plain_fingerprint(text))
+    if problem:
+        return f"one pass: {problem}"
+
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".txt", delete=False) as f:
+        f.write(text)
+    try:
+        for block_size in BLOCK_SIZES:
+            split = fingerprint_file(f.name, workers=1, block_size=block_size)
+            if split.fingerprint() != whole or split.vocabulary != state.vocabulary:
+                return f"block {block_size}: {differs(split.fingerprint(), whole)}"
+        # Merge the byte ranges a worker pool would get, in-process
+        merged = FingerprintState()
+        size = os.path.getsize(f.name)
+        for i in range(WORKERS):
+            merged.merge(fingerprint_range((f.name, size * i // WORKERS, size * (i + 1) // WORKERS), 16))
+        if merged.fingerprint() != whole or merged.vocabulary != state.vocabulary:
+            return f"merged ranges: {differs(merged.fingerprint(), whole)}"
+    finally:
+        os.unlink(f.name)
+    return None
+
+def random_document(rng):
+    words = [rng.choice(PIECES) for _ in range(rng.randrange(0, 400))]
+    return "".join(w + rng.choice(["", " ", " ", "\n"]) for w in words)
+
+def main():
+    documents = [(f"random #{i}", random_document(random.Random(i))) for i in range(SAMPLES)]
+    for path in sys.argv[1:]:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            documents.append((path, f.read()))
+    print(f"Verifying one-pass and merged fingerprints on {len(documents)} documents...")
+
+    failures = []
+    for name, text in documents:
+        problem = check_text(text)
+        if problem is not None:
+            failures.append(f"{name}: {problem}")
+
+    if failures:
+        print("MISMATCHES:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("All merged fingerprints match the whole-text fingerprint.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import os
+import sys
+import random
+import tempfile
+
+# Ensure we can import the engine
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lta_tokenizer import G2PTokenizer
+
+# --- CONFIGURATION ---
+SAMPLES = 200 # Random lines
+CHUNK_SIZES = [1, 3, 64] # Words per backend call
+SYMBOLS = ["<sil>", "[noise]"]
+
+PIECES = ["in", "the", "beginning", "was", "Fohat", "and", "Dzyan", "spoke",
+          "café", "ΣΟΦΙΑ", "l'air", "<sil>", "[noise]", "", " ", "  "]
+
+class StubBackend:
+    """Offline G2P: a word's phonemes are its letters. Records every word it is asked for."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, words):
+        self.calls.append(list(words))
+        return [" ".join(word.upper()) for word in words]
+
+    def words(self):
+        return [word for call in self.calls for word in call]
+
+def expected_words(line):
+    for symbol in SYMBOLS:
+        line = line.replace(symbol, "")
+    return line.split()
+
+def expected_tokens(line):
+    """What the stub yields for a line phonemized word by word, without any cache."""
+    return [p for word in expected_words(line) for p in " ".join(word.upper()).split()]
+
+def random_line(rng):
+    return " ".join(rng.choice(PIECES) for _ in range(rng.randrange(0, 12)))
+
+def check(lines, chunk_size, cache_path):
+    """Returns a description of the first problem, or None."""
+    want = [expected_tokens(line) for line in lines]
+    vocabulary = {word for line in lines for word in expected_words(line)}
+
+    stub = StubBackend()
+    tokenizer = G2PTokenizer("stub", SYMBOLS, remove_non_linguistic_symbols=True,
+                             g2p_backend=stub, g2p_cache=cache_path, g2p_chunk_size=chunk_size)
+    # A generator, so the batched mode never sees a list
+    got = tokenizer.batch_text2tokens(line for line in lines)
+    if got != want:
+        return "batched tokens differ from word-by-word phonemization"
+    asked = stub.words()
+    if len(asked) != len(set(asked)):
+        return "a word was sent to the backend twice"
+    if set(asked) != vocabulary:
+        return f"backend saw {len(set(asked))} words, vocabulary has {len(vocabulary)}"
+    if any(len(call) > chunk_size for call in stub.calls):
+        return f"a backend call exceeded {chunk_size} words"
+    if [tokenizer.text2tokens(line) for line in lines] != want or len(stub.words()) != len(asked):
+        return "text2tokens phonemized an already known word"
+
+    # A new run on the same cache file must not call the backend at all
+    tokenizer.phoneme_cache.close()
+    rerun = StubBackend()
+    tokenizer = G2PTokenizer("stub", SYMBOLS, remove_non_linguistic_symbols=True,
+                             g2p_backend=rerun, g2p_cache=cache_path, g2p_chunk_size=chunk_size)
+    if tokenizer.batch_text2tokens(lines) != want:
+        return "tokens read back from the cache differ"
+    if rerun.calls:
+        return f"second run sent {len(rerun.words())} cached words to the backend"
+    tokenizer.phoneme_cache.close()
+    return None
+
+def main():
+    rng = random.Random(0)
+    lines = [random_line(rng) for _ in range(SAMPLES)]
+    print(f"Verifying batched, cached G2P on {len(lines)} lines...")
+
+    failures = []
+    for chunk_size in CHUNK_SIZES:
+        with tempfile.TemporaryDirectory() as tmp:
+            problem = check(lines, chunk_size, os.path.join(tmp, "g2p_cache.sqlite"))
+        if problem is not None:
+            failures.append(f"chunk {chunk_size}: {problem}")
+
+    if failures:
+        print("MISMATCHES:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("Every word was phonemized once, and the cache served the second run.")
+
+if __name__ == "__main__":
+    main()
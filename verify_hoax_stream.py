@@ -0,0 +1,79 @@
+import io
+import math
+import os
+import re
+import sys
+import random
+
+# Ensure we can import the scanner
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from hoax_scanner import BIT_MAP, scan_stream
+
+# --- CONFIGURATION ---
+CHUNK_SIZES = [1, 2, 3, 7, 64, 4096] # Buffer sizes that cut words, breaks and sentences
+SAMPLES = 40 # Random documents
+TOLERANCE = 1e-6 # Records are rounded to 6 places
+
+PIECES = ["In", "the", "beginning", "was", "Fohat", "and", "Dzyan", "spoke",
+          "l'air", "d'une", "[note]", "1888", "café", "ΣΟΦΙΑ", "İstanbul",
+          ".", "!", "?", "...", ",", ";", " ", "  ", "\n", "\n\n", "\t"]
+
+def plain_cv(segment):
+    """CV of a segment with per-character dict lookups, as the scanner first computed it."""
+    words = re.findall(r'[a-z]+', segment.lower())
+    if len(words) < 3: return None
+    weights = [sum(BIT_MAP.get(c, 8) for c in w) for w in words]
+    mean = sum(weights) / len(weights)
+    variance = sum((x - mean) ** 2 for x in weights) / len(weights)
+    return math.sqrt(variance) / mean if mean > 0 else 0
+
+def whole_file_records(text):
+    """The scanner before streaming: read everything, split with the lookbehind regex."""
+    records = []
+    for seg in re.split(r'(?<=[.!?])\s+', text):
+        seg = seg.strip()
+        if not seg: continue
+        cv = plain_cv(seg)
+        if cv is None: continue
+        records.append((seg[:50].replace(chr(10), ' '), cv))
+    return records
+
+def random_document(rng):
+    words = [rng.choice(PIECES) for _ in range(rng.randrange(0, 400))]
+    return "".join(w + rng.choice(["", " ", " ", "\n"]) for w in words)
+
+def check_text(text):
+    """Returns a description of the first disagreement with the whole-file scan, or None."""
+    expected = whole_file_records(text)
+    for chunk_size in CHUNK_SIZES:
+        got = [(r["preview"], r["cv"]) for r in scan_stream(io.StringIO(text), chunk_size)]
+        if len(got) != len(expected):
+            return f"chunk {chunk_size}: {len(got)} segments, expected {len(expected)}"
+        for i, ((preview, cv), (want_preview, want_cv)) in enumerate(zip(got, expected)):
+            if preview != want_preview or abs(cv - want_cv) > TOLERANCE:
+                return f"chunk {chunk_size}, segment {i}: {preview!r} {cv} != {want_preview!r} {want_cv}"
+    return None
+
+def main():
+    documents = [(f"random #{i}", random_document(random.Random(i))) for i in range(SAMPLES)]
+    for path in sys.argv[1:]:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            documents.append((path, f.read()))
+    print(f"Verifying streamed hoax scan against the whole-file scan on {len(documents)} documents...")
+
+    failures = []
+    for name, text in documents:
+        problem = check_text(text)
+        if problem is not None:
+            failures.append(f"{name}: {problem}")
+
+    if failures:
+        print("MISMATCHES:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("All streamed segments match the whole-file scan.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import os
+import sys
+import glob
+import random
+
+# Ensure we can import the app
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lta_rulepack import load_catalogue
+from lta_engine import JumpTable
+
+# --- CONFIGURATION ---
+LANG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "languages")
+VALUE_LIMIT = 20000 # Past 999 (end of names) and through the thousands
+QUERIES = 300 # Random walk / first-crossing queries per language
+
+def naive_walk(processor, node, steps, value_limit):
+    for _ in range(steps):
+        length = processor.get_length(node)
+        if length == 0 or node + length >= value_limit:
+            return None
+        node += length
+    return node
+
+def naive_first_reaching(processor, node, target, value_limit):
+    steps = 0
+    while node < target:
+        if node >= value_limit:
+            return None
+        length = processor.get_length(node)
+        if length == 0:
+            return None
+        node += length
+        steps += 1
+    return steps, node
+
+def check_language(processor, value_limit=VALUE_LIMIT, queries=QUERIES):
+    """Returns a description of the first disagreement with a plain step loop, or None."""
+    jumps = JumpTable.from_processor(processor, value_limit)
+    # Round trip through the cached form
+    jumps = JumpTable.from_arrays(**jumps.to_arrays())
+    rng = random.Random(processor.name)
+    for _ in range(queries):
+        node = rng.randrange(value_limit)
+        steps = rng.randrange(2 * value_limit // 3)
+        if jumps.walk(node, steps) != naive_walk(processor, node, steps, value_limit):
+            return f"walk({node}, {steps})"
+        target = rng.randrange(2 * value_limit)
+        if jumps.first_reaching(node, target) != naive_first_reaching(processor, node, target, value_limit):
+            return f"first_reaching({node}, {target})"
+    return None
+
+def main():
+    lang_files = sorted(glob.glob(os.path.join(LANG_DIR, "*.lang")))
+    print(f"Verifying jump tables for {len(lang_files)} languages (0-{VALUE_LIMIT - 1})...")
+
+    failures = []
+    checked = 0
+    catalogue = load_catalogue(lang_files)
+    for lang_file in lang_files:
+        lang_data = catalogue[lang_file]
+        if isinstance(lang_data, Exception):
+            continue # Skipped languages are reported by verify_length_tables
+        problem = check_language(lang_data["processor"])
+        checked += 1
+        if problem is not None:
+            failures.append(f"{os.path.basename(lang_file)}: {problem}")
+
+    print(f"Checked {checked} languages.")
+    if failures:
+        print("MISMATCHES:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("All jump-table queries match the step-by-step walk.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import os
+import sys
+import glob
+import random
+
+# Ensure we can import the app
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lta_rulepack import load_catalogue
+from language_math import PROCESSOR_REGISTRY, WesternProcessor, get_processor, clean_len
+
+# --- CONFIGURATION ---
+LANG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "languages")
+MAX_N = 4000 # Past 999 (end of names) and into the third base-60 place
+LARGE_SAMPLES = 2000 # Random n up to the last scale word, for get_length vs get_name
+
+def check_processor(processor, max_n=MAX_N):
+    """Returns the first n where length_table disagrees with get_length, or None."""
+    table = processor.length_table(max_n)
+    if len(table) != max_n:
+        return -1
+    for n in range(max_n):
+        if int(table[n]) != processor.get_length(n):
+            return n
+    return None
+
+def check_large(processor, samples=LARGE_SAMPLES):
+    """Returns the first sampled n where the arithmetic length disagrees with the name, or None."""
+    rng = random.Random(processor.name)
+    for _ in range(samples):
+        n = rng.randrange(processor.max_value)
+        if processor.get_length(n) != clean_len(processor.get_name(n)):
+            return n
+    return None
+
+def check_lengths_of(processor, samples=LARGE_SAMPLES):
+    """Returns the first sampled n where lengths_of disagrees with get_length, or None."""
+    rng = random.Random(processor.name)
+    values = [rng.randrange(10 ** rng.randint(3, 12)) for _ in range(samples)]
+    for n, length in zip(values, processor.lengths_of(values).tolist()):
+        if length != processor.get_length(n):
+            return n
+    return None
+
+def main():
+    lang_files = sorted(glob.glob(os.path.join(LANG_DIR, "*.lang")))
+    print(f"Verifying length tables for {len(lang_files)} languages (0-{MAX_N - 1})...")
+
+    failures = []
+    checked = 0
+    catalogue = load_catalogue(lang_files)
+    for lang_file in lang_files:
+        lang_data = catalogue[lang_file]
+        if isinstance(lang_data, Exception):
+            # Languages that fail script validation have no processor to check
+            print(f"  Skipping {os.path.basename(lang_file)}: {lang_data}")
+            continue
+
+        # The declared processor, plus every other math type over the same rules
+        for math_type in PROCESSOR_REGISTRY:
+            processor = get_processor(math_type, lang_data["name"], lang_data["rules"])
+            bad_n = check_processor(processor)
+            if bad_n is None and isinstance(processor, WesternProcessor):
+                bad_n = check_large(processor)
+            if bad_n is None:
+                bad_n = check_lengths_of(processor)
+            checked += 1
+            if bad_n is not None:
+                failures.append(f"{os.path.basename(lang_file)} [{math_type}] first mismatch at n={bad_n}")
+
+    print(f"Checked {checked} processor/language pairs.")
+    if failures:
+        print("MISMATCHES:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("All length tables match get_length bit-for-bit.")
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,9 @@
-def num_to_english(n):
-    ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten", 
-            "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
-    tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
-    
-    if n == 0: return "zero"
-    
-    parts = []
-    if n >= 1000:
-        k = n // 1000
-        n %= 1000
-        parts.append(num_to_english(k) + "thousand")
-    if n >= 100:
-        h = n // 100
-        n %= 100
-        parts.append(ones[h] + "hundred")
-    if n >= 20:
-        t = n // 10
-        n %= 10
-        parts.append(tens[t])
-    if n > 0:
-        parts.append(ones[n])
-        
-    return "".join(parts)
+from lta_oracle import english_oracle
+
+oracle = english_oracle()
 
 def get_next(n):
-    return n + len(num_to_english(n))
+    return oracle.next(n)
 
 # Generate Main Trunk (from 0)
 main_trunk = set()
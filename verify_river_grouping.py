@@ -0,0 +1,75 @@
+import os
+import sys
+import glob
+
+# Ensure we can import the engine
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lta_rulepack import load_catalogue
+from lta_engine import ConvergenceGraph, SimulationConfig, group_rivers
+
+# --- CONFIGURATION ---
+LANG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "languages")
+DEFAULT_CONFIG = SimulationConfig() # Seeds 0-100, values below 10000, 500 steps, 20-node tails
+# A step-capped run where transitive grouping is known to join rivers that
+# first-tail matching keeps apart; reported, not failed
+CAPPED_CONFIG = SimulationConfig(seed_stop=1000, value_limit=10**6, max_steps=2000)
+
+def first_tail_rivers(graph, seeds, min_path):
+    """The original grouping: each seed joins the first river whose first tail shares a node with its own."""
+    river_tails = []
+    groups = []
+    for seed in seeds:
+        if graph.path_length(seed) < min_path:
+            continue
+        tail = set(graph.tail(seed))
+        for river_tail, members in zip(river_tails, groups):
+            if tail & river_tail:
+                members.append(seed)
+                break
+        else:
+            river_tails.append(tail)
+            groups.append([seed])
+    return groups
+
+def compare(processor, config):
+    """Returns (union-find rivers, first-tail rivers) as lists of member lists."""
+    graph = ConvergenceGraph.from_config(processor, config)
+    rivers = [members for _, members in group_rivers(graph, config.seeds, config.min_path)]
+    return rivers, first_tail_rivers(graph, config.seeds, config.min_path)
+
+def main():
+    lang_files = sorted(glob.glob(os.path.join(LANG_DIR, "*.lang")))
+    print(f"Verifying river grouping for {len(lang_files)} languages at {DEFAULT_CONFIG}...")
+
+    failures = []
+    capped = []
+    checked = 0
+    catalogue = load_catalogue(lang_files)
+    for lang_file in lang_files:
+        lang_data = catalogue[lang_file]
+        if isinstance(lang_data, Exception):
+            continue # Skipped languages are reported by verify_length_tables
+        name = os.path.basename(lang_file)
+        rivers, reference = compare(lang_data["processor"], DEFAULT_CONFIG)
+        if rivers != reference:
+            failures.append(f"{name}: {len(rivers)} rivers, first-tail matching gives {len(reference)}")
+        rivers, reference = compare(lang_data["processor"], CAPPED_CONFIG)
+        if rivers != reference:
+            capped.append(f"{name}: {len(rivers)} rivers, first-tail matching gives {len(reference)}")
+        checked += 1
+
+    print(f"Checked {checked} languages.")
+    if capped:
+        print(f"At {CAPPED_CONFIG}, transitive grouping differs for {len(capped)} languages (expected):")
+        for line in capped:
+            print(f"  {line}")
+    if failures:
+        print("MISMATCHES:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("At the default limits, union-find rivers match first-tail matching exactly.")
+
+if __name__ == "__main__":
+    main()
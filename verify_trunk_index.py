@@ -0,0 +1,121 @@
+import os
+import sys
+import glob
+import random
+
+# Ensure we can import the app
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lta_rulepack import load_catalogue
+from lta_engine import TrunkIndex
+
+# --- CONFIGURATION ---
+LANG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "languages")
+TRUNK_STEPS = 3000 # Nodes of each language's trunk from seed 0
+BLOCK_SIZES = [1, 7, 256] # 1 seals every node; 7 and 256 leave a pending block
+RANDOM_QUERIES = 2000
+
+def language_trunk(processor, steps=TRUNK_STEPS):
+    """The path of seed 0 (1 if 0 has no length), as a list."""
+    curr = 0 if processor.get_length(0) else 1
+    trunk = []
+    while len(trunk) < steps:
+        trunk.append(curr)
+        length = processor.get_length(curr)
+        if length == 0:
+            break
+        curr += length
+    return trunk
+
+def wide_trunk(rng):
+    """A synthetic trunk whose deltas need uint8, uint16, uint32 and int64 blocks."""
+    trunk = [rng.randrange(1000)]
+    for width in (1 << 7, 1 << 15, 1 << 31, 1 << 40):
+        for _ in range(300):
+            trunk.append(trunk[-1] + rng.randrange(1, width))
+    return trunk
+
+def queries(index, trunk, rng):
+    """Every node and its neighbours, every block edge, values outside the trunk, and random values."""
+    values = set()
+    for node in trunk:
+        values.update((node - 1, node, node + 1))
+    for start, block in zip(index.starts, index.blocks):
+        end = start + int(block.sum())
+        values.update((start - 1, start, start + 1, end - 1, end, end + 1))
+    values.update((-1, trunk[0] - 2, trunk[-1] + 2, trunk[-1] * 2 + 3))
+    values.update(rng.randrange(-1, trunk[-1] + 2) for _ in range(RANDOM_QUERIES))
+    ordered = sorted(values)
+    shuffled = ordered[:]
+    rng.shuffle(shuffled)
+    return ordered + shuffled # Increasing (decoded-block reuse) and random order
+
+def check_membership(index, members, rng):
+    expected = set(members)
+    if len(index) != len(expected):
+        return f"len {len(index)} != {len(expected)}"
+    for value in queries(index, members, rng):
+        if (value in index) != (value in expected):
+            return f"{value} in index is {value in index}, in set {value in expected}"
+    return None
+
+def check_trunk(trunk, block_size, rng):
+    """Returns a description of the first disagreement with a plain set, or None."""
+    index = TrunkIndex(block_size)
+    # Mid-build: sealed blocks plus a partly filled one
+    middle = len(trunk) // 2 + block_size // 2
+    for node in trunk[:middle]:
+        index.add(node)
+    problem = check_membership(index, trunk[:middle], rng)
+    if problem is not None:
+        return f"after {middle} nodes: {problem}"
+
+    for node in trunk[middle:]:
+        index.add(node)
+    index.add(trunk[-1]) # Re-adding the end is allowed
+    problem = check_membership(index, trunk, rng)
+    if problem is not None:
+        return f"full trunk: {problem}"
+
+    if len(trunk) > 1:
+        try:
+            index.add(trunk[-2])
+            return "a decreasing node was accepted"
+        except ValueError:
+            pass
+    return None
+
+def main():
+    lang_files = sorted(glob.glob(os.path.join(LANG_DIR, "*.lang")))
+    print(f"Verifying trunk indexes for {len(lang_files)} languages ({TRUNK_STEPS} trunk nodes, blocks {BLOCK_SIZES})...")
+
+    failures = []
+    checked = 0
+    rng = random.Random(0)
+    for block_size in BLOCK_SIZES:
+        problem = check_trunk(wide_trunk(rng), block_size, rng)
+        if problem is not None:
+            failures.append(f"wide deltas, block {block_size}: {problem}")
+
+    catalogue = load_catalogue(lang_files)
+    for lang_file in lang_files:
+        lang_data = catalogue[lang_file]
+        if isinstance(lang_data, Exception):
+            continue # Skipped languages are reported by verify_length_tables
+        trunk = language_trunk(lang_data["processor"])
+        for block_size in BLOCK_SIZES:
+            problem = check_trunk(trunk, block_size, random.Random(lang_file))
+            if problem is not None:
+                failures.append(f"{os.path.basename(lang_file)}, block {block_size}: {problem}")
+        checked += 1
+
+    print(f"Checked {checked} languages.")
+    if failures:
+        print("MISMATCHES:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("Trunk index membership matches a plain set, across every block boundary.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import os
+import re
+import sys
+import random
+
+# Ensure we can import the kernel
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lta_weights import WeightTable, ALPHA_WEIGHTS, LOWER_WORDS, ALPHA_WORDS, WORD_RUNS, ARABIC_WORDS
+from hoax_scanner import BIT_MAP
+from final_keyboard_analysis import get_arabic_weights
+
+# --- CONFIGURATION ---
+SAMPLES = 200 # Random documents
+ALPHABET = "abcxyzABCXYZ_09 \n\t.,;'!?-éßİΣσςḰابتةىً😀𝔸"
+
+# (name, regex the scripts used, kernel pattern, weight map, fold_case, lower-case the text first)
+CASES = [
+    ("hoax_scanner", r'[a-z]+', LOWER_WORDS, BIT_MAP, False, True),
+    ("author_fingerprint", r'\b[a-zA-Z]+\b', ALPHA_WORDS, ALPHA_WEIGHTS, True, False),
+    ("final_keyboard eng", r'[a-z]+', LOWER_WORDS, ALPHA_WEIGHTS, False, True),
+    ("final_keyboard ara", r'[\u0600-\u06FF]+', ARABIC_WORDS, get_arabic_weights(), False, True),
+    ("reverse_topology", r'\b\w+\b', WORD_RUNS, ALPHA_WEIGHTS, True, False),
+]
+
+def plain_weights(text, regex, weight_map, fold_case):
+    """Per-character dict lookups over regex words, as the scripts first computed them."""
+    weights = []
+    for word in re.findall(regex, text):
+        if fold_case:
+            word = "".join(c.lower() if "A" <= c <= "Z" else c for c in word)
+        weights.append(sum(weight_map.get(c, 0) for c in word))
+    return weights
+
+def check_text(text):
+    """Returns a description of the first disagreement with the plain computation, or None."""
+    for name, regex, pattern, weight_map, fold_case, lower in CASES:
+        source = text.lower() if lower else text
+        expected = plain_weights(source, regex, weight_map, fold_case)
+        got = WeightTable(weight_map, fold_case=fold_case).word_weights(source, pattern).tolist()
+        if got != expected:
+            return f"{name}: {got[:8]}... != {expected[:8]}..."
+    return None
+
+def main():
+    documents = []
+    for i in range(SAMPLES):
+        rng = random.Random(i)
+        documents.append((f"random #{i}", "".join(rng.choice(ALPHABET) for _ in range(rng.randrange(0, 300)))))
+    for path in sys.argv[1:]:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            documents.append((path, f.read()))
+    print(f"Verifying the word-weight kernel on {len(documents)} documents...")
+
+    failures = []
+    for name, text in documents:
+        problem = check_text(text)
+        if problem is not None:
+            failures.append(f"{name}: {problem}")
+
+    if failures:
+        print("MISMATCHES:")
+        for failure in failures[:20]:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("All kernel word weights match the per-character lookups.")
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,11 @@
 import sys
 
-# English Number to Words (Simplified for relevant range)
-def num_to_english(n):
-    ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten", 
-            "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
-    tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
-    
-    if n == 0: return "zero"
-    
-    parts = []
-    if n >= 1000:
-        k = n // 1000
-        n %= 1000
-        parts.append(num_to_english(k) + "thousand")
-    if n >= 100:
-        h = n // 100
-        n %= 100
-        parts.append(ones[h] + "hundred")
-    if n >= 20:
-        t = n // 10
-        n %= 10
-        parts.append(tens[t])
-    if n > 0:
-        parts.append(ones[n])
-        
-    return "".join(parts)
+from lta_oracle import english_oracle
+
+oracle = english_oracle()
 
 def get_len(n):
-    return len(num_to_english(n))
+    return oracle.length(n)
 
 def simulate_stepwise(max_steps=15):
     # Tracks the current position of every seed that has entered